@@ -0,0 +1,12 @@
+"""
+Algoritmo del Banquero sin interfaz gráfica.
+
+    from simuladores.banquero import ModeloBanquero
+
+Línea de comandos: `python -m simuladores.banquero --help`
+"""
+from .modelo import ALMACENAMIENTOS, MENSAJE_ESTADO_INSEGURO, MOTORES_SEGURIDAD, ModeloBanquero
+from .almacenamiento import MatrizCompacta
+from .motores import IndiceNecesidadOrdenada, MotorSeguridadNumpy
+from .archivos import cargar_estado, cargar_solicitudes, convertir_solicitudes
+from .secuencias import EnumeradorSecuencias
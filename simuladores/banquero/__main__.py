@@ -0,0 +1,180 @@
+"""
+Algoritmo del Banquero por línea de comandos (sin interfaz gráfica).
+
+Carga un archivo de estado, reproduce una lista de solicitudes y muestra la
+decisión y el tiempo de cada una, más un resumen final.
+
+Uso:
+    python -m simuladores.banquero data/banquero/estado_ejemplo.json \
+        --solicitudes data/banquero/solicitudes_ejemplo.json --motor numpy
+
+Con --lote todas las solicitudes se evalúan contra el estado INICIAL
+(sin aplicarlas), usando ModeloBanquero.evaluar_solicitudes.
+
+Con --secuencias N además se cuentan TODAS las secuencias seguras del estado
+inicial y se muestran las N primeras (ver secuencias.EnumeradorSecuencias).
+"""
+import argparse
+import json
+import sys
+import time
+
+from .archivos import cargar_estado, cargar_solicitudes, convertir_solicitudes
+from .modelo import ALMACENAMIENTOS, MOTORES_SEGURIDAD
+from .metricas import percentil
+from .secuencias import EnumeradorSecuencias
+
+
+def reproducir(modelo, solicitudes):
+    """Aplica las solicitudes una a una. Devuelve [(id_proceso, solicitud, exito, resultado, segundos)]."""
+    decisiones = []
+    for id_proceso, solicitud in solicitudes:
+        inicio = time.perf_counter()
+        exito, resultado = modelo.solicitar_recursos(id_proceso, solicitud)
+        decisiones.append((id_proceso, solicitud, exito, resultado, time.perf_counter() - inicio))
+    return decisiones
+
+
+def evaluar_lote(modelo, solicitudes):
+    """Evalúa todas las solicitudes contra el estado inicial; el tiempo se reparte entre ellas."""
+    inicio = time.perf_counter()
+    resultados = modelo.evaluar_solicitudes(solicitudes)
+    por_solicitud = (time.perf_counter() - inicio) / max(1, len(solicitudes))
+    return [
+        (id_proceso, solicitud, exito, resultado, por_solicitud)
+        for (id_proceso, solicitud), (exito, resultado) in zip(solicitudes, resultados)
+    ]
+
+
+def resumir(decisiones, segundos_totales):
+    tiempos_us = [d[4] * 1e6 for d in decisiones] or [0.0]
+    concedidas = sum(1 for d in decisiones if d[2])
+    return {
+        "solicitudes": len(decisiones),
+        "concedidas": concedidas,
+        "rechazadas": len(decisiones) - concedidas,
+        "tiempo_total_s": segundos_totales,
+        "media_us": sum(tiempos_us) / len(tiempos_us),
+        "p50_us": percentil(tiempos_us, 50),
+        "p99_us": percentil(tiempos_us, 99),
+        "solicitudes_por_s": len(decisiones) / segundos_totales if segundos_totales else 0.0,
+    }
+
+
+def enumerar_secuencias(modelo, limite):
+    """Cuenta las secuencias seguras del estado actual y lista hasta `limite`."""
+    enumerador = EnumeradorSecuencias(modelo)
+    return enumerador.contar(), list(enumerador.secuencias(limite))
+
+
+def imprimir_texto(modelo, decisiones, resumen, estado_inicial, secuencias=None):
+    nombres = modelo.nombres_procesos
+    es_seguro, secuencia = estado_inicial
+    if es_seguro:
+        print(f"Estado inicial SEGURO. Secuencia: {' → '.join(nombres[i] for i in secuencia)}")
+    else:
+        print("Estado inicial INSEGURO: no existe una secuencia segura.")
+
+    if secuencias is not None:
+        total, listadas = secuencias
+        print(f"Secuencias seguras del estado inicial: {total}")
+        for s in listadas:
+            print("   " + " → ".join(nombres[i] for i in s))
+        if total > len(listadas):
+            print(f"   ... ({total - len(listadas)} más)")
+
+    for k, (id_proceso, solicitud, exito, resultado, segundos) in enumerate(decisiones, start=1):
+        if exito:
+            detalle = "CONCEDIDA. Secuencia: " + " → ".join(nombres[i] for i in resultado)
+        else:
+            detalle = "RECHAZADA. " + resultado.split("\n")[0]
+        print(f"#{k} {nombres[id_proceso]} pide {solicitud} → {detalle} ({segundos * 1e6:.1f} us)")
+
+    print(
+        f"\nResumen: {resumen['solicitudes']} solicitudes, {resumen['concedidas']} concedidas, "
+        f"{resumen['rechazadas']} rechazadas en {resumen['tiempo_total_s'] * 1e3:.2f} ms "
+        f"(media {resumen['media_us']:.1f} us, p50 {resumen['p50_us']:.1f} us, "
+        f"p99 {resumen['p99_us']:.1f} us, {resumen['solicitudes_por_s']:.0f} solicitudes/s)"
+    )
+
+
+def imprimir_json(modelo, decisiones, resumen, estado_inicial, secuencias=None):
+    nombres = modelo.nombres_procesos
+    salida = {
+        "estado_inicial": {
+            "seguro": estado_inicial[0],
+            "secuencia": [nombres[i] for i in estado_inicial[1]],
+        },
+        "decisiones": [
+            {
+                "proceso": nombres[id_proceso],
+                "solicitud": solicitud,
+                "concedida": exito,
+                "secuencia": [nombres[i] for i in resultado] if exito else None,
+                "motivo": None if exito else resultado.split("\n")[0],
+                "tiempo_us": segundos * 1e6,
+            }
+            for id_proceso, solicitud, exito, resultado, segundos in decisiones
+        ],
+        "resumen": resumen,
+    }
+    if secuencias is not None:
+        total, listadas = secuencias
+        salida["estado_inicial"]["total_secuencias"] = total
+        salida["estado_inicial"]["secuencias"] = [[nombres[i] for i in s] for s in listadas]
+    json.dump(salida, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simuladores.banquero",
+        description="Algoritmo del Banquero sin interfaz: reproduce solicitudes sobre un estado."
+    )
+    parser.add_argument("estado", help="archivo JSON con asignacion, demanda_maxima y disponibles")
+    parser.add_argument("--solicitudes", help="archivo JSON con la lista de solicitudes "
+                                               "(por defecto, la clave 'solicitudes' del estado)")
+    parser.add_argument("--motor", choices=MOTORES_SEGURIDAD, default="python")
+    parser.add_argument("--transaccional", action="store_true",
+                        help="rollback con registro de deshacer en vez de copias")
+    parser.add_argument("--almacenamiento", choices=ALMACENAMIENTOS, default="listas",
+                        help="'compacto' guarda cada matriz en un único buffer array('i')")
+    parser.add_argument("--lote", action="store_true",
+                        help="evaluar todas las solicitudes contra el estado inicial, sin aplicarlas")
+    parser.add_argument("--secuencias", type=int, metavar="N",
+                        help="contar todas las secuencias seguras del estado inicial y listar las N primeras")
+    parser.add_argument("--formato", choices=("texto", "json"), default="texto")
+    args = parser.parse_args(argv)
+
+    try:
+        modelo, datos = cargar_estado(args.estado, motor=args.motor,
+                                      transaccional=args.transaccional,
+                                      almacenamiento=args.almacenamiento)
+        if args.solicitudes:
+            solicitudes = cargar_solicitudes(args.solicitudes, modelo)
+        else:
+            solicitudes = convertir_solicitudes(modelo, datos.get("solicitudes", []))
+    except ValueError as e:
+        parser.exit(2, f"Error: {e}\n")
+
+    estado_inicial = modelo.es_estado_seguro()
+    secuencias = None
+    if args.secuencias is not None:
+        secuencias = enumerar_secuencias(modelo, args.secuencias)
+
+    inicio = time.perf_counter()
+    if args.lote:
+        decisiones = evaluar_lote(modelo, solicitudes)
+    else:
+        decisiones = reproducir(modelo, solicitudes)
+    resumen = resumir(decisiones, time.perf_counter() - inicio)
+
+    if args.formato == "json":
+        imprimir_json(modelo, decisiones, resumen, estado_inicial, secuencias)
+    else:
+        imprimir_texto(modelo, decisiones, resumen, estado_inicial, secuencias)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Almacenamiento compacto para las matrices del banquero.
+
+Una MatrizCompacta guarda todas las celdas en un único `array('i')` contiguo
+(4 bytes por celda, frente a los ~8 bytes de puntero + objeto int + sobrecarga
+de lista por fila en una lista de listas). Cada fila se entrega como una vista
+(`memoryview`) sobre ese buffer, de modo que el código que hace
+`matriz[i][j]`, `matriz[i][j] += x` o `for fila in matriz` funciona igual
+que con listas de listas.
+
+Ojo: `matriz[i][:]` devuelve OTRA vista, no una copia. Para copiar una fila
+usar `list(matriz[i])`; para copiar la matriz entera, `copiar()` (una sola
+copia de buffer).
+"""
+from array import array
+
+import numpy as np
+
+TIPO_CELDA = "i"
+
+
+class MatrizCompacta:
+    """Matriz de enteros num_filas x num_columnas sobre un buffer contiguo."""
+    __slots__ = ("num_filas", "num_columnas", "datos", "_vista")
+
+    def __init__(self, num_filas, num_columnas, datos=None):
+        self.num_filas = num_filas
+        self.num_columnas = num_columnas
+        if datos is None:
+            datos = array(TIPO_CELDA, bytes(num_filas * num_columnas * array(TIPO_CELDA).itemsize))
+        if len(datos) != num_filas * num_columnas:
+            raise ValueError("El buffer no coincide con las dimensiones de la matriz.")
+        self.datos = datos
+        self._vista = memoryview(datos)
+
+    @classmethod
+    def desde_filas(cls, filas, num_columnas=None):
+        """Crea la matriz a partir de una lista de listas (u otra MatrizCompacta)."""
+        if isinstance(filas, MatrizCompacta):
+            return filas.copiar()
+        filas = list(filas)
+        if num_columnas is None:
+            num_columnas = len(filas[0]) if filas else 0
+        datos = array(TIPO_CELDA)
+        for fila in filas:
+            if len(fila) != num_columnas:
+                raise ValueError(f"Todas las filas deben tener {num_columnas} columnas.")
+            datos.extend(fila)
+        return cls(len(filas), num_columnas, datos)
+
+    def __len__(self):
+        return self.num_filas
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.num_filas
+        if not 0 <= i < self.num_filas:
+            raise IndexError("Índice de fila fuera de rango.")
+        inicio = i * self.num_columnas
+        return self._vista[inicio:inicio + self.num_columnas]
+
+    def __setitem__(self, i, fila):
+        self[i][:] = array(TIPO_CELDA, fila)
+
+    def __iter__(self):
+        for i in range(self.num_filas):
+            yield self[i]
+
+    def __eq__(self, otra):
+        if isinstance(otra, MatrizCompacta):
+            return (self.num_filas, self.num_columnas, self.datos) == \
+                   (otra.num_filas, otra.num_columnas, otra.datos)
+        return self.tolist() == otra
+
+    def __repr__(self):
+        return f"MatrizCompacta({self.num_filas}x{self.num_columnas})"
+
+    def __reduce__(self):
+        return (MatrizCompacta, (self.num_filas, self.num_columnas, self.datos))
+
+    def __array__(self, dtype=None, copy=None):
+        arreglo = np.frombuffer(self.datos, dtype=np.int32).reshape(self.num_filas, self.num_columnas)
+        return arreglo if dtype is None else arreglo.astype(dtype)
+
+    @property
+    def nbytes(self):
+        return self.datos.itemsize * len(self.datos)
+
+    def copiar(self):
+        """Instantánea de la matriz: una única copia del buffer."""
+        return MatrizCompacta(self.num_filas, self.num_columnas, self.datos[:])
+
+    def restar(self, otra):
+        """Nueva matriz self - otra (por ejemplo NECESIDAD = DEMANDA_MAX - ASIGNACIÓN)."""
+        diferencia = np.asarray(self, dtype=np.int32) - np.asarray(otra, dtype=np.int32)
+        return MatrizCompacta(self.num_filas, self.num_columnas,
+                              array(TIPO_CELDA, diferencia.tobytes()))
+
+    def tolist(self):
+        return [fila.tolist() for fila in self]
+
+
+def copiar_matriz(matriz):
+    """Copia una matriz sea lista de listas o MatrizCompacta."""
+    if isinstance(matriz, MatrizCompacta):
+        return matriz.copiar()
+    return [fila[:] for fila in matriz]
@@ -0,0 +1,116 @@
+"""
+Lectura de archivos de estado y de solicitudes para el banquero sin interfaz.
+
+Archivo de estado (JSON):
+    {
+        "asignacion":     [[0, 1, 0], [2, 0, 0], ...],
+        "demanda_maxima": [[7, 5, 3], [3, 2, 2], ...],
+        "disponibles":    [3, 3, 2],
+        "nombres_procesos": ["P0", "P1", ...],   (opcional)
+        "nombres_recursos": ["A", "B", "C"]      (opcional)
+    }
+
+Archivo de solicitudes (JSON): lista de objetos
+    [{"proceso": "P1", "solicitud": [1, 0, 2]}, ...]
+donde "proceso" puede ser el nombre o el índice del proceso. El archivo de
+estado también puede traer su propia lista bajo la clave "solicitudes".
+"""
+import json
+
+from .modelo import ModeloBanquero
+
+
+def _leer_json(ruta):
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except OSError as e:
+        raise ValueError(f"No se pudo abrir {ruta}: {e}") from e
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{ruta} no es un JSON válido: {e}") from e
+
+
+def cargar_estado(ruta, **opciones):
+    """
+    Crea un ModeloBanquero a partir de un archivo de estado.
+    `opciones` se pasan al constructor (motor, transaccional, ...).
+
+    Devuelve (modelo, datos) donde `datos` es el JSON leído, por si trae
+    también la lista de solicitudes.
+    """
+    datos = _leer_json(ruta)
+
+    faltantes = [c for c in ("asignacion", "demanda_maxima", "disponibles") if c not in datos]
+    if faltantes:
+        raise ValueError(f"Al archivo de estado le faltan las claves: {', '.join(faltantes)}.")
+
+    num_procesos = len(datos["asignacion"])
+    num_recursos = len(datos["disponibles"])
+    if len(datos["demanda_maxima"]) != num_procesos:
+        raise ValueError("ASIGNACIÓN y DEMANDA MÁXIMA deben tener el mismo número de procesos.")
+    validar_cantidades(datos["disponibles"], "disponibles")
+    for nombre in ("asignacion", "demanda_maxima"):
+        if any(len(validar_cantidades(fila, nombre)) != num_recursos for fila in datos[nombre]):
+            raise ValueError(f"Cada fila de '{nombre}' debe tener {num_recursos} recursos.")
+
+    modelo = ModeloBanquero(
+        datos["asignacion"],
+        datos["demanda_maxima"],
+        datos["disponibles"],
+        datos.get("nombres_procesos"),
+        datos.get("nombres_recursos"),
+        **opciones
+    )
+    return modelo, datos
+
+
+def indice_proceso(modelo, proceso):
+    """Índice de `proceso` (nombre o índice entero; un bool no es un índice)."""
+    if isinstance(proceso, bool):
+        raise ValueError(f"Proceso inválido: {proceso!r}.")
+    if isinstance(proceso, int):
+        if not 0 <= proceso < modelo.num_procesos:
+            raise ValueError(f"Índice de proceso fuera de rango: {proceso}.")
+        return proceso
+    try:
+        return modelo.nombres_procesos.index(proceso)
+    except ValueError:
+        raise ValueError(f"Proceso desconocido: {proceso!r}.") from None
+
+
+def validar_cantidades(valores, campo):
+    """Lista de enteros no negativos; sin convertir (int(0.9) sería 0) ni aceptar bools."""
+    if not isinstance(valores, list):
+        raise ValueError(f"'{campo}' debe ser una lista de enteros.")
+    for v in valores:
+        if isinstance(v, bool) or not isinstance(v, int):
+            raise ValueError(f"'{campo}' debe contener solo enteros: {v!r}.")
+        if v < 0:
+            raise ValueError(f"'{campo}' no puede tener cantidades negativas: {v}.")
+    return valores
+
+
+def convertir_solicitudes(modelo, lista):
+    """Convierte la lista de objetos {"proceso", "solicitud"} en pares (id_proceso, solicitud)."""
+    solicitudes = []
+    for k, entrada in enumerate(lista):
+        try:
+            proceso = entrada["proceso"]
+            solicitud = entrada["solicitud"]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"Solicitud #{k + 1} inválida: se espera {{\"proceso\": ..., \"solicitud\": [...]}}."
+            ) from None
+        try:
+            solicitudes.append((indice_proceso(modelo, proceso), validar_cantidades(solicitud, "solicitud")))
+        except ValueError as e:
+            raise ValueError(f"Solicitud #{k + 1} inválida: {e}") from None
+    return solicitudes
+
+
+def cargar_solicitudes(ruta, modelo):
+    """Lee un archivo de solicitudes y devuelve la lista de pares (id_proceso, solicitud)."""
+    lista = _leer_json(ruta)
+    if isinstance(lista, dict):
+        lista = lista.get("solicitudes", [])
+    return convertir_solicitudes(modelo, lista)
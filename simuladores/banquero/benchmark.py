@@ -0,0 +1,298 @@
+"""
+Suite de benchmarks del Algoritmo del Banquero (sin interfaz).
+
+Recorre una rejilla de tamaños (procesos x recursos), proporciones de estados
+seguros / inseguros y motores de seguridad. Para cada combinación mide:
+    - tiempo por comprobación de `es_estado_seguro` (media, p50, p99 en us)
+    - latencia por llamada a `solicitar_recursos` (media, p50, p99 en us)
+    - pico de memoria (tracemalloc) al construir el modelo y atender
+      solicitudes sobre una instancia, en una pasada aparte para no
+      contaminar los tiempos
+
+Cada caso se mide en `--rondas` rondas intercaladas con las de los demás
+casos (tras un calentamiento que se descarta) y de cada métrica se guarda el
+MÍNIMO entre rondas, que es lo que menos depende de la carga de la máquina.
+
+Los resultados se guardan como JSON en data/benchmarks/ y pueden compararse
+con una ejecución anterior (--base) para marcar regresiones: una métrica
+regresa si empeora más que el umbral relativo (por defecto 30 %) Y más que
+un mínimo absoluto (por defecto 5 us; por debajo de eso los casos chicos son
+puro ruido). Con regresiones el programa termina con código 1, apto para CI.
+
+Uso:
+    python -m simuladores.banquero.benchmark
+    python -m simuladores.banquero.benchmark --procesos 50 200 --recursos 5 \
+        --motores numpy indexado --base data/benchmarks/base.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from .benchmark_transaccional import generar_solicitud
+from .generador import GeneradorInstancias
+from .metricas import percentil
+from .modelo import ALMACENAMIENTOS, MOTORES_SEGURIDAD, ModeloBanquero
+
+CARPETA_RESULTADOS = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data", "benchmarks"
+)
+
+# Métricas que se comparan contra la línea base (menor es mejor en todas)
+METRICAS_COMPARADAS = ("chequeo_us.p50", "chequeo_us.media",
+                       "solicitud_us.p50", "solicitud_us.media", "pico_bytes")
+
+
+def resumir_tiempos(valores_us):
+    valores_us = valores_us or [0.0]
+    return {
+        "media": statistics.mean(valores_us),
+        "p50": percentil(valores_us, 50),
+        "p99": percentil(valores_us, 99),
+    }
+
+
+def clave_caso(caso):
+    return (f"n={caso['procesos']},m={caso['recursos']},"
+            f"seguras={caso['proporcion_seguras']},motor={caso['motor']},"
+            f"transaccional={caso['transaccional']},almacenamiento={caso['almacenamiento']}")
+
+
+def medir_caso(instancias, motor, opciones, repeticiones, num_solicitudes, semilla):
+    """Mide un caso de la rejilla sobre una lista de instancias ya generadas."""
+    rng = random.Random(semilla)
+
+    chequeos, solicitudes, seguras = [], [], 0
+    for asignacion, demanda_maxima, disponibles, _ in instancias:
+        modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor=motor, **opciones)
+
+        es_seguro, _ = modelo.es_estado_seguro()
+        seguras += es_seguro
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            modelo.es_estado_seguro()
+            chequeos.append((time.perf_counter() - inicio) * 1e6)
+
+        for _ in range(num_solicitudes):
+            pedido = generar_solicitud(rng, modelo)
+            if pedido is None:
+                break
+            inicio = time.perf_counter()
+            modelo.solicitar_recursos(*pedido)
+            solicitudes.append((time.perf_counter() - inicio) * 1e6)
+
+    # Memoria: una instancia, con tracemalloc activo solo en esta pasada
+    asignacion, demanda_maxima, disponibles, _ = instancias[0]
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor=motor, **opciones)
+    modelo.es_estado_seguro()
+    for _ in range(min(num_solicitudes, 20)):
+        pedido = generar_solicitud(rng, modelo)
+        if pedido is None:
+            break
+        modelo.solicitar_recursos(*pedido)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del modelo
+
+    return {
+        "chequeo_us": resumir_tiempos(chequeos),
+        "solicitud_us": resumir_tiempos(solicitudes),
+        "pico_bytes": pico - base,
+        "instancias_seguras": seguras,
+    }
+
+
+def combinar_rondas(rondas):
+    """De cada métrica de varias rondas de medir_caso se queda con el mínimo."""
+    resultado = {
+        nombre: {estadistico: min(r[nombre][estadistico] for r in rondas) for estadistico in rondas[0][nombre]}
+        for nombre in ("chequeo_us", "solicitud_us")
+    }
+    resultado["pico_bytes"] = min(r["pico_bytes"] for r in rondas)
+    resultado["instancias_seguras"] = rondas[0]["instancias_seguras"]
+    return resultado
+
+
+def ejecutar_rejilla(args):
+    opciones = {"transaccional": args.transaccional, "almacenamiento": args.almacenamiento}
+    casos = []
+    for num_procesos in args.procesos:
+        for num_recursos in args.recursos:
+            for proporcion in args.proporciones:
+                # Las mismas instancias para todos los motores
+                generador = GeneradorInstancias(args.semilla, num_procesos, num_recursos,
+                                                proporcion_seguras=proporcion)
+                instancias = list(generador.generar(args.instancias))
+                for motor in args.motores:
+                    caso = {
+                        "procesos": num_procesos,
+                        "recursos": num_recursos,
+                        "proporcion_seguras": proporcion,
+                        "motor": motor,
+                        **opciones,
+                    }
+                    casos.append((caso, instancias))
+
+    # Calentamiento, y después las rondas INTERCALADAS (una pasada por todos los
+    # casos en cada ronda): una racha de carga en la máquina afecta a una ronda
+    # de cada caso y no a todas las de uno
+    for caso, instancias in casos:
+        medir_caso(instancias[:1], caso["motor"], opciones, args.repeticiones, args.solicitudes, args.semilla)
+    rondas = [[] for _ in casos]
+    for _ in range(args.rondas):
+        for (caso, instancias), mediciones in zip(casos, rondas):
+            mediciones.append(medir_caso(instancias, caso["motor"], opciones,
+                                         args.repeticiones, args.solicitudes, args.semilla))
+
+    resultados = []
+    for (caso, _), mediciones in zip(casos, rondas):
+        caso.update(combinar_rondas(mediciones))
+        caso["clave"] = clave_caso(caso)
+        resultados.append(caso)
+        imprimir_caso(caso)
+    return resultados
+
+
+def imprimir_encabezado():
+    print(f"{'n':>6}{'m':>5}{'seguras':>9}{'motor':>10}"
+          f"{'chequeo p50':>13}{'p99':>10}{'solicitud p50':>15}{'p99':>10}{'pico KB':>10}")
+
+
+def imprimir_caso(caso):
+    print(f"{caso['procesos']:>6}{caso['recursos']:>5}{caso['proporcion_seguras']:>9}{caso['motor']:>10}"
+          f"{caso['chequeo_us']['p50']:>13.1f}{caso['chequeo_us']['p99']:>10.1f}"
+          f"{caso['solicitud_us']['p50']:>15.1f}{caso['solicitud_us']['p99']:>10.1f}"
+          f"{caso['pico_bytes'] / 1024:>10.1f}")
+
+
+def valor_metrica(caso, nombre):
+    valor = caso
+    for parte in nombre.split("."):
+        valor = valor[parte]
+    return valor
+
+
+def comparar_con_base(resultados, base, umbral, minimo_us=0.0):
+    """
+    Devuelve [(clave, metrica, valor_base, valor_nuevo, cambio_relativo)] de las
+    métricas que empeoraron más que `umbral` (relativo) y, las de tiempo, en
+    más de `minimo_us` microsegundos. Los casos que no están en la base (p. ej.
+    de otra configuración) se ignoran.
+    """
+    por_clave = {caso["clave"]: caso for caso in base["resultados"]}
+    regresiones = []
+    for caso in resultados:
+        anterior = por_clave.get(caso["clave"])
+        if anterior is None:
+            continue
+        for metrica in METRICAS_COMPARADAS:
+            valor_base = valor_metrica(anterior, metrica)
+            valor_nuevo = valor_metrica(caso, metrica)
+            if valor_base <= 0:
+                continue
+            cambio = (valor_nuevo - valor_base) / valor_base
+            if "_us" in metrica and valor_nuevo - valor_base <= minimo_us:
+                continue
+            if cambio > umbral:
+                regresiones.append((caso["clave"], metrica, valor_base, valor_nuevo, cambio))
+    return regresiones
+
+
+def metadatos(args):
+    return {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "parametros": {
+            "procesos": args.procesos,
+            "recursos": args.recursos,
+            "proporciones": args.proporciones,
+            "motores": args.motores,
+            "instancias": args.instancias,
+            "repeticiones": args.repeticiones,
+            "rondas": args.rondas,
+            "solicitudes": args.solicitudes,
+            "transaccional": args.transaccional,
+            "almacenamiento": args.almacenamiento,
+            "semilla": args.semilla,
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simuladores.banquero.benchmark",
+        description="Benchmarks del Algoritmo del Banquero con comparación contra una línea base."
+    )
+    parser.add_argument("--procesos", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--recursos", type=int, nargs="+", default=[3, 10])
+    parser.add_argument("--proporciones", type=float, nargs="+", default=[1.0, 0.5],
+                        help="proporción de instancias seguras de cada caso")
+    parser.add_argument("--motores", nargs="+", choices=MOTORES_SEGURIDAD, default=list(MOTORES_SEGURIDAD))
+    parser.add_argument("--instancias", type=int, default=10, help="instancias por caso")
+    parser.add_argument("--repeticiones", type=int, default=5, help="comprobaciones por instancia")
+    parser.add_argument("--rondas", type=int, default=5,
+                        help="rondas por caso (tras una de calentamiento); se guarda el mínimo")
+    parser.add_argument("--solicitudes", type=int, default=50, help="solicitudes por instancia")
+    parser.add_argument("--transaccional", action="store_true")
+    parser.add_argument("--almacenamiento", choices=ALMACENAMIENTOS, default="listas")
+    parser.add_argument("--semilla", type=int, default=7)
+    parser.add_argument("--salida", help="archivo JSON de resultados "
+                                         "(por defecto data/benchmarks/banquero-<fecha>.json)")
+    parser.add_argument("--base", help="resultados anteriores con los que comparar")
+    parser.add_argument("--umbral", type=float, default=0.3,
+                        help="empeoramiento relativo a partir del cual se marca regresión")
+    parser.add_argument("--minimo-us", type=float, default=5.0,
+                        help="empeoramiento absoluto (us) por debajo del cual un tiempo no es regresión")
+    args = parser.parse_args(argv)
+    for nombre in ("instancias", "repeticiones", "rondas"):
+        if getattr(args, nombre) < 1:
+            parser.error(f"--{nombre} debe ser al menos 1")
+
+    base = None
+    if args.base:
+        try:
+            with open(args.base, encoding="utf-8") as f:
+                base = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.exit(2, f"Error: no se pudo leer la línea base: {e}\n")
+
+    imprimir_encabezado()
+    resultados = ejecutar_rejilla(args)
+
+    salida = args.salida
+    if salida is None:
+        os.makedirs(CARPETA_RESULTADOS, exist_ok=True)
+        marca = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        salida = os.path.join(CARPETA_RESULTADOS, f"banquero-{marca}.json")
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump({"metadatos": metadatos(args), "resultados": resultados}, f, ensure_ascii=False, indent=2)
+    print(f"\nResultados guardados en {salida}")
+
+    if base is None:
+        return 0
+
+    regresiones = comparar_con_base(resultados, base, args.umbral, args.minimo_us)
+    if not regresiones:
+        print(f"Sin regresiones respecto a {args.base} (umbral {args.umbral:.0%}).")
+        return 0
+    print(f"\nREGRESIONES respecto a {args.base} (umbral {args.umbral:.0%}):")
+    for clave, metrica, valor_base, valor_nuevo, cambio in regresiones:
+        print(f"  {clave}  {metrica}: {valor_base:.1f} → {valor_nuevo:.1f} (+{cambio:.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark de `ModeloBanquero.solicitar_recursos`: rollback por COPIA
+(comportamiento original) contra el modo TRANSACCIONAL con registro de deshacer.
+
+Para cada modo se mide:
+    - latencia por solicitud (media, p50 y p99, en microsegundos)
+    - memoria reservada por solicitud: pico de bytes que la llamada llega a
+      reservar por encima de lo ya ocupado (tracemalloc). Ambos modos pagan
+      lo que reserva la propia comprobación de seguridad; el modo COPIA suma
+      además las tres copias completas para el rollback.
+
+Uso:
+    python -m simuladores.banquero.benchmark_transaccional --procesos 200 --recursos 10
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from .modelo import ModeloBanquero, MOTORES_SEGURIDAD
+from .metricas import percentil
+
+
+def generar_instancia(rng, num_procesos, num_recursos):
+    """Instancia segura (misma idea que el generador de la interfaz)."""
+    disponibles = [rng.randint(1, 5) for _ in range(num_recursos)]
+    trabajo = disponibles[:]
+    asignacion, demanda_maxima = [], []
+    for _ in range(num_procesos):
+        necesidad_i = [rng.randint(0, trabajo[j]) for j in range(num_recursos)]
+        asignacion_i = [rng.randint(0, 3) for _ in range(num_recursos)]
+        asignacion.append(asignacion_i)
+        demanda_maxima.append([necesidad_i[j] + asignacion_i[j] for j in range(num_recursos)])
+        for j in range(num_recursos):
+            trabajo[j] += asignacion_i[j]
+    return asignacion, demanda_maxima, disponibles
+
+
+def generar_solicitud(rng, modelo):
+    """
+    Solicitud que supera las validaciones iniciales (<= necesidad y <= disponibles),
+    de modo que siempre llega a la asignación tentativa y al rollback/confirmación.
+    Devuelve None si ya no queda ninguna solicitud posible.
+    """
+    candidatos = [
+        i for i in range(modelo.num_procesos)
+        if any(min(modelo.necesidad[i][j], modelo.disponibles[j]) > 0
+               for j in range(modelo.num_recursos))
+    ]
+    if not candidatos:
+        return None
+    id_proceso = rng.choice(candidatos)
+    solicitud = [
+        rng.randint(0, min(modelo.necesidad[id_proceso][j], modelo.disponibles[j]))
+        for j in range(modelo.num_recursos)
+    ]
+    return id_proceso, solicitud
+
+
+def ejecutar_modo(instancia, transaccional, motor, num_solicitudes, semilla, medir_memoria):
+    """
+    Lanza `num_solicitudes` solicitudes sobre el modelo y devuelve las mediciones.
+    Si el estado se agota, el modelo se reinicia (fuera del tiempo medido).
+    """
+    rng = random.Random(semilla)
+    modelo = ModeloBanquero(*instancia, motor=motor, transaccional=transaccional)
+
+    latencias = []
+    picos = []
+    concedidas = 0
+
+    for _ in range(num_solicitudes):
+        pedido = generar_solicitud(rng, modelo)
+        if pedido is None:
+            modelo.reiniciar(*instancia)
+            pedido = generar_solicitud(rng, modelo)
+        id_proceso, solicitud = pedido
+
+        if medir_memoria:
+            tracemalloc.reset_peak()
+            base_actual, _ = tracemalloc.get_traced_memory()
+            exito, _ = modelo.solicitar_recursos(id_proceso, solicitud)
+            _, pico = tracemalloc.get_traced_memory()
+            picos.append(pico - base_actual)
+        else:
+            inicio = time.perf_counter()
+            exito, _ = modelo.solicitar_recursos(id_proceso, solicitud)
+            latencias.append((time.perf_counter() - inicio) * 1e6)
+
+        concedidas += exito
+
+    return {
+        "latencias_us": latencias,
+        "picos_bytes": picos,
+        "concedidas": concedidas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark copia vs transaccional del Algoritmo del Banquero")
+    parser.add_argument("--procesos", type=int, default=200)
+    parser.add_argument("--recursos", type=int, default=10)
+    parser.add_argument("--solicitudes", type=int, default=2000)
+    parser.add_argument("--semilla", type=int, default=7)
+    parser.add_argument("--motor", choices=MOTORES_SEGURIDAD, default="numpy")
+    args = parser.parse_args()
+
+    instancia = generar_instancia(random.Random(args.semilla), args.procesos, args.recursos)
+    # La memoria se mide en una pasada aparte para no contaminar las latencias
+    muestras_memoria = min(args.solicitudes, 200)
+
+    print(f"Instancia: {args.procesos} procesos x {args.recursos} recursos, "
+          f"{args.solicitudes} solicitudes, motor={args.motor}\n")
+    print(f"{'Modo':<15}{'media us':>10}{'p50 us':>10}{'p99 us':>10}"
+          f"{'pico B/sol':>12}{'concedidas':>12}")
+
+    for nombre, transaccional in (("copia", False), ("transaccional", True)):
+        tiempos = ejecutar_modo(instancia, transaccional, args.motor,
+                                args.solicitudes, args.semilla, medir_memoria=False)
+        tracemalloc.start()
+        memoria = ejecutar_modo(instancia, transaccional, args.motor,
+                                muestras_memoria, args.semilla, medir_memoria=True)
+        tracemalloc.stop()
+
+        latencias = tiempos["latencias_us"]
+        print(f"{nombre:<15}"
+              f"{statistics.mean(latencias):>10.1f}"
+              f"{percentil(latencias, 50):>10.1f}"
+              f"{percentil(latencias, 99):>10.1f}"
+              f"{statistics.mean(memoria['picos_bytes']):>12.0f}"
+              f"{tiempos['concedidas']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Generador de carga para el servidor de admisión del banquero.
+
+Abre varias conexiones concurrentes y en cada una envía solicitudes aleatorias
+(sin esperar la respuesta anterior, hasta `ventana` peticiones en vuelo). De
+vez en cuando un proceso "termina" y libera todo lo que tiene, para que el
+estado no se agote. Al final muestra la latencia vista por el cliente y las
+métricas del propio servidor.
+
+Uso:
+    python -m simuladores.banquero.cliente --puerto 8765 --conexiones 8 --peticiones 20000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from .metricas import percentil
+
+
+class ConexionCliente:
+    """Conexión con pipelining: asocia cada respuesta a su petición por el campo "id"."""
+    def __init__(self, lector, escritor):
+        self.lector = lector
+        self.escritor = escritor
+        self.siguiente_id = 0
+        self.esperando = {}
+        self._receptor = asyncio.create_task(self._recibir())
+
+    @classmethod
+    async def abrir(cls, host, puerto, ruta_unix=None):
+        if ruta_unix:
+            lector, escritor = await asyncio.open_unix_connection(ruta_unix)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto)
+        return cls(lector, escritor)
+
+    async def _recibir(self):
+        while True:
+            linea = await self.lector.readline()
+            if not linea:
+                break
+            respuesta = json.loads(linea)
+            futuro = self.esperando.pop(respuesta.get("id"), None)
+            if futuro is not None and not futuro.done():
+                futuro.set_result(respuesta)
+
+    async def pedir(self, peticion):
+        self.siguiente_id += 1
+        peticion = dict(peticion, id=self.siguiente_id)
+        futuro = asyncio.get_running_loop().create_future()
+        self.esperando[self.siguiente_id] = futuro
+        self.escritor.write((json.dumps(peticion) + "\n").encode("utf-8"))
+        await self.escritor.drain()
+        return await futuro
+
+    async def cerrar(self):
+        self._receptor.cancel()
+        self.escritor.close()
+        try:
+            await self.escritor.wait_closed()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+
+
+def generar_peticion(rng, estado, prob_liberar):
+    """Solicitud aleatoria acotada por la NECESIDAD conocida, o una liberación total."""
+    num_procesos = len(estado["nombres_procesos"])
+    i = rng.randrange(num_procesos)
+    proceso = estado["nombres_procesos"][i]
+    if rng.random() < prob_liberar:
+        return {"op": "liberar", "proceso": proceso}
+    solicitud = [rng.randint(0, min(n, 2)) for n in estado["necesidad"][i]]
+    return {"op": "solicitar", "proceso": proceso, "solicitud": solicitud}
+
+
+async def trabajador(conexion, estado, num_peticiones, ventana, semilla, prob_liberar, resultados):
+    rng = random.Random(semilla)
+    limite = asyncio.Semaphore(ventana)
+
+    async def una():
+        async with limite:
+            peticion = generar_peticion(rng, estado, prob_liberar)
+            inicio = time.perf_counter()
+            respuesta = await conexion.pedir(peticion)
+            resultados["latencias_us"].append((time.perf_counter() - inicio) * 1e6)
+            if "error" in respuesta:
+                resultados["errores"] += 1
+            elif peticion["op"] == "solicitar":
+                resultados["concedidas" if respuesta["concedida"] else "rechazadas"] += 1
+            else:
+                resultados["liberaciones"] += 1
+
+    await asyncio.gather(*(una() for _ in range(num_peticiones)))
+
+
+async def generar_carga(host, puerto, ruta_unix, conexiones, peticiones, ventana, semilla, prob_liberar):
+    conexiones_abiertas = [
+        await ConexionCliente.abrir(host, puerto, ruta_unix) for _ in range(conexiones)
+    ]
+    estado = await conexiones_abiertas[0].pedir({"op": "estado"})
+
+    resultados = {"latencias_us": [], "concedidas": 0, "rechazadas": 0,
+                  "liberaciones": 0, "errores": 0}
+    por_conexion = peticiones // conexiones
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        trabajador(c, estado, por_conexion, ventana, semilla + k, prob_liberar, resultados)
+        for k, c in enumerate(conexiones_abiertas)
+    ))
+    transcurrido = time.perf_counter() - inicio
+
+    metricas_servidor = await conexiones_abiertas[0].pedir({"op": "metricas"})
+    for c in conexiones_abiertas:
+        await c.cerrar()
+    return resultados, transcurrido, metricas_servidor
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simuladores.banquero.cliente",
+        description="Generador de carga para el servidor de admisión del banquero."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (en lugar de TCP)")
+    parser.add_argument("--conexiones", type=int, default=4)
+    parser.add_argument("--peticiones", type=int, default=10000, help="total entre todas las conexiones")
+    parser.add_argument("--ventana", type=int, default=32, help="peticiones en vuelo por conexión")
+    parser.add_argument("--prob-liberar", type=float, default=0.2)
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    resultados, transcurrido, metricas = asyncio.run(generar_carga(
+        args.host, args.puerto, args.unix, args.conexiones, args.peticiones,
+        args.ventana, args.semilla, args.prob_liberar
+    ))
+
+    latencias = resultados["latencias_us"] or [0.0]
+    total = len(resultados["latencias_us"])
+    print(f"Peticiones: {total} en {transcurrido:.2f} s ({total / transcurrido:.0f} peticiones/s)")
+    print(f"Concedidas: {resultados['concedidas']}  Rechazadas: {resultados['rechazadas']}  "
+          f"Liberaciones: {resultados['liberaciones']}  Errores: {resultados['errores']}")
+    print(f"Latencia cliente: p50 {percentil(latencias, 50):.0f} us, p99 {percentil(latencias, 99):.0f} us")
+    print("Métricas del servidor:")
+    metricas.pop("id", None)
+    print(json.dumps(metricas, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Generador reproducible de instancias del banquero, para pruebas de carga y benchmarks.
+
+Cada instancia k se genera con su propia semilla derivada de (semilla, k), así
+que la instancia 1000 es la misma se pidan o no las 999 anteriores, y el
+generador puede recorrerse de forma perezosa sin guardar nada en memoria.
+
+Construcción (la misma idea que el generador de la interfaz):
+    - SEGURA: se recorre un orden de procesos acumulando el trabajo disponible;
+      la necesidad de cada proceso es <= el trabajo en su turno, así que ese
+      orden es una secuencia segura.
+    - INSEGURA: los procesos a partir de un corte aleatorio (al menos 2)
+      retienen una unidad de cierto recurso y necesitan más de lo que queda
+      libre al terminar los anteriores, sin superar el total del sistema;
+      ninguno puede avanzar y el estado es inseguro.
+Al final se barajan las filas para que la secuencia segura no sea siempre P0, P1, ...
+
+Para tamaños grandes se usa numpy (todas las filas de una vez); los dos caminos
+son reproducibles, pero con la misma semilla producen instancias distintas.
+
+Uso:
+    python -m simuladores.banquero.generador --cantidad 1000 --procesos 200 \
+        --recursos 10 --proporcion-seguras 0.8 --semilla 42 > instancias.jsonl
+"""
+import argparse
+import json
+import random
+import sys
+
+import numpy as np
+
+# A partir de este número de celdas (procesos x recursos) se usa numpy
+UMBRAL_VECTORIZADO = 20000
+
+
+class GeneradorInstancias:
+    """
+    Produce tuplas (asignacion, demanda_maxima, disponibles, segura): las tres
+    primeras son las listas que recibe ModeloBanquero y `segura` indica cómo
+    se construyó la instancia.
+
+    Parámetros:
+        proporcion_seguras: probabilidad de que cada instancia sea segura.
+        densidad: probabilidad de que una celda de ASIGNACIÓN / NECESIDAD
+                  sea distinta de cero (matrices dispersas con valores bajos).
+        vectorizado: True/False para forzar el camino; None decide por tamaño.
+    """
+    def __init__(self, semilla=None, num_procesos=5, num_recursos=3,
+                 proporcion_seguras=1.0, densidad=1.0, max_asignacion=3,
+                 max_disponibles=5, barajar=True, vectorizado=None):
+        if num_procesos < 1 or num_recursos < 1:
+            raise ValueError("Se necesita al menos un proceso y un tipo de recurso.")
+        if not 0.0 <= proporcion_seguras <= 1.0:
+            raise ValueError("La proporción de instancias seguras debe estar entre 0 y 1.")
+        if not 0.0 < densidad <= 1.0:
+            raise ValueError("La densidad debe estar en (0, 1].")
+        if proporcion_seguras < 1.0 and num_procesos < 2:
+            raise ValueError("Se necesitan al menos 2 procesos para generar estados inseguros.")
+
+        if semilla is None:
+            semilla = random.SystemRandom().randrange(2 ** 63)
+        self.semilla = semilla
+        self.num_procesos = num_procesos
+        self.num_recursos = num_recursos
+        self.proporcion_seguras = proporcion_seguras
+        self.densidad = densidad
+        self.max_asignacion = max_asignacion
+        self.max_disponibles = max_disponibles
+        self.barajar = barajar
+        if vectorizado is None:
+            vectorizado = num_procesos * num_recursos >= UMBRAL_VECTORIZADO
+        self.vectorizado = vectorizado
+
+    def __iter__(self):
+        """Flujo infinito de instancias: 0, 1, 2, ..."""
+        k = 0
+        while True:
+            yield self.instancia(k)
+            k += 1
+
+    def generar(self, cantidad, inicio=0):
+        """Genera perezosamente las instancias inicio, ..., inicio + cantidad - 1."""
+        for k in range(inicio, inicio + cantidad):
+            yield self.instancia(k)
+
+    def instancia(self, k):
+        """La instancia número k (siempre la misma para la misma semilla)."""
+        if self.vectorizado:
+            return self._instancia_numpy(np.random.default_rng([self.semilla, k]))
+        return self._instancia_python(random.Random(f"{self.semilla}:{k}"))
+
+    # --- Camino en Python puro (tamaños pequeños, interfaz) ---
+
+    def _instancia_python(self, rng):
+        n, m = self.num_procesos, self.num_recursos
+        segura = rng.random() < self.proporcion_seguras
+        corte = n if segura else rng.randint(0, n - 2)
+        recurso_bloqueo = rng.randrange(m)
+
+        def celda(maximo):
+            return rng.randint(0, maximo) if rng.random() < self.densidad else 0
+
+        disponibles = [rng.randint(1, self.max_disponibles) for _ in range(m)]
+        asignacion = [[celda(self.max_asignacion) for _ in range(m)] for _ in range(n)]
+        for i in range(corte, n):
+            asignacion[i][recurso_bloqueo] = max(1, asignacion[i][recurso_bloqueo])
+
+        trabajo = disponibles[:]
+        necesidad = []
+        for i in range(corte):
+            necesidad.append([celda(trabajo[j]) for j in range(m)])
+            for j in range(m):
+                trabajo[j] += asignacion[i][j]
+
+        # Lo que retienen los bloqueados en el recurso de bloqueo
+        retenido = sum(asignacion[i][recurso_bloqueo] for i in range(corte, n))
+        for i in range(corte, n):
+            fila = [celda(trabajo[j]) for j in range(m)]
+            otros = retenido - asignacion[i][recurso_bloqueo]
+            fila[recurso_bloqueo] = trabajo[recurso_bloqueo] + rng.randint(1, otros)
+            necesidad.append(fila)
+
+        orden = list(range(n))
+        if self.barajar:
+            rng.shuffle(orden)
+        asignacion = [asignacion[i] for i in orden]
+        demanda_maxima = [
+            [necesidad[i][j] + asignacion_i[j] for j in range(m)]
+            for i, asignacion_i in zip(orden, asignacion)
+        ]
+        return asignacion, demanda_maxima, disponibles, segura
+
+    # --- Camino vectorizado (tamaños grandes) ---
+
+    def _instancia_numpy(self, rng):
+        n, m = self.num_procesos, self.num_recursos
+        segura = bool(rng.random() < self.proporcion_seguras)
+        corte = n if segura else int(rng.integers(0, n - 1))
+        recurso_bloqueo = int(rng.integers(0, m))
+
+        disponibles = rng.integers(1, self.max_disponibles + 1, size=m, dtype=np.int64)
+        asignacion = rng.integers(0, self.max_asignacion + 1, size=(n, m), dtype=np.int64)
+        asignacion *= rng.random((n, m)) < self.densidad
+        bloqueados = asignacion[corte:, recurso_bloqueo]
+        np.maximum(bloqueados, 1, out=bloqueados)
+
+        # Trabajo disponible justo antes del turno de cada proceso
+        trabajo = np.empty((n, m), dtype=np.int64)
+        trabajo[0] = disponibles
+        np.cumsum(asignacion[:-1], axis=0, out=trabajo[1:])
+        trabajo[1:] += disponibles
+        if corte < n:
+            # Los bloqueados solo ven lo liberado por los que están antes del corte
+            trabajo[corte:] = trabajo[corte]
+
+        necesidad = (rng.random((n, m)) * (trabajo + 1)).astype(np.int64)
+        necesidad *= rng.random((n, m)) < self.densidad
+        if corte < n:
+            otros = bloqueados.sum() - bloqueados
+            necesidad[corte:, recurso_bloqueo] = (
+                trabajo[corte, recurso_bloqueo] + 1 + (rng.random(n - corte) * otros).astype(np.int64)
+            )
+
+        if self.barajar:
+            orden = rng.permutation(n)
+            asignacion, necesidad = asignacion[orden], necesidad[orden]
+        demanda_maxima = necesidad + asignacion
+        return asignacion.tolist(), demanda_maxima.tolist(), disponibles.tolist(), segura
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simuladores.banquero.generador",
+        description="Genera instancias del banquero como líneas JSON (una por instancia)."
+    )
+    parser.add_argument("--cantidad", type=int, default=100)
+    parser.add_argument("--inicio", type=int, default=0, help="índice de la primera instancia")
+    parser.add_argument("--procesos", type=int, default=5)
+    parser.add_argument("--recursos", type=int, default=3)
+    parser.add_argument("--proporcion-seguras", type=float, default=1.0)
+    parser.add_argument("--densidad", type=float, default=1.0)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    try:
+        generador = GeneradorInstancias(args.semilla, args.procesos, args.recursos,
+                                        args.proporcion_seguras, args.densidad)
+    except ValueError as e:
+        parser.exit(2, f"Error: {e}\n")
+
+    for asignacion, demanda_maxima, disponibles, segura in generador.generar(args.cantidad, args.inicio):
+        json.dump({"asignacion": asignacion, "demanda_maxima": demanda_maxima,
+                   "disponibles": disponibles, "segura": segura}, sys.stdout)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
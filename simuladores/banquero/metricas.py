@@ -0,0 +1,8 @@
+"""Utilidades de medición compartidas por la línea de comandos y los benchmarks."""
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) por el método del vecino más cercano."""
+    ordenados = sorted(valores)
+    k = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[k]
@@ -0,0 +1,395 @@
+"""
+Modelo del Algoritmo del Banquero (EVITACIÓN de interbloqueos), sin interfaz.
+
+Se puede importar desde la vista Tkinter, desde la línea de comandos
+(`python -m simuladores.banquero`) o desde trabajos por lotes.
+"""
+import numbers
+
+from .almacenamiento import MatrizCompacta, copiar_matriz
+from .motores import IndiceNecesidadOrdenada, MotorSeguridadNumpy
+
+# Motores disponibles para comprobar si un estado es seguro
+MOTORES_SEGURIDAD = ("python", "numpy", "indexado")
+
+# Formas de guardar las matrices del modelo
+ALMACENAMIENTOS = ("listas", "compacto")
+
+MENSAJE_ESTADO_INSEGURO = (
+    "La asignación dejaría al sistema en un estado INSEGURO.\n"
+    "Esto significa que podría aparecer un interbloqueo,\n"
+    "por lo que el sistema RECHAZA esta solicitud."
+)
+
+# ============================================
+#  MODELO: Algoritmo del Banquero (Evitación)
+# ============================================
+
+class ModeloBanquero:
+    """
+    Implementación del Algoritmo del Banquero para EVITACIÓN de interbloqueos.
+
+    - asignacion[i][j]: recursos del tipo j asignados al proceso i
+    - demanda_maxima[i][j]: demanda máxima del proceso i
+    - disponibles[j]: recursos libres del tipo j en el sistema
+
+    El parámetro `motor` elige cómo se comprueba el estado seguro:
+    "python" (recorrido clásico), "numpy" (comparaciones vectorizadas,
+    pensado para instancias con cientos de procesos) o "indexado" (procesos
+    ordenados por necesidad en cada tipo de recurso, ver IndiceNecesidadOrdenada).
+
+    Con `transaccional=True` la asignación tentativa de `solicitar_recursos`
+    se aplica en el lugar y se anota en un registro de deshacer, en vez de
+    copiar las tres estructuras completas para el rollback.
+
+    Con `almacenamiento="compacto"` las matrices se guardan como MatrizCompacta
+    (un único buffer `array('i')` por matriz, con filas como vistas); se
+    acceden igual (`asignacion[i][j]`) y una instantánea es una sola copia de
+    buffer por matriz. Pensado para instancias grandes (p. ej. 10 000 x 100).
+    """
+    def __init__(self, asignacion, demanda_maxima, disponibles,
+                 nombres_procesos=None, nombres_recursos=None, motor="python",
+                 transaccional=False, almacenamiento="listas"):
+
+        if motor not in MOTORES_SEGURIDAD:
+            raise ValueError(
+                f"Motor de seguridad desconocido: {motor!r}. "
+                f"Opciones: {', '.join(MOTORES_SEGURIDAD)}."
+            )
+        if almacenamiento not in ALMACENAMIENTOS:
+            raise ValueError(
+                f"Almacenamiento desconocido: {almacenamiento!r}. "
+                f"Opciones: {', '.join(ALMACENAMIENTOS)}."
+            )
+        self.motor = motor
+        self.transaccional = transaccional
+        self.almacenamiento = almacenamiento
+
+        # Registro de deshacer: (id_proceso, solicitud) aplicadas tentativamente
+        self._registro_deshacer = []
+
+        # Copias de trabajo
+        if almacenamiento == "compacto":
+            self.asignacion = MatrizCompacta.desde_filas(asignacion, len(disponibles))
+            self.demanda_maxima = MatrizCompacta.desde_filas(demanda_maxima, len(disponibles))
+        else:
+            self.asignacion = [list(fila) for fila in asignacion]
+            self.demanda_maxima = [list(fila) for fila in demanda_maxima]
+        self.disponibles = list(disponibles)
+
+        # Cantidades
+        self.num_procesos = len(asignacion)
+        self.num_recursos = len(disponibles)
+
+        # Nombres que se muestran en la interfaz
+        self.nombres_procesos = (
+            nombres_procesos or [f"P{i}" for i in range(self.num_procesos)]
+        )
+        self.nombres_recursos = (
+            nombres_recursos or [chr(ord("A") + i) for i in range(self.num_recursos)]
+        )
+
+        # Calculamos la matriz de necesidad: NECESIDAD = DEMANDA_MAX - ASIGNACIÓN
+        self._calcular_necesidad()
+
+        # Los motores alternativos mantienen su propia copia del estado
+        self._motor_seguridad = None
+        if self.motor == "numpy":
+            self._motor_seguridad = MotorSeguridadNumpy(
+                self.asignacion, self.necesidad, self.disponibles
+            )
+        elif self.motor == "indexado":
+            self._motor_seguridad = IndiceNecesidadOrdenada(
+                self.asignacion, self.necesidad, self.disponibles
+            )
+
+    def _calcular_necesidad(self):
+        """Calcula la matriz NECESIDAD = DEMANDA_MAX - ASIGNACIÓN."""
+        if self.almacenamiento == "compacto":
+            self.necesidad = self.demanda_maxima.restar(self.asignacion)
+            return
+
+        self.necesidad = []
+        for i in range(self.num_procesos):
+            fila = []
+            for j in range(self.num_recursos):
+                faltante = self.demanda_maxima[i][j] - self.asignacion[i][j]
+                fila.append(faltante)
+            self.necesidad.append(fila)
+
+    def es_estado_seguro(self):
+        """
+        Verifica si el estado actual del sistema es SEGURO.
+
+        Devuelve:
+            (True, secuencia_segura)  -> si existe una secuencia donde
+                                         todos los procesos pueden terminar.
+            (False, secuencia_parcial) -> secuencia de los que sí pudieron
+                                          terminar antes de quedar bloqueados.
+        """
+        if self._motor_seguridad is not None:
+            return self._motor_seguridad.es_estado_seguro()
+        return self._es_estado_seguro_python()
+
+    def _es_estado_seguro_python(self):
+        """Comprobación de seguridad recorriendo las listas fila por fila."""
+        trabajo = self.disponibles[:]          # work
+        terminado = [False] * self.num_procesos  # finish
+        secuencia_segura = []
+
+        while len(secuencia_segura) < self.num_procesos:
+            encontrado = False
+
+            for i in range(self.num_procesos):
+                if not terminado[i]:
+                    # ¿Este proceso puede continuar con los recursos actuales?
+                    if all(self.necesidad[i][j] <= trabajo[j]
+                           for j in range(self.num_recursos)):
+                        # Se “ejecuta” el proceso y libera sus recursos
+                        for j in range(self.num_recursos):
+                            trabajo[j] += self.asignacion[i][j]
+                        terminado[i] = True
+                        secuencia_segura.append(i)
+                        encontrado = True
+
+            if not encontrado:
+                break
+
+        es_seguro = len(secuencia_segura) == self.num_procesos
+        return es_seguro, secuencia_segura
+
+    def solicitar_recursos(self, id_proceso, solicitud):
+        """
+        Intenta conceder una solicitud de recursos de un proceso.
+
+        Parámetros:
+            - id_proceso: índice del proceso que solicita (0, 1, 2, ...)
+            - solicitud: lista con los recursos que pide [r0, r1, r2, ...]
+
+        Devuelve:
+            - (True, secuencia_segura)  si la asignación es segura
+            - (False, mensaje_error)    si NO se puede conceder
+        """
+        mensaje_error = self._validar_solicitud(id_proceso, solicitud)
+        if mensaje_error:
+            return False, mensaje_error
+
+        if self.transaccional:
+            # Asignación TENTATIVA en el lugar, anotada para poder deshacerla
+            self._aplicar_tentativa(id_proceso, solicitud)
+        else:
+            # Guardamos copias por si tenemos que hacer rollback
+            copia = self.instantanea()
+
+            # Asignación TENTATIVA
+            for j in range(self.num_recursos):
+                self.disponibles[j] -= solicitud[j]
+                self.asignacion[id_proceso][j] += solicitud[j]
+                self.necesidad[id_proceso][j] -= solicitud[j]
+            self._sincronizar_fila(id_proceso)
+
+        # Comprobamos si con esta asignación el estado sigue siendo seguro
+        es_seguro, secuencia = self.es_estado_seguro()
+
+        if es_seguro:
+            # Dejamos los cambios, devolvemos la secuencia segura
+            self._registro_deshacer.clear()
+            return True, secuencia
+        else:
+            # Hacemos rollback (deshacemos la asignación tentativa)
+            if self.transaccional:
+                self._deshacer()
+            else:
+                self.restaurar(copia)
+                self._sincronizar_fila(id_proceso)
+            return False, MENSAJE_ESTADO_INSEGURO
+
+    def _validar_proceso(self, id_proceso):
+        """El índice debe ser un entero (no bool) dentro de rango. Devuelve el error o None."""
+        if (isinstance(id_proceso, bool) or not isinstance(id_proceso, numbers.Integral)
+                or not 0 <= id_proceso < self.num_procesos):
+            return f"Proceso inválido: {id_proceso!r}."
+        return None
+
+    def _validar_solicitud(self, id_proceso, solicitud):
+        """Comprobaciones previas a la asignación tentativa. Devuelve el error o None."""
+        mensaje_error = self._validar_proceso(id_proceso)
+        if mensaje_error:
+            return mensaje_error
+
+        if len(solicitud) != self.num_recursos:
+            return "Solicitud inválida: cantidad de tipos de recurso incorrecta."
+
+        # 0) Pedir cantidades negativas equivaldría a crear recursos
+        if any(v < 0 for v in solicitud):
+            return "Solicitud inválida: las cantidades no pueden ser negativas."
+
+        # 1) La solicitud no puede exceder lo que le falta (NECESIDAD)
+        if any(solicitud[j] > self.necesidad[id_proceso][j]
+               for j in range(self.num_recursos)):
+            return "La solicitud excede la NECESIDAD restante del proceso."
+
+        # 2) La solicitud no puede exceder los recursos disponibles
+        if any(solicitud[j] > self.disponibles[j]
+               for j in range(self.num_recursos)):
+            return "No hay suficientes recursos DISPONIBLES para la solicitud."
+
+        return None
+
+    def evaluar_solicitudes(self, solicitudes):
+        """
+        Evalúa muchas solicitudes contra el MISMO estado base, sin modificarlo.
+
+        Parámetros:
+            - solicitudes: lista de pares (id_proceso, solicitud)
+
+        Devuelve una lista con un resultado por solicitud, en el mismo orden y
+        con el mismo formato que `solicitar_recursos`:
+            - (True, secuencia_segura) o (False, mensaje_error)
+
+        El estado base se analiza UNA sola vez:
+            - Si es inseguro, ninguna solicitud puede volverlo seguro (conceder
+              nunca aumenta el trabajo disponible), así que se rechazan todas.
+            - Si es seguro con secuencia S, y el proceso ocupa la posición p
+              de S, S sigue siendo segura tras conceder cuando la solicitud cabe
+              en la holgura mínima (trabajo - necesidad) de los procesos que van
+              antes de p. Solo si no cabe se repite la comprobación completa,
+              aplicando la solicitud en el lugar y deshaciéndola después.
+        """
+        es_seguro_base, secuencia_base = self.es_estado_seguro()
+
+        posicion = {}
+        holgura_previa = []
+        if es_seguro_base:
+            # holgura_previa[p][j]: mínimo de (trabajo - necesidad) antes de la posición p
+            trabajo = self.disponibles[:]
+            minimo = [float("inf")] * self.num_recursos
+            for p, i in enumerate(secuencia_base):
+                posicion[i] = p
+                holgura_previa.append(minimo[:])
+                for j in range(self.num_recursos):
+                    minimo[j] = min(minimo[j], trabajo[j] - self.necesidad[i][j])
+                    trabajo[j] += self.asignacion[i][j]
+
+        resultados = []
+        for id_proceso, solicitud in solicitudes:
+            mensaje_error = self._validar_solicitud(id_proceso, solicitud)
+            if mensaje_error:
+                resultados.append((False, mensaje_error))
+                continue
+
+            if not es_seguro_base:
+                resultados.append((False, MENSAJE_ESTADO_INSEGURO))
+                continue
+
+            holgura = holgura_previa[posicion[id_proceso]]
+            if all(solicitud[j] <= holgura[j] for j in range(self.num_recursos)):
+                resultados.append((True, secuencia_base[:]))
+                continue
+
+            # Comprobación completa sobre el estado base, siempre revertida
+            self._aplicar_tentativa(id_proceso, solicitud)
+            es_seguro, secuencia = self.es_estado_seguro()
+            self._deshacer()
+
+            if es_seguro:
+                resultados.append((True, secuencia))
+            else:
+                resultados.append((False, MENSAJE_ESTADO_INSEGURO))
+
+        return resultados
+
+    def _aplicar_tentativa(self, id_proceso, solicitud):
+        """Aplica la solicitud sobre la fila del proceso y la anota en el registro."""
+        fila_asignacion = self.asignacion[id_proceso]
+        fila_necesidad = self.necesidad[id_proceso]
+        for j in range(self.num_recursos):
+            self.disponibles[j] -= solicitud[j]
+            fila_asignacion[j] += solicitud[j]
+            fila_necesidad[j] -= solicitud[j]
+        self._registro_deshacer.append((id_proceso, solicitud))
+        self._sincronizar_fila(id_proceso)
+
+    def _deshacer(self):
+        """Revierte, fila por fila y en orden inverso, las asignaciones tentativas."""
+        while self._registro_deshacer:
+            id_proceso, solicitud = self._registro_deshacer.pop()
+            fila_asignacion = self.asignacion[id_proceso]
+            fila_necesidad = self.necesidad[id_proceso]
+            for j in range(self.num_recursos):
+                self.disponibles[j] += solicitud[j]
+                fila_asignacion[j] -= solicitud[j]
+                fila_necesidad[j] += solicitud[j]
+            self._sincronizar_fila(id_proceso)
+
+    def _sincronizar_fila(self, id_proceso):
+        """Copia al motor de seguridad la fila modificada y el vector de disponibles."""
+        if self._motor_seguridad is not None:
+            self._motor_seguridad.actualizar_fila(
+                id_proceso,
+                self.asignacion[id_proceso],
+                self.necesidad[id_proceso],
+                self.disponibles
+            )
+
+    def liberar_recursos(self, id_proceso, liberacion=None):
+        """
+        Devuelve al sistema recursos que el proceso tiene asignados.
+
+        Parámetros:
+            - id_proceso: índice del proceso que libera
+            - liberacion: lista con lo que devuelve [r0, r1, ...];
+                          None = libera TODO lo asignado (el proceso terminó)
+
+        Devuelve:
+            - (True, None)           si se liberaron
+            - (False, mensaje_error) si la liberación no es válida
+
+        Liberar nunca vuelve inseguro un estado seguro, así que no hace falta
+        comprobar la seguridad.
+        """
+        mensaje_error = self._validar_proceso(id_proceso)
+        if mensaje_error:
+            return False, mensaje_error
+
+        fila_asignacion = self.asignacion[id_proceso]
+        if liberacion is None:
+            liberacion = list(fila_asignacion)
+
+        if len(liberacion) != self.num_recursos:
+            return False, "Liberación inválida: cantidad de tipos de recurso incorrecta."
+        if any(liberacion[j] < 0 or liberacion[j] > fila_asignacion[j]
+               for j in range(self.num_recursos)):
+            return False, "La liberación excede lo que el proceso tiene ASIGNADO."
+
+        fila_necesidad = self.necesidad[id_proceso]
+        for j in range(self.num_recursos):
+            self.disponibles[j] += liberacion[j]
+            fila_asignacion[j] -= liberacion[j]
+            fila_necesidad[j] += liberacion[j]
+        self._sincronizar_fila(id_proceso)
+        return True, None
+
+    def instantanea(self):
+        """
+        Copia del estado que cambia con las solicitudes: (disponibles, asignación,
+        necesidad). Con almacenamiento compacto cada matriz es una copia de buffer.
+        """
+        return (self.disponibles[:], copiar_matriz(self.asignacion),
+                copiar_matriz(self.necesidad))
+
+    def restaurar(self, instantanea):
+        """
+        Vuelve al estado guardado con `instantanea()`. Los motores alternativos
+        no se tocan: quien llama debe sincronizar las filas que cambiaron.
+        """
+        disponibles, asignacion, necesidad = instantanea
+        self.disponibles = disponibles
+        self.asignacion = asignacion
+        self.necesidad = necesidad
+
+    def reiniciar(self, asignacion, demanda_maxima, disponibles):
+        """Reinicia el modelo con nuevos datos de matrices y recursos."""
+        self.__init__(asignacion, demanda_maxima, disponibles,
+                      self.nombres_procesos, self.nombres_recursos, self.motor,
+                      self.transaccional, self.almacenamiento)
@@ -0,0 +1,197 @@
+"""
+Enumeración y conteo de TODAS las secuencias seguras de un estado del banquero.
+
+`es_estado_seguro` devuelve una sola secuencia (la primera que encuentra).
+Para planificación de capacidad interesa saber cuántas hay y poder listarlas
+o muestrearlas. Probar las n! permutaciones es inviable más allá de ~10
+procesos, pero el estado durante la ejecución queda totalmente determinado
+por QUÉ procesos ya terminaron (el trabajo disponible es disponibles + lo
+asignado a los terminados), así que basta con memorizar por la máscara de
+bits de procesos terminados: a lo sumo 2^n estados en vez de n!, y en la
+práctica muchos menos porque solo se visitan las máscaras alcanzables.
+
+Además, como el trabajo solo crece, en cuanto TODOS los pendientes pueden
+ejecutarse cualquier orden de ellos es seguro: la cuenta es k! y las
+secuencias son simples permutaciones, sin bajar más en el árbol.
+"""
+import itertools
+import math
+import random
+
+
+class EnumeradorSecuencias:
+    """
+    Cuenta, lista y muestrea las secuencias seguras del estado ACTUAL de un modelo.
+
+    El enumerador toma una foto del modelo al crearse; si el modelo cambia
+    (solicitudes, liberaciones) hay que crear un enumerador nuevo.
+    """
+    def __init__(self, modelo):
+        self.num_procesos = modelo.num_procesos
+        self.num_recursos = modelo.num_recursos
+        self.necesidad = [tuple(fila) for fila in modelo.necesidad]
+        self.asignacion = [tuple(fila) for fila in modelo.asignacion]
+        self.disponibles = tuple(modelo.disponibles)
+        self.completo = (1 << self.num_procesos) - 1
+
+        # _cuentas[mascara] = cuántas formas hay de terminar a los que faltan
+        self._cuentas = {self.completo: 1}
+
+    def _puede_ejecutar(self, i, trabajo):
+        necesidad = self.necesidad[i]
+        return all(necesidad[j] <= trabajo[j] for j in range(self.num_recursos))
+
+    def _liberar(self, i, trabajo):
+        asignacion = self.asignacion[i]
+        return tuple(trabajo[j] + asignacion[j] for j in range(self.num_recursos))
+
+    def _ejecutables(self, mascara, trabajo):
+        """Procesos pendientes que pueden terminar con el trabajo actual."""
+        return [
+            i for i in range(self.num_procesos)
+            if not mascara >> i & 1 and self._puede_ejecutar(i, trabajo)
+        ]
+
+    def _pendientes(self, mascara):
+        return self.num_procesos - bin(mascara).count("1")
+
+    def _abrir(self, mascara, trabajo):
+        """
+        Marco de la DFS de _contar para `mascara`, o None si su cuenta ya quedó
+        memorizada (todos los pendientes pueden ejecutarse: k!).
+        Marco: [mascara, trabajo, iterador de ejecutables, cuenta acumulada].
+        """
+        ejecutables = self._ejecutables(mascara, trabajo)
+        if len(ejecutables) == self._pendientes(mascara):
+            self._cuentas[mascara] = math.factorial(len(ejecutables))
+            return None
+        return [mascara, trabajo, iter(ejecutables), 0]
+
+    def _contar(self, mascara, trabajo):
+        """
+        Secuencias que completan `mascara`. DFS con pila explícita: la
+        profundidad es el número de procesos y la recursión de Python no
+        llega a los miles.
+        """
+        if mascara not in self._cuentas:
+            marco = self._abrir(mascara, trabajo)
+            pila = [marco] if marco is not None else []
+            while pila:
+                marco = pila[-1]
+                for i in marco[2]:
+                    siguiente = marco[0] | 1 << i
+                    cuenta = self._cuentas.get(siguiente)
+                    if cuenta is None:
+                        hijo = self._abrir(siguiente, self._liberar(i, marco[1]))
+                        if hijo is not None:
+                            pila.append(hijo)
+                            break
+                        cuenta = self._cuentas[siguiente]
+                    marco[3] += cuenta
+                else:
+                    pila.pop()
+                    self._cuentas[marco[0]] = marco[3]
+                    if pila:
+                        pila[-1][3] += marco[3]
+        return self._cuentas[mascara]
+
+    def contar(self):
+        """Número total de secuencias seguras (0 si el estado es inseguro)."""
+        return self._contar(0, self.disponibles)
+
+    @property
+    def estados_memorizados(self):
+        """Cuántas máscaras distintas se han evaluado (mide el costo real)."""
+        return len(self._cuentas)
+
+    def secuencias(self, limite=None):
+        """
+        Genera las secuencias seguras una a una (listas de índices), en orden
+        lexicográfico, sin construirlas todas en memoria. `limite` corta la
+        generación tras ese número de secuencias.
+
+        Las ramas sin ninguna secuencia segura se descartan usando el conteo
+        memorizado, así que cada secuencia cuesta O(n^2 * m) como mucho.
+        """
+        if limite is not None and limite <= 0:
+            return
+        if self.contar() == 0:
+            return
+
+        # DFS con pila explícita (ver _contar); pila[k] guarda los hijos por
+        # probar del prefijo secuencia[:k]
+        producidas = 0
+        secuencia = []
+        pila = []
+        entrada = (0, self.disponibles)
+        while True:
+            if entrada is not None:
+                mascara, trabajo = entrada
+                entrada = None
+                ejecutables = self._ejecutables(mascara, trabajo)
+                if len(ejecutables) < self._pendientes(mascara):
+                    pila.append((mascara, trabajo, iter(ejecutables)))
+                    continue
+                for resto in itertools.permutations(ejecutables):
+                    producidas += 1
+                    yield secuencia + list(resto)
+                    if limite is not None and producidas >= limite:
+                        return
+                if secuencia:
+                    secuencia.pop()
+            if not pila:
+                return
+
+            mascara, trabajo, hijos = pila[-1]
+            for i in hijos:
+                siguiente_trabajo = self._liberar(i, trabajo)
+                siguiente = mascara | 1 << i
+                if self._contar(siguiente, siguiente_trabajo):
+                    secuencia.append(i)
+                    entrada = (siguiente, siguiente_trabajo)
+                    break
+            else:
+                pila.pop()
+                if secuencia:
+                    secuencia.pop()
+
+    def muestrear(self, cantidad, semilla=None):
+        """
+        Devuelve `cantidad` secuencias seguras elegidas al azar de forma UNIFORME
+        entre todas (con reemplazo). En cada paso se elige el siguiente proceso
+        con probabilidad proporcional al número de secuencias que continúan por él.
+        """
+        total = self.contar()
+        if total == 0:
+            return []
+
+        rng = random.Random(semilla)
+        muestras = []
+        for _ in range(cantidad):
+            mascara, trabajo = 0, self.disponibles
+            secuencia = []
+            while mascara != self.completo:
+                ejecutables = self._ejecutables(mascara, trabajo)
+                if len(ejecutables) == self._pendientes(mascara):
+                    rng.shuffle(ejecutables)
+                    secuencia.extend(ejecutables)
+                    break
+                opciones = []
+                for i in ejecutables:
+                    siguiente_trabajo = self._liberar(i, trabajo)
+                    cuenta = self._contar(mascara | 1 << i, siguiente_trabajo)
+                    if cuenta:
+                        opciones.append((cuenta, i, siguiente_trabajo))
+
+                # randrange admite enteros enormes, a diferencia de random.choices
+                tirada = rng.randrange(sum(c for c, _, _ in opciones))
+                for cuenta, i, siguiente_trabajo in opciones:
+                    if tirada < cuenta:
+                        break
+                    tirada -= cuenta
+
+                secuencia.append(i)
+                mascara |= 1 << i
+                trabajo = siguiente_trabajo
+            muestras.append(secuencia)
+        return muestras
@@ -0,0 +1,255 @@
+"""
+Servidor de admisión de recursos basado en el Algoritmo del Banquero.
+
+Escucha en localhost (TCP) o en un socket Unix y habla un protocolo de líneas
+JSON: cada línea es una petición y cada respuesta es otra línea con el mismo
+"id" que la petición.
+
+Peticiones:
+    {"id": 1, "op": "solicitar", "proceso": "P1", "solicitud": [1, 0, 2]}
+    {"id": 2, "op": "liberar",   "proceso": "P1", "liberacion": [1, 0, 0]}
+    {"id": 3, "op": "liberar",   "proceso": "P1"}          (libera todo)
+    {"id": 4, "op": "estado"}
+    {"id": 5, "op": "metricas"}
+
+Las peticiones de todas las conexiones entran a una única cola. Un procesador
+toma lo que haya acumulado (hasta `tam_lote`) y lo resuelve de una vez contra
+el estado ACTUAL del modelo, en orden de llegada; así se evita despertar al
+bucle de eventos por cada petición cuando hay mucha carga.
+
+Uso:
+    python -m simuladores.banquero.servidor data/banquero/estado_ejemplo.json --puerto 8765
+    python -m simuladores.banquero.servidor estado.json --unix /tmp/banquero.sock
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from .archivos import cargar_estado, indice_proceso, validar_cantidades
+from .metricas import percentil
+from .modelo import MOTORES_SEGURIDAD
+
+
+class ServidorAdmision:
+    """
+    Envuelve un ModeloBanquero y atiende solicitudes/liberaciones concurrentes.
+
+    Contadores:
+        - solicitudes, concedidas, rechazadas, liberaciones, errores
+        - lotes procesados y tamaño medio de lote
+        - latencia por petición (desde que llega hasta que se decide), sobre
+          las últimas `ventana_latencias` peticiones
+        - peticiones por segundo desde que arrancó el servidor
+    """
+    def __init__(self, modelo, tam_lote=256, ventana_latencias=10000):
+        self.modelo = modelo
+        self.tam_lote = tam_lote
+
+        self.cola = None
+        self._procesador = None
+
+        self.solicitudes = 0
+        self.concedidas = 0
+        self.rechazadas = 0
+        self.liberaciones = 0
+        self.errores = 0
+        self.lotes = 0
+        self.peticiones_en_lotes = 0
+        self.latencias_us = deque(maxlen=ventana_latencias)
+        self.inicio = time.perf_counter()
+
+    # --- Cola y procesamiento por lotes ---
+
+    def iniciar(self):
+        """Crea la cola y la tarea que la procesa (debe llamarse dentro del bucle)."""
+        self.cola = asyncio.Queue()
+        self.inicio = time.perf_counter()
+        self._procesador = asyncio.create_task(self._procesar_cola())
+
+    async def detener(self):
+        if self._procesador is not None:
+            self._procesador.cancel()
+            try:
+                await self._procesador
+            except asyncio.CancelledError:
+                pass
+
+    async def enviar(self, peticion):
+        """Encola una petición y espera su respuesta."""
+        futuro = asyncio.get_running_loop().create_future()
+        await self.cola.put((peticion, futuro, time.perf_counter()))
+        return await futuro
+
+    async def _procesar_cola(self):
+        while True:
+            lote = [await self.cola.get()]
+            while len(lote) < self.tam_lote and not self.cola.empty():
+                lote.append(self.cola.get_nowait())
+
+            self.lotes += 1
+            self.peticiones_en_lotes += len(lote)
+            for peticion, futuro, llegada in lote:
+                respuesta = self.atender(peticion)
+                self.latencias_us.append((time.perf_counter() - llegada) * 1e6)
+                if not futuro.done():
+                    futuro.set_result(respuesta)
+
+    # --- Operaciones ---
+
+    def atender(self, peticion):
+        """Resuelve una petición contra el estado actual. Nunca lanza excepciones."""
+        respuesta = {"id": peticion.get("id")}
+        op = peticion.get("op")
+        try:
+            if op == "solicitar":
+                id_proceso = indice_proceso(self.modelo, peticion.get("proceso"))
+                solicitud = validar_cantidades(peticion["solicitud"], "solicitud")
+                exito, resultado = self.modelo.solicitar_recursos(id_proceso, solicitud)
+                self.solicitudes += 1
+                respuesta["concedida"] = exito
+                if exito:
+                    self.concedidas += 1
+                    respuesta["secuencia"] = [self.modelo.nombres_procesos[i] for i in resultado]
+                else:
+                    self.rechazadas += 1
+                    respuesta["motivo"] = resultado.split("\n")[0]
+            elif op == "liberar":
+                id_proceso = indice_proceso(self.modelo, peticion.get("proceso"))
+                liberacion = peticion.get("liberacion")
+                if liberacion is not None:
+                    liberacion = validar_cantidades(liberacion, "liberacion")
+                exito, mensaje = self.modelo.liberar_recursos(id_proceso, liberacion)
+                respuesta["liberada"] = exito
+                if exito:
+                    self.liberaciones += 1
+                else:
+                    respuesta["motivo"] = mensaje
+            elif op == "estado":
+                respuesta.update(self.estado())
+            elif op == "metricas":
+                respuesta.update(self.metricas())
+            else:
+                raise ValueError(f"Operación desconocida: {op!r}.")
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            self.errores += 1
+            respuesta["error"] = str(e) or type(e).__name__
+        return respuesta
+
+    def estado(self):
+        return {
+            "nombres_procesos": self.modelo.nombres_procesos,
+            "nombres_recursos": self.modelo.nombres_recursos,
+            "asignacion": [list(fila) for fila in self.modelo.asignacion],
+            "necesidad": [list(fila) for fila in self.modelo.necesidad],
+            "disponibles": list(self.modelo.disponibles),
+        }
+
+    def metricas(self):
+        transcurrido = time.perf_counter() - self.inicio
+        atendidas = self.peticiones_en_lotes
+        latencias = list(self.latencias_us) or [0.0]
+        return {
+            "solicitudes": self.solicitudes,
+            "concedidas": self.concedidas,
+            "rechazadas": self.rechazadas,
+            "liberaciones": self.liberaciones,
+            "errores": self.errores,
+            "lotes": self.lotes,
+            "tam_medio_lote": atendidas / self.lotes if self.lotes else 0.0,
+            "latencia_p50_us": percentil(latencias, 50),
+            "latencia_p99_us": percentil(latencias, 99),
+            "peticiones_por_s": atendidas / transcurrido if transcurrido else 0.0,
+        }
+
+    # --- Conexiones ---
+
+    async def atender_conexion(self, lector, escritor):
+        pendientes = set()
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    peticion = json.loads(linea)
+                    if not isinstance(peticion, dict):
+                        raise ValueError
+                except ValueError:
+                    self.errores += 1
+                    escritor.write(b'{"error": "JSON invalido"}\n')
+                    continue
+                # Cada petición se responde en cuanto se decide; el cliente
+                # puede enviar varias sin esperar (pipelining).
+                tarea = asyncio.create_task(self._responder(peticion, escritor))
+                pendientes.add(tarea)
+                tarea.add_done_callback(pendientes.discard)
+            if pendientes:
+                await asyncio.gather(*pendientes)
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _responder(self, peticion, escritor):
+        respuesta = await self.enviar(peticion)
+        escritor.write((json.dumps(respuesta, ensure_ascii=False) + "\n").encode("utf-8"))
+        await escritor.drain()
+
+
+async def servir(servidor, host="127.0.0.1", puerto=8765, ruta_unix=None, intervalo_metricas=0):
+    servidor.iniciar()
+    if ruta_unix:
+        srv = await asyncio.start_unix_server(servidor.atender_conexion, path=ruta_unix)
+        print(f"Servidor de admisión escuchando en {ruta_unix}")
+    else:
+        srv = await asyncio.start_server(servidor.atender_conexion, host, puerto)
+        print(f"Servidor de admisión escuchando en {host}:{puerto}")
+
+    async def reportar():
+        while True:
+            await asyncio.sleep(intervalo_metricas)
+            print(json.dumps(servidor.metricas(), ensure_ascii=False))
+
+    reporte = asyncio.create_task(reportar()) if intervalo_metricas > 0 else None
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        if reporte is not None:
+            reporte.cancel()
+        await servidor.detener()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m simuladores.banquero.servidor",
+        description="Servidor de admisión de recursos (Algoritmo del Banquero)."
+    )
+    parser.add_argument("estado", help="archivo JSON con el estado inicial")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (en lugar de TCP)")
+    parser.add_argument("--motor", choices=MOTORES_SEGURIDAD, default="numpy")
+    parser.add_argument("--tam-lote", type=int, default=256,
+                        help="máximo de peticiones resueltas por lote")
+    parser.add_argument("--intervalo-metricas", type=float, default=0,
+                        help="segundos entre impresiones de métricas (0 = nunca)")
+    args = parser.parse_args(argv)
+
+    try:
+        modelo, _ = cargar_estado(args.estado, motor=args.motor, transaccional=True)
+    except ValueError as e:
+        parser.exit(2, f"Error: {e}\n")
+
+    servidor = ServidorAdmision(modelo, tam_lote=args.tam_lote)
+    try:
+        asyncio.run(servir(servidor, args.host, args.puerto, args.unix, args.intervalo_metricas))
+    except KeyboardInterrupt:
+        print("\nMétricas finales:")
+        print(json.dumps(servidor.metricas(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+Estructuras de detección de interbloqueos sin interfaz gráfica.
+
+    from simuladores.deteccion import GrafoEspera
+"""
+from .componentes import componentes_fuertemente_conexas
+from .grafo_espera import GrafoEspera
+from .orden_dinamico import OrdenTopologicoDinamico
+from .matricial import DetectorMatricial, procesos_en_interbloqueo
+from .victimas import victimas_de_costo_minimo, victimas_por_componente
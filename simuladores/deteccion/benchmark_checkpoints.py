@@ -0,0 +1,56 @@
+"""
+Ajuste del intervalo de checkpoints para la recuperación por retroceso.
+
+Ejecuta el simulador de detección sin interfaz con recuperación por reinicio
+(referencia) y por retroceso con varios intervalos de checkpoint, y muestra
+en promedio por escenario el trabajo perdido por las víctimas, el trabajo
+conservado gracias a los checkpoints y el costo de tomarlos (estados
+copiados, compartidos y tiempo).
+
+Con intervalos cortos, los MAX_CHECKPOINTS que guarda cada proceso cubren
+poco tiempo y puede que ninguno sea anterior al recurso que rompe el ciclo
+(el retroceso termina en reinicio); con intervalos largos el checkpoint útil
+queda más lejos y se pierde más trabajo.
+
+Uso:
+    python -m simuladores.deteccion.benchmark_checkpoints --intervalos 0.5 1 2 5 10
+"""
+import argparse
+import statistics
+
+from ..simulador_deteccion import MODOS_DETECCION, ConfiguracionSimulador, ejecutar_escenarios
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recuperación por retroceso: intervalo de checkpoints")
+    parser.add_argument("--intervalos", type=float, nargs="+", default=[0.5, 1.0, 2.0, 5.0, 10.0])
+    parser.add_argument("--escenarios", type=int, default=300)
+    parser.add_argument("--modo", choices=MODOS_DETECCION, default="en_linea")
+    parser.add_argument("--procesos", type=int, default=10)
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'recuperación':<22}{'perdido s':>11}{'conservado s':>14}{'retrocesos':>12}"
+          f"{'copias':>9}{'compartidos':>13}{'ms':>8}")
+    casos = [("reinicio", None)] + [("retroceso", intervalo) for intervalo in args.intervalos]
+    for recuperacion, intervalo in casos:
+        configuracion = ConfiguracionSimulador(args.modo, recuperacion=recuperacion)
+        if intervalo is not None:
+            configuracion = configuracion._replace(intervalo_checkpoint_s=intervalo)
+        resultados = ejecutar_escenarios(args.escenarios, configuracion, args.semilla, carpeta=None,
+                                         num_procesos=args.procesos)
+
+        def media(clave):
+            return statistics.mean(r[clave] for r in resultados)
+
+        nombre = recuperacion if intervalo is None else f"{recuperacion} ({intervalo:g} s)"
+        print(f"{nombre:<22}{media('Trabajo Perdido por Víctimas (s)'):>11.2f}"
+              f"{media('Trabajo Conservado por Checkpoints (s)'):>14.2f}"
+              f"{media('Retrocesos a Checkpoint'):>12.2f}"
+              f"{media('Estados Copiados en Checkpoints'):>9.1f}"
+              f"{media('Estados Compartidos en Checkpoints'):>13.1f}"
+              f"{media('Tiempo en Checkpoints (ms)'):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark de la latencia de detección de ciclos a medida que crece el número de procesos.
+
+Compara, por cada evento "un proceso se bloquea" seguido de una detección:
+    - completo:    reconstruir el grafo de espera y llamar a nx.find_cycle
+                   (lo que hacía el simulador originalmente)
+    - incremental: GrafoEspera, búsqueda desde las aristas nuevas
+    - en_linea:    GrafoEspera con orden topológico dinámico
+
+Escenario: cada proceso Pi retiene el recurso Ri. En cada paso un proceso que
+no espera nada pide el recurso de otro al azar; si se forma un ciclo se
+"mata" a uno de sus procesos (deja de esperar) y, de vez en cuando, un
+proceso deja de esperar por su cuenta.
+
+Uso:
+    python -m simuladores.deteccion.benchmark_ciclos --procesos 100 1000 10000
+"""
+import argparse
+import random
+import statistics
+import time
+
+import networkx as nx
+
+from .grafo_espera import GrafoEspera
+
+METODOS = ("completo", "incremental", "en_linea")
+
+
+def ciclo_completo(espera):
+    """Reconstrucción desde cero, como el detector original."""
+    grafo = nx.DiGraph()
+    for proceso, dueno in espera.items():
+        grafo.add_edge(proceso, dueno)
+    try:
+        return [arista[0] for arista in nx.find_cycle(grafo, orientation="original")]
+    except nx.NetworkXNoCycle:
+        return None
+
+
+def ejecutar(metodo, num_procesos, pasos, semilla):
+    """Devuelve las latencias (us) de cada evento + detección y los ciclos encontrados."""
+    rng = random.Random(semilla)
+    grafo = None
+    if metodo != "completo":
+        grafo = GrafoEspera(en_linea=(metodo == "en_linea"))
+        for i in range(num_procesos):
+            grafo.asignar(i, i)
+
+    espera = {}
+    latencias = []
+    ciclos = 0
+    for _ in range(pasos):
+        proceso = rng.randrange(num_procesos)
+        if proceso in espera:
+            continue
+        dueno = rng.randrange(num_procesos - 1)
+        dueno += dueno >= proceso
+
+        inicio = time.perf_counter()
+        espera[proceso] = dueno
+        if grafo is None:
+            ciclo = ciclo_completo(espera)
+        else:
+            grafo.esperar(proceso, dueno, dueno)
+            ciclo = grafo.buscar_ciclo()
+        latencias.append((time.perf_counter() - inicio) * 1e6)
+
+        if ciclo:
+            ciclos += 1
+            victima = rng.choice(ciclo)
+            del espera[victima]
+            if grafo is not None:
+                grafo.cancelar_espera(victima)
+        if espera and rng.random() < 0.1:
+            liberado = rng.choice(list(espera)) if len(espera) < 64 else next(iter(espera))
+            del espera[liberado]
+            if grafo is not None:
+                grafo.cancelar_espera(liberado)
+    return latencias, ciclos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia de detección de ciclos: completo vs incremental vs en línea")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--pasos", type=int, default=5000)
+    parser.add_argument("--pasos-completo", type=int, default=300,
+                        help="pasos para el método completo (es mucho más lento)")
+    parser.add_argument("--metodos", nargs="+", choices=METODOS, default=list(METODOS))
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'procesos':>10}{'método':>14}{'media us':>12}{'p50 us':>10}{'p99 us':>10}{'ciclos':>9}")
+    for num_procesos in args.procesos:
+        for metodo in args.metodos:
+            pasos = args.pasos_completo if metodo == "completo" else args.pasos
+            latencias, ciclos = ejecutar(metodo, num_procesos, pasos, args.semilla)
+            latencias.sort()
+            print(f"{num_procesos:>10}{metodo:>14}"
+                  f"{statistics.mean(latencias):>12.1f}"
+                  f"{latencias[len(latencias) // 2]:>10.1f}"
+                  f"{latencias[int(len(latencias) * 0.99)]:>10.1f}"
+                  f"{ciclos:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Prueba de escala de las colas de espera del simulador de detección.
+
+Con miles de procesos, cada uno pide uno de `--recursos` recursos en orden
+de llegada aleatorio: el primero lo obtiene y el resto se bloquea. Después
+se "drena" el sistema: cada dueño libera su recurso y el siguiente lo
+recibe, hasta que todos los procesos lo han tenido una vez. Se compara:
+    - colas:   SimuladorDeadlock.despertar_bloqueados (cola FIFO por recurso)
+    - barrido: la versión anterior, que recorría todos los procesos en cada
+               liberación y despertaba por orden de índice
+midiendo el tiempo por liberación y cuántas entregas no respetaron el orden
+de llegada.
+
+Uso:
+    python -m simuladores.deteccion.benchmark_colas --procesos 1000 10000
+"""
+import argparse
+from collections import deque
+import random
+import statistics
+import time
+
+from ..simulador_deteccion import SimuladorDeadlock
+
+ESTRATEGIAS = ("colas", "barrido")
+
+
+def despertar_por_barrido(simulador):
+    """Despertar original: recorre todos los procesos bloqueados."""
+    def despertar(recursos_liberados):
+        for p in [p for p in simulador.procesos if p.estado == "Bloqueado"]:
+            if p.solicitando and simulador.recursos.get(p.solicitando) is None:
+                simulador.solicitar_recurso(p, p.solicitando)
+    return despertar
+
+
+def ejecutar(estrategia, num_procesos, num_recursos, max_liberaciones, semilla):
+    """Devuelve (tiempos por liberación en us, entregas fuera de orden, entregas)."""
+    rng = random.Random(semilla)
+    simulador = SimuladorDeadlock(None, archivo_log=None, archivo_metricas=None, num_procesos=num_procesos)
+    if estrategia == "barrido":
+        simulador.despertar_bloqueados = despertar_por_barrido(simulador)
+
+    recursos = [f"R{j}" for j in range(num_recursos)]
+    llegada = {r: deque() for r in recursos}
+    for proceso in rng.sample(simulador.procesos, num_procesos):
+        recurso = rng.choice(recursos)
+        if simulador.recursos[recurso] is not None:
+            llegada[recurso].append(proceso.id)
+        simulador.solicitar_recurso(proceso, recurso)
+
+    duenos = deque(simulador.procesos_por_id[d] for d in (simulador.recursos[r] for r in recursos) if d is not None)
+    tiempos, fuera_de_orden, entregas = [], 0, 0
+    while duenos and len(tiempos) < max_liberaciones:
+        dueno = duenos.popleft()
+        recurso = next(iter(dueno.asignados))
+        inicio = time.perf_counter()
+        simulador.liberar_recursos(dueno)
+        tiempos.append((time.perf_counter() - inicio) * 1e6)
+
+        nuevo = simulador.recursos[recurso]
+        if nuevo is not None:
+            entregas += 1
+            esperado = llegada[recurso].popleft()
+            if nuevo != esperado:
+                fuera_de_orden += 1
+                llegada[recurso].remove(nuevo)
+                llegada[recurso].appendleft(esperado)
+            duenos.append(simulador.procesos_por_id[nuevo])
+    return tiempos, fuera_de_orden, entregas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Colas de espera por recurso vs barrido de procesos")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--esperas", type=int, default=10, help="procesos por recurso (en promedio)")
+    parser.add_argument("--liberaciones", type=int, default=2000,
+                        help="máximo de liberaciones medidas por ejecución")
+    parser.add_argument("--estrategias", nargs="+", choices=ESTRATEGIAS, default=list(ESTRATEGIAS))
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'procesos':>10}{'estrategia':>12}{'media us':>11}{'p99 us':>10}{'entregas':>10}{'fuera de orden':>16}")
+    for num_procesos in args.procesos:
+        num_recursos = max(1, num_procesos // args.esperas)
+        for estrategia in args.estrategias:
+            tiempos, fuera_de_orden, entregas = ejecutar(estrategia, num_procesos, num_recursos,
+                                                         args.liberaciones, args.semilla)
+            tiempos.sort()
+            print(f"{num_procesos:>10}{estrategia:>12}{statistics.mean(tiempos):>11.1f}"
+                  f"{tiempos[int(len(tiempos) * 0.99)]:>10.1f}{entregas:>10}{fuera_de_orden:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark de la detección por matrices con recursos de varias unidades.
+
+Compara la versión vectorizada (procesos_en_interbloqueo) con el bucle clásico
+en Python puro sobre estados aleatorios:
+    - aleatorio: asignaciones y solicitudes al azar (suele resolverse en pocas rondas)
+    - cadena:    cada proceso solo puede terminar después del siguiente
+                 (peor caso: una ronda por proceso, n recorridos en Python)
+
+Uso:
+    python -m simuladores.deteccion.benchmark_matricial --procesos 1000 5000 --recursos 20
+"""
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+
+from .matricial import procesos_en_interbloqueo
+
+ESCENARIOS = ("aleatorio", "cadena")
+
+
+def generar_estado(rng, escenario, num_procesos, num_recursos, unidades):
+    """Devuelve (asignacion, solicitud, disponibles) como arreglos de NumPy."""
+    asignacion = np.zeros((num_procesos, num_recursos), dtype=np.int64)
+    solicitud = np.zeros((num_procesos, num_recursos), dtype=np.int64)
+
+    if escenario == "aleatorio":
+        libres = np.full(num_recursos, unidades, dtype=np.int64)
+        for i in range(num_procesos):
+            j = rng.randrange(num_recursos)
+            if libres[j]:
+                cantidad = rng.randint(1, min(3, int(libres[j])))
+                asignacion[i, j] = cantidad
+                libres[j] -= cantidad
+            if rng.random() < 0.5:
+                solicitud[i, rng.randrange(num_recursos)] = rng.randint(1, 3)
+        return asignacion, solicitud, libres
+
+    # Cadena: todos retienen 1 unidad del recurso 0 y el proceso i espera
+    # n - i unidades más; solo hay una unidad libre, así que cada proceso solo
+    # puede terminar después de todos los de índice mayor (uno por ronda)
+    asignacion[:, 0] = 1
+    solicitud[:, 0] = np.arange(num_procesos, 0, -1)
+    disponibles = np.zeros(num_recursos, dtype=np.int64)
+    disponibles[0] = 1
+    return asignacion, solicitud, disponibles
+
+
+def detectar_python(asignacion, solicitud, disponibles):
+    """Algoritmo clásico, proceso por proceso, sobre listas."""
+    asignacion, solicitud = asignacion.tolist(), solicitud.tolist()
+    trabajo = disponibles.tolist()
+    num_recursos = len(trabajo)
+    terminado = [not any(fila) for fila in asignacion]
+    hubo_cambio = True
+    while hubo_cambio:
+        hubo_cambio = False
+        for i, fila in enumerate(solicitud):
+            if not terminado[i] and all(fila[j] <= trabajo[j] for j in range(num_recursos)):
+                terminado[i] = True
+                hubo_cambio = True
+                for j in range(num_recursos):
+                    trabajo[j] += asignacion[i][j]
+    return [i for i, t in enumerate(terminado) if not t]
+
+
+def medir(funcion, estado, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(*estado)
+        tiempos.append((time.perf_counter() - inicio) * 1e3)
+    return statistics.median(tiempos), len(resultado)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detección por matrices: NumPy vs Python puro")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--recursos", type=int, default=20)
+    parser.add_argument("--unidades", type=int, default=50, help="unidades por tipo de recurso")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semilla)
+    print(f"{'procesos':>10}{'escenario':>12}{'numpy ms':>11}{'python ms':>11}{'bloqueados':>12}")
+    for num_procesos in args.procesos:
+        for escenario in ESCENARIOS:
+            estado = generar_estado(rng, escenario, num_procesos, args.recursos, args.unidades)
+            ms_numpy, bloqueados = medir(procesos_en_interbloqueo, estado, args.repeticiones)
+            ms_python, bloqueados_python = medir(detectar_python, estado, 1)
+            assert bloqueados == bloqueados_python
+            print(f"{num_procesos:>10}{escenario:>12}{ms_numpy:>11.2f}{ms_python:>11.2f}{bloqueados:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Comparación de políticas de detección: costo del detector vs latencia.
+
+Ejecuta el simulador de detección sin interfaz con cada política y muestra,
+en promedio por escenario, cuántas veces corrió el detector, su tiempo de
+CPU y la latencia de detección (tiempo simulado desde que se forma un
+interbloqueo hasta que se encuentra).
+
+Uso:
+    python -m simuladores.deteccion.benchmark_politicas --escenarios 500 --modo incremental
+"""
+import argparse
+import statistics
+
+from ..simulador_deteccion import MODOS_DETECCION, ConfiguracionSimulador, ejecutar_escenarios
+
+# (política, opciones) que se comparan por defecto
+CONFIGURACIONES = (
+    ("cada_paso", {}),
+    ("cada_k", {"k": 3}),
+    ("cada_k", {"k": 6}),
+    ("temporizador", {"intervalo_s": 2.0}),
+    ("temporizador", {"intervalo_s": 5.0}),
+    ("adaptativa", {}),
+    ("adaptativa", {"umbral_bloqueados": 0.5, "umbral_espera_s": 5.0}),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Políticas de detección: CPU del detector vs latencia")
+    parser.add_argument("--escenarios", type=int, default=300)
+    parser.add_argument("--modo", choices=MODOS_DETECCION, default="incremental")
+    parser.add_argument("--procesos", type=int, default=10)
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'política':<48}{'detecciones':>12}{'CPU ms':>9}{'latencia s':>12}{'lat. máx s':>12}")
+    for politica, opciones in CONFIGURACIONES:
+        configuracion = ConfiguracionSimulador(args.modo, politica_deteccion=politica, opciones_politica=opciones)
+        resultados = ejecutar_escenarios(args.escenarios, configuracion, args.semilla, carpeta=None,
+                                         num_procesos=args.procesos)
+
+        def media(clave):
+            return statistics.mean(r[clave] for r in resultados)
+
+        print(f"{resultados[0]['Política de Detección']:<48}{media('Pasos de Detección'):>12.1f}"
+              f"{media('Tiempo de CPU en Detección (ms)'):>9.3f}"
+              f"{media('Latencia de Detección Media (s)'):>12.2f}"
+              f"{media('Latencia de Detección Máxima (s)'):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark de la selección de víctimas: criterio clásico vs costo mínimo.
+
+En el simulador cada proceso espera un único recurso, así que sus ciclos no
+comparten procesos y ambos criterios eligen igual. Aquí se generan grafos de
+espera donde cada proceso espera a varios (recursos con varias unidades o
+peticiones simultáneas), de modo que los ciclos se solapan. Cada proceso
+tiene recursos retenidos y trabajo realizado al azar, y se compara:
+    - clásico:      una víctima por componente (menos recursos), ronda tras ronda
+    - costo mínimo: victimas_de_costo_minimo con costo = trabajo realizado
+midiendo víctimas, trabajo perdido y tiempo de cálculo.
+
+Uso:
+    python -m simuladores.deteccion.benchmark_victimas --procesos 10 100 1000 --esperas 2
+"""
+import argparse
+import random
+import statistics
+import time
+
+from .victimas import costo_total, victimas_de_costo_minimo, victimas_por_componente
+
+
+def generar_grafo(rng, num_procesos, esperas):
+    """Devuelve (sucesores, recursos_retenidos, trabajo) al azar."""
+    sucesores = {
+        p: rng.sample([q for q in range(num_procesos) if q != p], min(esperas, num_procesos - 1))
+        for p in range(num_procesos)
+    }
+    recursos = {p: rng.randint(1, 4) for p in range(num_procesos)}
+    trabajo = {p: round(rng.uniform(0, 30), 1) for p in range(num_procesos)}
+    return sucesores, recursos, trabajo
+
+
+def comparar(rng, num_procesos, esperas):
+    sucesores, recursos, trabajo = generar_grafo(rng, num_procesos, esperas)
+
+    inicio = time.perf_counter()
+    clasicas = victimas_por_componente(sucesores, sucesores, recursos.__getitem__)
+    ms_clasico = (time.perf_counter() - inicio) * 1e3
+
+    inicio = time.perf_counter()
+    minimas = victimas_de_costo_minimo(sucesores, sucesores, trabajo, recursos.__getitem__)
+    ms_minimo = (time.perf_counter() - inicio) * 1e3
+
+    return {
+        "victimas_clasico": len(clasicas),
+        "victimas_minimo": len(minimas),
+        "trabajo_clasico": costo_total(clasicas, trabajo),
+        "trabajo_minimo": costo_total(minimas, trabajo),
+        "ms_clasico": ms_clasico,
+        "ms_minimo": ms_minimo,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Selección de víctimas: criterio clásico vs costo mínimo")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--esperas", type=int, default=2, help="procesos a los que espera cada proceso")
+    parser.add_argument("--grafos", type=int, default=20, help="grafos al azar por tamaño")
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semilla)
+    print(f"{'procesos':>10}{'víctimas clás.':>16}{'víctimas mín.':>15}"
+          f"{'trabajo clás.':>15}{'trabajo mín.':>14}{'ahorro':>9}{'ms clás.':>10}{'ms mín.':>10}")
+    for num_procesos in args.procesos:
+        filas = [comparar(rng, num_procesos, args.esperas) for _ in range(args.grafos)]
+
+        def media(clave):
+            return statistics.mean(fila[clave] for fila in filas)
+
+        ahorro = 1 - media("trabajo_minimo") / media("trabajo_clasico") if media("trabajo_clasico") else 0.0
+        print(f"{num_procesos:>10}{media('victimas_clasico'):>16.1f}{media('victimas_minimo'):>15.1f}"
+              f"{media('trabajo_clasico'):>15.1f}{media('trabajo_minimo'):>14.1f}{ahorro:>9.0%}"
+              f"{media('ms_clasico'):>10.2f}{media('ms_minimo'):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Componentes fuertemente conexas (Tarjan, iterativo) del grafo de espera.
+
+Cada componente con más de un proceso es un interbloqueo independiente: sus
+procesos se esperan entre sí y ninguno puede avanzar. Calcularlas todas en
+tiempo lineal permite resolver todos los interbloqueos de una sola vez, en
+lugar de encontrar y resolver un ciclo por vuelta.
+"""
+
+
+def componentes_fuertemente_conexas(sucesores, nodos=None):
+    """
+    `sucesores`: dict nodo -> iterable de nodos. Devuelve una lista de
+    componentes (listas de nodos), en orden topológico inverso.
+    Sin recursión, para no chocar con el límite de Python en grafos grandes.
+    """
+    if nodos is None:
+        nodos = list(sucesores)
+
+    indice = {}
+    bajo = {}
+    pila = []
+    en_pila = set()
+    componentes = []
+    contador = 0
+
+    for raiz in nodos:
+        if raiz in indice:
+            continue
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila.add(raiz)
+        trabajo = [(raiz, iter(sucesores.get(raiz, ())))]
+
+        while trabajo:
+            nodo, hijos = trabajo[-1]
+            for hijo in hijos:
+                if hijo not in indice:
+                    indice[hijo] = bajo[hijo] = contador
+                    contador += 1
+                    pila.append(hijo)
+                    en_pila.add(hijo)
+                    trabajo.append((hijo, iter(sucesores.get(hijo, ()))))
+                    break
+                if hijo in en_pila:
+                    bajo[nodo] = min(bajo[nodo], indice[hijo])
+            else:
+                trabajo.pop()
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    bajo[padre] = min(bajo[padre], bajo[nodo])
+                if bajo[nodo] == indice[nodo]:
+                    componente = []
+                    while True:
+                        miembro = pila.pop()
+                        en_pila.discard(miembro)
+                        componente.append(miembro)
+                        if miembro == nodo:
+                            break
+                    componentes.append(componente)
+
+    return componentes
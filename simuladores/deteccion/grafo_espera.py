@@ -0,0 +1,212 @@
+"""
+Grafo de espera (proceso → proceso) mantenido de forma incremental.
+
+En lugar de reconstruir el grafo completo a partir de la tabla de procesos en
+cada paso, el simulador avisa de cada evento (un proceso se bloquea, recibe un
+recurso, lo libera o deja de esperar) y aquí solo se tocan las aristas
+afectadas. Con recursos de una sola instancia hay una arista P → Q cuando P
+espera un recurso que retiene Q.
+
+Un ciclo solo puede aparecer al añadir una arista, así que la búsqueda de
+ciclos parte únicamente de los orígenes de las aristas añadidas desde la
+última búsqueda (la "región afectada"), no de todo el grafo.
+
+Con `en_linea=True` la pregunta "¿esta arista cierra un ciclo?" se responde
+en el momento de insertarla, manteniendo un orden topológico dinámico
+(ver orden_dinamico.py). Las aristas que cerrarían un ciclo quedan "diferidas"
+junto con el ciclo que cierran; hay interbloqueo si y solo si hay alguna
+diferida, así que buscar_ciclo es O(1).
+"""
+from collections import defaultdict
+
+from .componentes import componentes_fuertemente_conexas
+from .orden_dinamico import OrdenTopologicoDinamico
+
+
+class GrafoEspera:
+    """
+    Eventos:
+        - esperar(pid, recurso, dueno): pid se bloquea esperando `recurso`.
+        - asignar(pid, recurso): `recurso` pasa a ser de pid.
+        - liberar(pid, recurso): pid suelta `recurso` (queda libre).
+        - cancelar_espera(pid): pid deja de esperar (p. ej. al reiniciarse).
+
+    Contadores (por paso, ver tomar_contadores):
+        - aristas_modificadas: aristas añadidas o quitadas por los eventos.
+        - aristas_examinadas: aristas recorridas al buscar ciclos.
+    """
+    def __init__(self, en_linea=False):
+        self.sucesores = defaultdict(set)
+        self.predecesores = defaultdict(set)
+        self.esperando = defaultdict(set)   # recurso -> pids que lo esperan
+        self.recurso_esperado = {}          # pid -> recurso que espera
+
+        # Orígenes de aristas nuevas desde los que aún no se ha descartado un ciclo
+        self.pendientes = set()
+
+        # Modo en línea: el orden topológico guarda solo aristas que no cierran
+        # ciclos; las demás quedan en `diferidas` con el ciclo que cierran
+        self.orden = OrdenTopologicoDinamico() if en_linea else None
+        self.diferidas = {}
+
+        self.aristas_modificadas = 0
+        self.aristas_examinadas = 0
+
+    # --- Aristas ---
+
+    def _agregar_arista(self, origen, destino):
+        if destino in self.sucesores[origen]:
+            return
+        self.sucesores[origen].add(destino)
+        self.predecesores[destino].add(origen)
+        self.aristas_modificadas += 1
+        if self.orden is None:
+            self.pendientes.add(origen)
+        else:
+            self._insertar_en_orden(origen, destino)
+
+    def _quitar_arista(self, origen, destino):
+        sucesores = self.sucesores.get(origen)
+        if not sucesores or destino not in sucesores:
+            return
+        sucesores.discard(destino)
+        if not sucesores:
+            del self.sucesores[origen]
+        predecesores = self.predecesores[destino]
+        predecesores.discard(origen)
+        if not predecesores:
+            del self.predecesores[destino]
+        self.aristas_modificadas += 1
+        if self.orden is not None and self.diferidas.pop((origen, destino), None) is None:
+            self.orden.quitar_arista(origen, destino)
+            self._reintentar_diferidas(origen)
+
+    def _insertar_en_orden(self, origen, destino):
+        ciclo = self.orden.agregar_arista(origen, destino)
+        if ciclo is not None:
+            self.diferidas[(origen, destino)] = ciclo
+
+    def _reintentar_diferidas(self, nodo):
+        """
+        Tras quitar una arista que sale de `nodo`, las diferidas cuyo ciclo
+        pasaba por él pueden haber dejado de cerrar un ciclo: se reintentan.
+        """
+        for arista, ciclo in list(self.diferidas.items()):
+            if nodo in ciclo:
+                del self.diferidas[arista]
+                self._insertar_en_orden(*arista)
+
+    @property
+    def num_aristas(self):
+        return sum(len(s) for s in self.sucesores.values())
+
+    def aristas(self):
+        for origen, sucesores in self.sucesores.items():
+            for destino in sucesores:
+                yield origen, destino
+
+    # --- Eventos del simulador ---
+
+    def esperar(self, pid, recurso, dueno):
+        if self.recurso_esperado.get(pid) != recurso:
+            self.cancelar_espera(pid)
+            self.recurso_esperado[pid] = recurso
+            self.esperando[recurso].add(pid)
+        if dueno is not None and dueno != pid:
+            self._agregar_arista(pid, dueno)
+
+    def asignar(self, pid, recurso):
+        if self.recurso_esperado.get(pid) == recurso:
+            self.cancelar_espera(pid)
+        for otro in self.esperando.get(recurso, ()):
+            if otro != pid:
+                self._agregar_arista(otro, pid)
+
+    def liberar(self, pid, recurso):
+        for otro in self.esperando.get(recurso, ()):
+            self._quitar_arista(otro, pid)
+
+    def cancelar_espera(self, pid):
+        recurso = self.recurso_esperado.pop(pid, None)
+        if recurso is None:
+            return
+        esperando = self.esperando[recurso]
+        esperando.discard(pid)
+        if not esperando:
+            del self.esperando[recurso]
+        for destino in list(self.sucesores.get(pid, ())):
+            self._quitar_arista(pid, destino)
+
+    # --- Detección ---
+
+    def buscar_ciclo(self):
+        """
+        Devuelve la lista de pids de un ciclo, en orden, o None.
+
+        En modo en línea basta con mirar las aristas diferidas. Si no, solo se
+        exploran los caminos que salen de la región afectada. Un origen se da
+        por revisado cuando desde él no se alcanza ningún ciclo; si se
+        encuentra uno, sigue pendiente hasta que el ciclo se rompa.
+        """
+        if self.orden is not None:
+            for ciclo in self.diferidas.values():
+                return ciclo[:]
+            return None
+
+        explorados = set()
+        for origen in list(self.pendientes):
+            ciclo = self._buscar_desde(origen, explorados)
+            if ciclo is not None:
+                return ciclo
+            self.pendientes.discard(origen)
+        return None
+
+    def componentes_en_interbloqueo(self):
+        """
+        Todos los interbloqueos a la vez: las componentes fuertemente conexas
+        con más de un proceso, en tiempo lineal en el tamaño del grafo.
+        """
+        self.aristas_examinadas += self.num_aristas
+        return [
+            componente
+            for componente in componentes_fuertemente_conexas(self.sucesores)
+            if len(componente) > 1
+        ]
+
+    def _buscar_desde(self, origen, explorados):
+        """DFS iterativa; `explorados` son nodos desde los que ya no hay ciclo."""
+        if origen in explorados:
+            return None
+        camino = [origen]
+        posicion = {origen: 0}
+        iteradores = [iter(self.sucesores.get(origen, ()))]
+        while iteradores:
+            siguiente = next(iteradores[-1], None)
+            if siguiente is None:
+                nodo = camino.pop()
+                del posicion[nodo]
+                explorados.add(nodo)
+                iteradores.pop()
+                continue
+            self.aristas_examinadas += 1
+            if siguiente in posicion:
+                return camino[posicion[siguiente]:]
+            if siguiente in explorados:
+                continue
+            posicion[siguiente] = len(camino)
+            camino.append(siguiente)
+            iteradores.append(iter(self.sucesores.get(siguiente, ())))
+        return None
+
+    def tomar_contadores(self):
+        """Devuelve los contadores acumulados desde la última llamada y los reinicia."""
+        contadores = {
+            "aristas_modificadas": self.aristas_modificadas,
+            "aristas_examinadas": self.aristas_examinadas,
+        }
+        if self.orden is not None:
+            contadores["aristas_examinadas"] += self.orden.aristas_examinadas
+            self.orden.aristas_examinadas = 0
+        self.aristas_modificadas = 0
+        self.aristas_examinadas = 0
+        return contadores
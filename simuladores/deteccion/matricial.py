@@ -0,0 +1,212 @@
+"""
+Detección de interbloqueos por matrices (Coffman / Shoshani) para recursos
+con VARIAS unidades, donde un ciclo en el grafo de espera no basta para
+afirmar que hay interbloqueo.
+
+    ASIGNACIÓN[i][j]  unidades del recurso j que retiene el proceso i
+    SOLICITUD[i][j]   unidades del recurso j que el proceso i espera
+    DISPONIBLES[j]    unidades libres del recurso j
+
+Se simula que todo proceso cuya SOLICITUD cabe en el trabajo disponible
+termina y devuelve su ASIGNACIÓN; los que nunca pueden terminar están en
+interbloqueo. Cada ronda compara de una vez a todos los pendientes (NumPy),
+así que una pasada sobre miles de procesos tarda milisegundos; si hacen falta
+muchas rondas (cadenas de espera largas) se continúa con un índice ordenado
+por recurso.
+
+Ojo: aquí "en interbloqueo" significa "no puede terminar nunca", lo que
+incluye a los procesos que solo esperan DETRÁS de un interbloqueo (piden algo
+que retiene uno del ciclo) sin formar parte de él. Para elegir víctimas,
+componentes_en_interbloqueo se queda con las componentes fuertemente conexas
+del grafo de espera entre esos procesos.
+"""
+import numpy as np
+
+from .componentes import componentes_fuertemente_conexas
+
+# Si tras este número de rondas aún quedan pendientes, se pasa al método indexado
+RONDAS_ANTES_DE_INDEXAR = 8
+
+
+def procesos_en_interbloqueo(asignacion, solicitud, disponibles):
+    """
+    Índices de los procesos en interbloqueo (arreglo de NumPy, puede estar vacío).
+    Los procesos sin recursos asignados no pueden formar parte de uno y se
+    dan por terminados desde el principio.
+    """
+    asignacion = np.asarray(asignacion)
+    solicitud = np.asarray(solicitud)
+    trabajo = np.array(disponibles, dtype=np.int64)
+
+    pendientes = np.flatnonzero(asignacion.any(axis=1))
+    rondas = 0
+    while pendientes.size:
+        if rondas == RONDAS_ANTES_DE_INDEXAR:
+            return _terminar_con_indice(asignacion[pendientes], solicitud[pendientes],
+                                        trabajo, pendientes)
+        pueden = np.all(solicitud[pendientes] <= trabajo, axis=1)
+        if not pueden.any():
+            break
+        trabajo += asignacion[pendientes[pueden]].sum(axis=0)
+        pendientes = pendientes[~pueden]
+        rondas += 1
+    return pendientes
+
+
+def _terminar_con_indice(asignacion, solicitud, trabajo, pendientes):
+    """
+    Resto de la detección cuando hacen falta muchas rondas (cadenas largas, en
+    las que cada ronda libera a un solo proceso y repetir la comparación
+    completa costaría O(n^2 * m)).
+
+    Por cada recurso se ordenan los pendientes por su solicitud y un cursor
+    marca hasta dónde alcanza el trabajo; cada proceso cuenta cuántos recursos
+    aún no le alcanzan. Al crecer el trabajo de un recurso solo se avanza su
+    cursor, así que cada par (proceso, recurso) se toca una sola vez. Aquí
+    cada paso libera a pocos procesos, así que el bucle es en Python puro
+    (más barato que varias llamadas a NumPy por paso).
+    """
+    num_pendientes, num_recursos = solicitud.shape
+    orden = np.argsort(solicitud, axis=0, kind="stable")
+    columnas_orden = orden.T.tolist()
+    columnas_ordenadas = np.take_along_axis(solicitud, orden, axis=0).T.tolist()
+    trabajo = trabajo.tolist()
+    cursores = [
+        int(np.searchsorted(columnas_ordenadas[j], trabajo[j], side="right")) for j in range(num_recursos)
+    ]
+    faltantes = (solicitud > np.array(trabajo)).sum(axis=1).tolist()
+    filas_asignacion = asignacion.tolist()
+
+    terminado = [False] * num_pendientes
+    listos = [k for k in range(num_pendientes) if faltantes[k] == 0]
+    while listos:
+        k = listos.pop()
+        terminado[k] = True
+        for j, cantidad in enumerate(filas_asignacion[k]):
+            if not cantidad:
+                continue
+            trabajo[j] += cantidad
+            columna, cursor = columnas_ordenadas[j], cursores[j]
+            while cursor < num_pendientes and columna[cursor] <= trabajo[j]:
+                cubierto = columnas_orden[j][cursor]
+                faltantes[cubierto] -= 1
+                if faltantes[cubierto] == 0:
+                    listos.append(cubierto)
+                cursor += 1
+            cursores[j] = cursor
+
+    return pendientes[~np.array(terminado, dtype=bool)]
+
+
+class DetectorMatricial:
+    """
+    Mantiene ASIGNACIÓN / SOLICITUD / DISPONIBLES a partir de los eventos del
+    simulador, con la misma interfaz que GrafoEspera:
+        esperar, asignar, liberar, cancelar_espera, buscar_ciclo,
+        componentes_en_interbloqueo, tomar_contadores
+
+    Para los contadores, cada celda distinta de cero equivale a una arista del
+    grafo de asignación (solicitud P → R, asignación R → P): "modificadas" son
+    las celdas actualizadas y "examinadas" las comparadas al detectar.
+    """
+    def __init__(self, procesos, recursos, unidades=None):
+        self.procesos = list(procesos)
+        self.indice_proceso = {pid: i for i, pid in enumerate(self.procesos)}
+        self.indice_recurso = {r: j for j, r in enumerate(recursos)}
+        num_procesos, num_recursos = len(self.procesos), len(self.indice_recurso)
+
+        if unidades is None:
+            unidades = [1] * num_recursos
+        elif isinstance(unidades, dict):
+            unidades = [unidades.get(r, 1) for r in recursos]
+
+        self.asignacion = np.zeros((num_procesos, num_recursos), dtype=np.int64)
+        self.solicitud = np.zeros((num_procesos, num_recursos), dtype=np.int64)
+        self.disponibles = np.array(unidades, dtype=np.int64)
+
+        self.aristas_modificadas = 0
+        self.aristas_examinadas = 0
+
+    # --- Eventos del simulador ---
+
+    def esperar(self, pid, recurso, dueno=None, cantidad=1):
+        i, j = self.indice_proceso[pid], self.indice_recurso[recurso]
+        self.solicitud[i, j] = cantidad
+        self.aristas_modificadas += 1
+
+    def asignar(self, pid, recurso, cantidad=1):
+        i, j = self.indice_proceso[pid], self.indice_recurso[recurso]
+        self.asignacion[i, j] += cantidad
+        self.disponibles[j] -= cantidad
+        self.solicitud[i, j] = max(0, self.solicitud[i, j] - cantidad)
+        self.aristas_modificadas += 1
+
+    def liberar(self, pid, recurso, cantidad=None):
+        i, j = self.indice_proceso[pid], self.indice_recurso[recurso]
+        if cantidad is None:
+            cantidad = self.asignacion[i, j]
+        self.asignacion[i, j] -= cantidad
+        self.disponibles[j] += cantidad
+        self.aristas_modificadas += 1
+
+    def cancelar_espera(self, pid):
+        i = self.indice_proceso[pid]
+        if self.solicitud[i].any():
+            self.solicitud[i] = 0
+            self.aristas_modificadas += 1
+
+    # --- Detección ---
+
+    def buscar_ciclo(self):
+        """Procesos en interbloqueo (no necesariamente un único ciclo), o None."""
+        self.aristas_examinadas += int(np.count_nonzero(self.solicitud))
+        bloqueados = procesos_en_interbloqueo(self.asignacion, self.solicitud, self.disponibles)
+        if not bloqueados.size:
+            return None
+        return [self.procesos[i] for i in bloqueados]
+
+    def componentes_en_interbloqueo(self, bloqueados=None):
+        """
+        Los ciclos de espera entre los procesos que no pueden terminar: las
+        componentes fuertemente conexas del grafo P_i -> P_k (P_i pide un
+        recurso del que P_k retiene unidades, ambos sin poder terminar) con más
+        de un proceso o con un lazo. Los que solo esperan detrás de un ciclo
+        quedan fuera, así que matar a uno de cada componente sí libera algo
+        que los demás esperan.
+        Si no hay ciclo (p. ej. alguien pide más unidades de las que existen)
+        se devuelven todos los bloqueados como una sola componente.
+
+        `bloqueados`: lo que acaba de devolver buscar_ciclo, para no repetir
+        la reducción de Coffman; por defecto se calcula aquí.
+        """
+        if bloqueados is None:
+            self.aristas_examinadas += int(np.count_nonzero(self.solicitud))
+            bloqueados = procesos_en_interbloqueo(self.asignacion, self.solicitud, self.disponibles)
+        else:
+            bloqueados = np.array([self.indice_proceso[pid] for pid in bloqueados], dtype=np.intp)
+        if not bloqueados.size:
+            return []
+
+        retienen = {}
+        for k, j in zip(*np.nonzero(self.asignacion[bloqueados])):
+            retienen.setdefault(j, []).append(k)
+        sucesores = {}
+        for i, j in zip(*np.nonzero(self.solicitud[bloqueados])):
+            sucesores.setdefault(i, set()).update(retienen.get(j, ()))
+        self.aristas_examinadas += sum(len(destinos) for destinos in sucesores.values())
+
+        componentes = [
+            [self.procesos[bloqueados[k]] for k in componente]
+            for componente in componentes_fuertemente_conexas(sucesores, range(bloqueados.size))
+            if len(componente) > 1 or componente[0] in sucesores.get(componente[0], ())
+        ]
+        return componentes or [[self.procesos[i] for i in bloqueados]]
+
+    def tomar_contadores(self):
+        contadores = {
+            "aristas_modificadas": self.aristas_modificadas,
+            "aristas_examinadas": self.aristas_examinadas,
+        }
+        self.aristas_modificadas = 0
+        self.aristas_examinadas = 0
+        return contadores
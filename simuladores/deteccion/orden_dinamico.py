@@ -0,0 +1,102 @@
+"""
+Orden topológico dinámico (Pearce–Kelly) para detectar ciclos EN LÍNEA.
+
+Se mantiene un orden `orden[nodo]` tal que toda arista u → v cumple
+orden[u] < orden[v]. Al insertar u → v:
+    - si ya se cumple, no hay nada que hacer (O(1));
+    - si no, solo pueden estar afectados los nodos con orden entre
+      orden[v] y orden[u]: se busca hacia adelante desde v sin salir de esa
+      franja; si se llega a u, la arista cerraría un ciclo (y se devuelve);
+      si no, se busca hacia atrás desde u y se reasignan los órdenes de los
+      nodos visitados para que u quede antes que v.
+El costo depende del tamaño de la región afectada, no del grafo completo.
+Quitar aristas nunca invalida el orden.
+"""
+from collections import defaultdict
+
+
+class OrdenTopologicoDinamico:
+    """Grafo dirigido acíclico que rechaza (y reporta) las aristas que cerrarían un ciclo."""
+    def __init__(self):
+        self.orden = {}
+        self.sucesores = defaultdict(set)
+        self.predecesores = defaultdict(set)
+        self._siguiente_orden = 0
+        self.aristas_examinadas = 0
+
+    def _registrar(self, nodo):
+        if nodo not in self.orden:
+            self.orden[nodo] = self._siguiente_orden
+            self._siguiente_orden += 1
+
+    def agregar_arista(self, origen, destino):
+        """
+        Inserta origen → destino si no cierra un ciclo y devuelve None. Si lo
+        cierra, NO la inserta y devuelve el ciclo como lista de nodos en orden
+        [destino, ..., origen] (la arista origen → destino lo completa).
+        """
+        if origen == destino:
+            return [origen]
+        self._registrar(origen)
+        self._registrar(destino)
+        if destino in self.sucesores[origen]:
+            return None
+
+        inferior, superior = self.orden[destino], self.orden[origen]
+        if inferior < superior:
+            ciclo, adelante = self._buscar_adelante(destino, origen, superior)
+            if ciclo is not None:
+                return ciclo
+            atras = self._buscar_atras(origen, inferior)
+            self._reordenar(atras, adelante)
+
+        self.sucesores[origen].add(destino)
+        self.predecesores[destino].add(origen)
+        return None
+
+    def quitar_arista(self, origen, destino):
+        sucesores = self.sucesores.get(origen)
+        if sucesores and destino in sucesores:
+            sucesores.discard(destino)
+            self.predecesores[destino].discard(origen)
+
+    def _buscar_adelante(self, inicio, objetivo, superior):
+        """Nodos alcanzables desde `inicio` con orden <= superior; ciclo si se llega a `objetivo`."""
+        padre = {inicio: None}
+        pila = [inicio]
+        while pila:
+            nodo = pila.pop()
+            for siguiente in self.sucesores.get(nodo, ()):
+                self.aristas_examinadas += 1
+                if siguiente == objetivo:
+                    ciclo = [nodo]
+                    while padre[ciclo[-1]] is not None:
+                        ciclo.append(padre[ciclo[-1]])
+                    ciclo.reverse()
+                    ciclo.append(objetivo)
+                    return ciclo, None
+                if siguiente not in padre and self.orden[siguiente] < superior:
+                    padre[siguiente] = nodo
+                    pila.append(siguiente)
+        return None, list(padre)
+
+    def _buscar_atras(self, inicio, inferior):
+        """Nodos que llegan a `inicio` con orden > inferior."""
+        visitados = {inicio}
+        pila = [inicio]
+        while pila:
+            nodo = pila.pop()
+            for anterior in self.predecesores.get(nodo, ()):
+                self.aristas_examinadas += 1
+                if anterior not in visitados and self.orden[anterior] > inferior:
+                    visitados.add(anterior)
+                    pila.append(anterior)
+        return list(visitados)
+
+    def _reordenar(self, atras, adelante):
+        """Los que llegan a origen pasan antes que los alcanzables desde destino, reusando sus órdenes."""
+        atras.sort(key=self.orden.__getitem__)
+        adelante.sort(key=self.orden.__getitem__)
+        posiciones = sorted(self.orden[nodo] for nodo in atras + adelante)
+        for nodo, posicion in zip(atras + adelante, posiciones):
+            self.orden[nodo] = posicion
@@ -0,0 +1,112 @@
+"""
+Políticas de planificación de la detección de interbloqueos.
+
+Detectar en cada paso es un desperdicio cuando hay poca contención, y
+hacerlo con poca frecuencia retrasa el hallazgo de los interbloqueos. Cada
+política decide, paso a paso, si vale la pena ejecutar el detector:
+    - cada_paso:    siempre (comportamiento original)
+    - cada_k:       cuando hubo al menos k solicitudes desde la última detección
+    - temporizador: cuando pasaron al menos `intervalo_s` segundos
+    - adaptativa:   cuando la proporción de procesos bloqueados o la espera
+                    más larga superan un umbral (y hubo solicitudes nuevas
+                    desde la última detección, para no repetirla en vano)
+
+El simulador consultado debe ofrecer:
+    ahora(), solicitudes_totales, proporcion_bloqueados(), espera_maxima()
+"""
+from abc import ABC, abstractmethod
+import inspect
+
+
+class PoliticaDeteccion(ABC):
+    nombre = None
+
+    def __init__(self):
+        self.ultima_deteccion = None
+        self.solicitudes_ultima_deteccion = 0
+
+    @abstractmethod
+    def debe_detectar(self, simulador):
+        """True si conviene ejecutar el detector en este paso."""
+
+    def detecto(self, simulador):
+        """Avisa que el detector se acaba de ejecutar."""
+        self.ultima_deteccion = simulador.ahora()
+        self.solicitudes_ultima_deteccion = simulador.solicitudes_totales
+
+    def describir(self):
+        return self.nombre
+
+
+class CadaPaso(PoliticaDeteccion):
+    nombre = "cada_paso"
+
+    def debe_detectar(self, simulador):
+        return True
+
+
+class CadaKSolicitudes(PoliticaDeteccion):
+    nombre = "cada_k"
+
+    def __init__(self, k=5):
+        super().__init__()
+        if k < 1:
+            raise ValueError("k debe ser al menos 1")
+        self.k = k
+
+    def debe_detectar(self, simulador):
+        return simulador.solicitudes_totales - self.solicitudes_ultima_deteccion >= self.k
+
+    def describir(self):
+        return f"{self.nombre}(k={self.k})"
+
+
+class Temporizador(PoliticaDeteccion):
+    nombre = "temporizador"
+
+    def __init__(self, intervalo_s=5.0):
+        super().__init__()
+        if intervalo_s <= 0:
+            raise ValueError("El intervalo debe ser positivo")
+        self.intervalo_s = intervalo_s
+
+    def debe_detectar(self, simulador):
+        if self.ultima_deteccion is None:
+            self.ultima_deteccion = simulador.ahora()
+        return simulador.ahora() - self.ultima_deteccion >= self.intervalo_s
+
+    def describir(self):
+        return f"{self.nombre}({self.intervalo_s:g} s)"
+
+
+class Adaptativa(PoliticaDeteccion):
+    nombre = "adaptativa"
+
+    def __init__(self, umbral_bloqueados=0.3, umbral_espera_s=3.0):
+        super().__init__()
+        self.umbral_bloqueados = umbral_bloqueados
+        self.umbral_espera_s = umbral_espera_s
+
+    def debe_detectar(self, simulador):
+        if simulador.solicitudes_totales == self.solicitudes_ultima_deteccion:
+            return False
+        return (simulador.proporcion_bloqueados() >= self.umbral_bloqueados
+                or simulador.espera_maxima() >= self.umbral_espera_s)
+
+    def describir(self):
+        return f"{self.nombre}(bloqueados>={self.umbral_bloqueados:g}, espera>={self.umbral_espera_s:g} s)"
+
+
+POLITICAS_DETECCION = {
+    politica.nombre: politica for politica in (CadaPaso, CadaKSolicitudes, Temporizador, Adaptativa)
+}
+
+
+def crear_politica(nombre, **opciones):
+    """Instancia la política `nombre` con las opciones que acepte (las demás se ignoran)."""
+    if nombre not in POLITICAS_DETECCION:
+        raise ValueError(f"Política de detección desconocida: {nombre!r}. "
+                         f"Opciones: {', '.join(POLITICAS_DETECCION)}")
+    clase = POLITICAS_DETECCION[nombre]
+    aceptadas = inspect.signature(clase).parameters
+    return clase(**{clave: valor for clave, valor in opciones.items() if clave in aceptadas and valor is not None})
@@ -0,0 +1,209 @@
+"""
+Selección de víctimas de costo mínimo para romper interbloqueos.
+
+Matar a una víctima por ciclo no siempre es lo más barato: si varios ciclos
+comparten procesos, reiniciar uno bien elegido puede romperlos todos. El
+problema es encontrar un conjunto de procesos de costo total mínimo cuya
+eliminación deja el grafo de espera sin ciclos (conjunto de vértices de
+retroalimentación, NP-difícil en general):
+    - componentes pequeñas (hasta LIMITE_EXACTO procesos): ramificación y
+      poda exacta. Todo conjunto válido contiene un proceso de cada ciclo, así
+      que se toma el ciclo más corto que queda y se prueba a quitar cada uno
+      de sus procesos (fijando los anteriores para no repetir conjuntos).
+    - componentes grandes: voraz. Se quita el proceso con menor costo por
+      ciclo que atraviesa (aproximado por grado de entrada x grado de salida
+      dentro de su componente) hasta que no queden ciclos, y después se
+      devuelven los que resultaron innecesarios.
+El costo de cada proceso lo decide quien llama (recursos retenidos, trabajo
+perdido, reinicios...). A igual costo se prefieren menos víctimas y, entre
+procesos del mismo costo, el menor según `desempate` (y después, el que
+aparece antes en `procesos`).
+"""
+from collections import deque
+
+from .componentes import componentes_fuertemente_conexas
+
+# Tamaño máximo de componente que se resuelve de forma exacta
+LIMITE_EXACTO = 12
+
+
+def victimas_de_costo_minimo(sucesores, procesos, costos, desempate=None, limite_exacto=LIMITE_EXACTO):
+    """
+    `sucesores`: grafo de espera (dict proceso -> iterable de procesos).
+    `procesos`: procesos en interbloqueo a considerar (el resto se ignora).
+    `costos`: dict proceso -> costo no negativo de reiniciarlo.
+    `desempate`: clave opcional para elegir entre procesos del mismo costo.
+    Devuelve la lista de víctimas que deja el subgrafo de `procesos` sin ciclos.
+    """
+    grafo = _subgrafo(sucesores, procesos)
+    orden = {
+        proceso: posicion
+        for posicion, proceso in enumerate(sorted(grafo, key=lambda p: (costos[p], desempate(p) if desempate else 0)))
+    }
+    victimas = []
+    for componente in _componentes_con_ciclo(grafo, grafo):
+        if len(componente) <= limite_exacto:
+            victimas.extend(_minimo_exacto(grafo, componente, costos, orden))
+        else:
+            victimas.extend(_minimo_voraz(grafo, componente, costos, orden))
+    return victimas
+
+
+def victimas_por_componente(sucesores, procesos, criterio):
+    """
+    Referencia: una víctima por componente con ciclo, la de menor
+    `criterio(proceso)`, repitiendo hasta que no queden ciclos (lo que haría
+    el simulador ronda tras ronda con su criterio clásico).
+    """
+    grafo = _subgrafo(sucesores, procesos)
+    posicion = {proceso: i for i, proceso in enumerate(grafo)}
+    restantes = set(grafo)
+    victimas = []
+    componentes = _componentes_con_ciclo(grafo, restantes)
+    while componentes:
+        for componente in componentes:
+            victima = min(componente, key=lambda p: (criterio(p), posicion[p]))
+            restantes.discard(victima)
+            victimas.append(victima)
+        componentes = _componentes_con_ciclo(grafo, restantes)
+    return victimas
+
+
+def costo_total(victimas, costos):
+    return sum(costos[victima] for victima in victimas)
+
+
+def _subgrafo(sucesores, procesos):
+    """Subgrafo inducido, conservando el orden de `procesos`."""
+    procesos = list(procesos)
+    miembros = set(procesos)
+    return {p: [q for q in sucesores.get(p, ()) if q in miembros] for p in procesos}
+
+
+def _componentes_con_ciclo(grafo, nodos):
+    """Componentes fuertemente conexas del subgrafo inducido por `nodos` que contienen un ciclo."""
+    restringido = {n: [m for m in grafo[n] if m in nodos] for n in nodos}
+    return [
+        componente
+        for componente in componentes_fuertemente_conexas(restringido)
+        if len(componente) > 1 or componente[0] in restringido[componente[0]]
+    ]
+
+
+def _ciclo_mas_corto(grafo, nodos):
+    """Ciclo más corto dentro de `nodos` (BFS desde cada nodo), o None si no hay."""
+    mejor = None
+    for origen in nodos:
+        padre = {origen: None}
+        cola = deque([origen])
+        cerrado = None
+        while cola and cerrado is None:
+            nodo = cola.popleft()
+            for siguiente in grafo[nodo]:
+                if siguiente not in nodos:
+                    continue
+                if siguiente == origen:
+                    cerrado = nodo
+                    break
+                if siguiente not in padre:
+                    padre[siguiente] = nodo
+                    cola.append(siguiente)
+        if cerrado is None:
+            continue
+        ciclo = [cerrado]
+        while padre[ciclo[-1]] is not None:
+            ciclo.append(padre[ciclo[-1]])
+        if mejor is None or len(ciclo) < len(mejor):
+            mejor = ciclo
+            if len(mejor) == 1:
+                break
+    return mejor
+
+
+def _minimo_exacto(grafo, componente, costos, orden):
+    mejor = {"victimas": None, "clave": (float("inf"), float("inf"))}
+
+    def ramificar(restantes, fijos, victimas, costo):
+        if (costo, len(victimas)) >= mejor["clave"]:
+            return
+        ciclo = _ciclo_mas_corto(grafo, restantes)
+        if ciclo is None:
+            mejor["victimas"], mejor["clave"] = list(victimas), (costo, len(victimas))
+            return
+        candidatos = sorted((n for n in ciclo if n not in fijos), key=orden.__getitem__)
+        nuevos_fijos = set(fijos)
+        for nodo in candidatos:
+            victimas.append(nodo)
+            ramificar(restantes - {nodo}, nuevos_fijos, victimas, costo + costos[nodo])
+            victimas.pop()
+            # En las ramas siguientes este proceso sobrevive
+            nuevos_fijos = nuevos_fijos | {nodo}
+
+    ramificar(frozenset(componente), frozenset(), [], 0)
+    return mejor["victimas"]
+
+
+def _minimo_voraz(grafo, componente, costos, orden):
+    miembros = set(componente)
+    salida = {n: [m for m in grafo[n] if m in miembros] for n in componente}
+    entrada = {n: [] for n in componente}
+    for n in componente:
+        for m in salida[n]:
+            entrada[m].append(n)
+    grado_salida = {n: len(salida[n]) for n in componente}
+    grado_entrada = {n: len(entrada[n]) for n in componente}
+
+    restantes = set(componente)
+    victimas = []
+
+    def quitar(nodo):
+        """Saca `nodo` y descarta en cascada a los que ya no pueden estar en un ciclo."""
+        pila = [nodo]
+        restantes.discard(nodo)
+        while pila:
+            actual = pila.pop()
+            for vecinos, grados in ((salida[actual], grado_entrada), (entrada[actual], grado_salida)):
+                for vecino in vecinos:
+                    if vecino in restantes:
+                        grados[vecino] -= 1
+                        if grados[vecino] == 0:
+                            restantes.discard(vecino)
+                            pila.append(vecino)
+
+    def prioridad(nodo):
+        ciclos = max(1, grado_entrada[nodo] * grado_salida[nodo])
+        return (costos[nodo] / ciclos, -ciclos, orden[nodo])
+
+    for nodo in list(restantes):
+        if nodo in restantes and (grado_entrada[nodo] == 0 or grado_salida[nodo] == 0):
+            quitar(nodo)
+    while restantes:
+        # Con todos los grados > 0 siempre queda al menos un ciclo
+        elegido = next((n for n in restantes if n in salida[n]), None)
+        if elegido is None:
+            elegido = min(restantes, key=prioridad)
+        victimas.append(elegido)
+        quitar(elegido)
+
+    # Las víctimas que ya no hacen falta (sus ciclos los rompieron otras) se devuelven
+    vivos = miembros - set(victimas)
+    for nodo in sorted(victimas, key=orden.__getitem__, reverse=True):
+        if not _alcanza(salida, vivos, nodo):
+            vivos.add(nodo)
+            victimas.remove(nodo)
+    return victimas
+
+
+def _alcanza(salida, vivos, nodo):
+    """¿Hay un ciclo que pase por `nodo` usando solo procesos de `vivos`?"""
+    visitados = set()
+    pila = [nodo]
+    while pila:
+        actual = pila.pop()
+        for siguiente in salida[actual]:
+            if siguiente == nodo:
+                return True
+            if siguiente in vivos and siguiente not in visitados:
+                visitados.add(siguiente)
+                pila.append(siguiente)
+    return False
@@ -0,0 +1,11 @@
+"""
+Dibujo del grafo de asignación y solicitud, disposición de sus nodos,
+planificación de repintados y exportación sin pantalla, compartidos por los
+simuladores.
+
+    from simuladores.grafico import CacheDisposicion, PlanificadorRepintado, RenderizadorGrafo
+"""
+from .retenido import RenderizadorGrafo
+from .planificador import PlanificadorRepintado
+from .disposicion import CacheDisposicion, DISPOSICIONES
+from .exportar import Grabacion, exportar
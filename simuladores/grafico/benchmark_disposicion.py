@@ -0,0 +1,105 @@
+"""
+Costo de las disposiciones del grafo con cientos o miles de nodos.
+
+Para cada cantidad de procesos (y la misma de recursos) y cada modo de
+CacheDisposicion mide, sin pantalla:
+    - armar:       primera disposición completa
+    - reusar:      pedir las posiciones con los mismos nodos (lo de cada frame)
+    - dict:        lo que se hacía antes en cada frame (armar `pos` de nuevo)
+    - incremental: quitar un proceso y agregar otro
+    - frame:       tiempo medio por frame de RenderizadorGrafo con esas
+                   posiciones (el primero, que construye los artistas, aparte)
+
+Uso:
+    python -m simuladores.grafico.benchmark_disposicion --procesos 50 250 1000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .benchmark_render import generar_estados
+from .disposicion import DISPOSICIONES, CacheDisposicion
+from .retenido import RenderizadorGrafo
+
+REPETICIONES = 200
+
+
+def cronometrar(funcion, repeticiones=REPETICIONES):
+    """Tiempo medio de `funcion()` en microsegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def medir_disposicion(modo, procesos, recursos, aristas):
+    """Devuelve (armar_us, reusar_us, incremental_us)."""
+    armar = cronometrar(lambda: CacheDisposicion(modo).posiciones(procesos, recursos, aristas), 5)
+
+    cache = CacheDisposicion(modo)
+    cache.posiciones(procesos, recursos, aristas)
+    reusar = cronometrar(lambda: cache.posiciones(procesos, recursos, aristas))
+
+    # Alterna entre dos conjuntos de nodos que difieren en un proceso
+    otros = procesos[1:] + [f"P{len(procesos)}"]
+    conjuntos = [procesos, otros]
+    turno = [0]
+
+    def cambiar():
+        turno[0] ^= 1
+        cache.posiciones(conjuntos[turno[0]], recursos, aristas)
+
+    incremental = cronometrar(cambiar, 50)
+    return armar, reusar, incremental
+
+
+def medir_frames(modo, procesos, recursos, estados):
+    """Devuelve (primer_ms, media_ms) de dibujar los estados con esa disposición."""
+    fig = Figure(figsize=(8, 8))
+    canvas = FigureCanvasAgg(fig)
+    renderizador = RenderizadorGrafo(fig.add_subplot(), canvas, color_etiqueta="white")
+    cache = CacheDisposicion(modo, min_intervalo_s=float("inf"))
+    tiempos = []
+    for colores, aristas, titulo in estados:
+        inicio = time.perf_counter()
+        renderizador.dibujar(cache.posiciones(procesos, recursos, aristas), colores, aristas, titulo)
+        tiempos.append((time.perf_counter() - inicio) * 1e3)
+    return tiempos[0], statistics.mean(tiempos[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Costo de las disposiciones del grafo con muchos nodos")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[50, 250, 1000])
+    parser.add_argument("--modos", nargs="+", choices=DISPOSICIONES, default=["columnas", "cuadricula", "componentes"])
+    parser.add_argument("--pasos", type=int, default=30, help="frames a dibujar por modo (0: no dibujar)")
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'procesos':>10}{'modo':>13}{'armar ms':>10}{'reusar µs':>11}{'dict µs':>9}"
+          f"{'incremental µs':>16}{'primer ms':>11}{'frame ms':>10}")
+    for num_procesos in args.procesos:
+        _, estados = generar_estados(random.Random(args.semilla), num_procesos, max(args.pasos, 1))
+        procesos = [f"P{i}" for i in range(num_procesos)]
+        recursos = [f"R{i}" for i in range(num_procesos)]
+        # Aristas del último estado: las componentes ya están formadas
+        aristas = list(estados[-1][1])
+
+        def armar_dict():
+            pos = {p: (0, -i) for i, p in enumerate(procesos)}
+            pos.update({r: (1, -i) for i, r in enumerate(recursos)})
+
+        dict_us = cronometrar(armar_dict)
+        for modo in args.modos:
+            armar, reusar, incremental = medir_disposicion(modo, procesos, recursos, aristas)
+            primer, frame = (medir_frames(modo, procesos, recursos, estados[:args.pasos])
+                             if args.pasos > 1 else (float("nan"), float("nan")))
+            print(f"{num_procesos:>10}{modo:>13}{armar / 1e3:>10.2f}{reusar:>11.2f}{dict_us:>9.1f}"
+                  f"{incremental:>16.1f}{primer:>11.1f}{frame:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Tiempo por frame del grafo: redibujo completo vs RenderizadorGrafo.
+
+Genera una secuencia de estados al azar (cada paso un proceso obtiene un
+recurso libre, se bloquea esperando uno ocupado o, rara vez, termina y
+libera los suyos) y la dibuja, sin pantalla, con el backend Agg:
+    - completo: lo que hacían los simuladores (DiGraph nuevo, ax.clear,
+                nx.draw_networkx y canvas.draw en cada paso)
+    - retenido: RenderizadorGrafo (artistas reutilizados y blitting)
+midiendo el tiempo de cada frame. En Tk se suma, en ambos casos, copiar la
+imagen a la ventana.
+
+Uso:
+    python -m simuladores.grafico.benchmark_render --procesos 10 50 200 --pasos 300
+"""
+import argparse
+import random
+import statistics
+import time
+
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .retenido import RenderizadorGrafo
+
+ESTRATEGIAS = ("completo", "retenido")
+COLORES_ESTADO = {"Listo": "#95a5a6", "Ejecutando": "#3498db", "Bloqueado": "#e74c3c", "Terminado": "#2ecc71"}
+
+
+def generar_estados(rng, num_procesos, pasos):
+    """Devuelve (pos, [(colores, aristas, titulo), ...]) con num_procesos procesos y recursos."""
+    # El título (procesos terminados) cambia pocas veces, como en los simuladores
+    procesos = [f"P{i}" for i in range(num_procesos)]
+    recursos = [f"R{i}" for i in range(num_procesos)]
+    pos = {p: (0, -i) for i, p in enumerate(procesos)}
+    pos.update({r: (1, -i) for i, r in enumerate(recursos)})
+
+    estado = {p: "Listo" for p in procesos}
+    asignados = {p: set() for p in procesos}
+    solicitando = {}
+    dueno = {}
+    estados = []
+    for _ in range(pasos):
+        activos = [p for p in procesos if estado[p] != "Terminado"]
+        if not activos:
+            break
+        p = rng.choice(activos)
+        r = rng.choice(recursos)
+        if rng.random() < 0.02:
+            for liberado in asignados[p]:
+                del dueno[liberado]
+            asignados[p].clear()
+            solicitando.pop(p, None)
+            estado[p] = "Terminado"
+        elif r not in dueno:
+            dueno[r] = p
+            asignados[p].add(r)
+            solicitando.pop(p, None)
+            estado[p] = "Ejecutando"
+        elif dueno[r] != p:
+            solicitando[p] = r
+            estado[p] = "Bloqueado"
+
+        colores = {p: COLORES_ESTADO[e] for p, e in estado.items()}
+        colores.update({r: "#2ecc71" for r in recursos})
+        aristas = {(p, r): ("#2ecc71", "solid") for p in procesos for r in asignados[p]}
+        aristas.update({(p, r): ("#f1c40f", "dashed") for p, r in solicitando.items()})
+        terminados = sum(e == "Terminado" for e in estado.values())
+        estados.append((colores, aristas, f"Grafo de Asignación y Solicitud ({terminados}/{num_procesos} Completados)"))
+    return pos, estados
+
+
+def dibujar_completo(ax, canvas, pos, colores, aristas, titulo):
+    """Redibujo completo, como lo hacían los simuladores."""
+    G = nx.DiGraph()
+    G.add_nodes_from(pos)
+    for (u, v), (color, estilo) in aristas.items():
+        G.add_edge(u, v, color=color, estilo=estilo)
+    ax.clear()
+    nx.draw_networkx(G, pos, node_color=[colores[n] for n in G.nodes()], node_size=1000,
+                     font_color="white", font_size=9,
+                     edge_color=[d["color"] for _, _, d in G.edges(data=True)],
+                     style=[d["estilo"] for _, _, d in G.edges(data=True)], ax=ax)
+    ax.set_title(titulo)
+    ax.axis("off")
+    canvas.draw()
+
+
+def medir(estrategia, pos, estados):
+    """Devuelve los tiempos de cada frame en ms."""
+    fig = Figure(figsize=(6, 6))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    renderizador = RenderizadorGrafo(ax, canvas, color_etiqueta="white") if estrategia == "retenido" else None
+
+    tiempos = []
+    for colores, aristas, titulo in estados:
+        inicio = time.perf_counter()
+        if renderizador is None:
+            dibujar_completo(ax, canvas, pos, colores, aristas, titulo)
+        else:
+            renderizador.dibujar(pos, colores, aristas, titulo)
+        tiempos.append((time.perf_counter() - inicio) * 1e3)
+    return tiempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo por frame: redibujo completo vs renderizador retenido")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--pasos", type=int, default=300)
+    parser.add_argument("--estrategias", nargs="+", choices=ESTRATEGIAS, default=list(ESTRATEGIAS))
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'procesos':>10}{'estrategia':>12}{'primer ms':>11}{'media ms':>10}{'p95 ms':>9}{'frames/s':>10}")
+    for num_procesos in args.procesos:
+        pos, estados = generar_estados(random.Random(args.semilla), num_procesos, args.pasos)
+        for estrategia in args.estrategias:
+            tiempos = medir(estrategia, pos, estados)
+            # El primer frame (construcción de los artistas) se muestra aparte
+            resto = sorted(tiempos[1:])
+            media = statistics.mean(resto)
+            print(f"{num_procesos:>10}{estrategia:>12}{tiempos[0]:>11.1f}{media:>10.2f}"
+                  f"{resto[int(len(resto) * 0.95)]:>9.2f}{1e3 / media:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Pasos por segundo con y sin límite de repintados.
+
+Reproduce, sin pantalla, una simulación que da un paso cada `--intervalo-paso`
+ms (con un bucle de eventos mínimo, como root.after) y dibuja el grafo con
+RenderizadorGrafo sobre Agg:
+    - fps = 0: se repinta en cada paso (como antes)
+    - fps > 0: PlanificadorRepintado agrupa los pasos y repinta a lo sumo
+               esa cantidad de veces por segundo
+y muestra pasos por segundo, repintados y pasos agrupados por frame.
+
+Uso:
+    python -m simuladores.grafico.benchmark_repintado --procesos 10 50 --fps 0 10 30
+"""
+import argparse
+import heapq
+import itertools
+import random
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .benchmark_render import generar_estados
+from .planificador import PlanificadorRepintado
+from .retenido import RenderizadorGrafo
+
+
+class BucleEventos:
+    """Lo mínimo de Tk para planificar: after(ms, funcion) y ejecutar()."""
+
+    def __init__(self):
+        self.cola = []
+        self.orden = itertools.count()
+
+    def after(self, retardo_ms, funcion):
+        heapq.heappush(self.cola, (time.perf_counter() + retardo_ms / 1000, next(self.orden), funcion))
+
+    def ejecutar(self):
+        while self.cola:
+            cuando, _, funcion = heapq.heappop(self.cola)
+            espera = cuando - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+            funcion()
+
+
+def ejecutar(pos, estados, max_fps, intervalo_paso_ms):
+    """Devuelve (segundos, planificador) de recorrer todos los estados."""
+    fig = Figure(figsize=(6, 6))
+    canvas = FigureCanvasAgg(fig)
+    renderizador = RenderizadorGrafo(fig.add_subplot(), canvas, color_etiqueta="white")
+    bucle = BucleEventos()
+    actual = [0]
+
+    def repintar():
+        renderizador.dibujar(pos, *estados[actual[0]])
+
+    planificador = PlanificadorRepintado(bucle.after, repintar, max_fps)
+
+    def paso():
+        planificador.marcar()
+        if actual[0] + 1 < len(estados):
+            actual[0] += 1
+            bucle.after(intervalo_paso_ms, paso)
+        else:
+            planificador.forzar()
+
+    inicio = time.perf_counter()
+    bucle.after(0, paso)
+    bucle.ejecutar()
+    return time.perf_counter() - inicio, planificador
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pasos por segundo con y sin límite de repintados")
+    parser.add_argument("--procesos", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--fps", type=float, nargs="+", default=[0, 10, 30])
+    parser.add_argument("--pasos", type=int, default=500)
+    parser.add_argument("--intervalo-paso", type=int, default=1, help="milisegundos entre pasos")
+    parser.add_argument("--semilla", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'procesos':>10}{'fps máx':>9}{'pasos/s':>10}{'repintados':>12}{'pasos/frame':>13}{'ms dibujando':>14}")
+    for num_procesos in args.procesos:
+        pos, estados = generar_estados(random.Random(args.semilla), num_procesos, args.pasos)
+        for max_fps in args.fps:
+            segundos, planificador = ejecutar(pos, estados, max_fps, args.intervalo_paso)
+            print(f"{num_procesos:>10}{max_fps:>9g}{len(estados) / segundos:>10.0f}{planificador.repintados:>12}"
+                  f"{planificador.pasos_por_frame():>13.1f}{planificador.tiempo_repintado_s * 1000:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Posiciones de los nodos del grafo, calculadas una vez y reutilizadas.
+
+Antes cada frame volvía a armar el diccionario `pos` con dos columnas
+(procesos a la izquierda, recursos a la derecha), que con más de unas
+decenas de nodos queda ilegible. CacheDisposicion guarda la última
+disposición, indexada por el conjunto de nodos:
+    - si los nodos no cambiaron devuelve el MISMO diccionario (el
+      renderizador lo reconoce sin compararlo)
+    - si se agregan o quitan procesos o recursos, los que siguen conservan su
+      lugar: los quitados liberan su ranura y los nuevos ocupan la primera
+      ranura libre de su tipo
+y ofrece varios modos:
+    - columnas:    procesos en una columna y recursos en otra (el original)
+    - cuadricula:  procesos en un bloque de ~√n columnas y recursos en otro
+                   a su derecha; sirve para cientos de nodos
+    - componentes: cada componente conexa del grafo de asignación y
+                   solicitud (quienes se esperan entre sí y los recursos que
+                   retienen o piden) en su propia celda, las más grandes
+                   primero, y los nodos sueltos en cuadrícula debajo. Se
+                   reagrupa cuando cambian las componentes, como mucho una
+                   vez cada `min_intervalo_s` segundos
+    - auto:        columnas hasta MAX_PROCESOS_COLUMNAS procesos, cuadrícula
+                   con más
+
+Las posiciones usan separación 1 entre nodos vecinos.
+"""
+import math
+import time
+
+DISPOSICIONES = ("auto", "columnas", "cuadricula", "componentes")
+MAX_PROCESOS_COLUMNAS = 30
+
+
+class CacheDisposicion:
+    def __init__(self, modo="auto", min_intervalo_s=2.0, reloj=time.perf_counter):
+        if modo not in DISPOSICIONES:
+            raise ValueError(f"Disposición desconocida: {modo!r}. Opciones: {', '.join(DISPOSICIONES)}")
+        self.modo = modo
+        self.min_intervalo_s = min_intervalo_s
+        self.reloj = reloj
+
+        self.pos = {}
+        self.clave = None          # (procesos, recursos) de self.pos
+        self.modo_actual = None    # modo efectivo de self.pos ("auto" ya resuelto)
+        self.particion = None      # componentes usadas en el modo "componentes"
+        self.ultimo_reagrupado = None
+        # Ranuras de cada tipo: índice -> nodo, y nodo -> (tipo, índice)
+        self.ranuras = {"P": {}, "R": {}}
+        self.ranura_de = {}
+        # Geometría de las ranuras: ancho de cada bloque y fila inicial
+        self.ancho = 1
+        self.y0 = 0
+
+        # Medición
+        self.completas = 0
+        self.incrementales = 0
+        self.reutilizadas = 0
+
+    def posiciones(self, procesos, recursos, aristas=()):
+        """
+        {nodo: (x, y)} para los procesos y recursos dados (en ese orden).
+        `aristas` (pares origen, destino) solo se usa en el modo "componentes".
+        """
+        procesos, recursos = tuple(procesos), tuple(recursos)
+        modo = self._modo_efectivo(len(procesos))
+        if modo != self.modo_actual:
+            self.clave = None
+
+        if modo == "componentes":
+            particion = _componentes(procesos + recursos, aristas)
+            if self.clave is None or (particion != self.particion and self._puede_reagrupar()):
+                return self._disponer_componentes(procesos, recursos, particion)
+
+        if (procesos, recursos) == self.clave:
+            self.reutilizadas += 1
+            return self.pos
+        if self.clave is None:
+            return self._disponer_en_bloques(procesos, recursos, modo)
+        return self._actualizar(procesos, recursos)
+
+    # --- Disposiciones completas ---
+    def _modo_efectivo(self, num_procesos):
+        if self.modo != "auto":
+            return self.modo
+        return "columnas" if num_procesos <= MAX_PROCESOS_COLUMNAS else "cuadricula"
+
+    def _disponer_en_bloques(self, procesos, recursos, modo):
+        self.ancho = 1 if modo == "columnas" else max(1, math.ceil(math.sqrt(max(len(procesos), len(recursos)))))
+        self.y0 = 0
+        self._reiniciar_ranuras(modo)
+        self.pos = {}
+        for tipo, nodos in (("P", procesos), ("R", recursos)):
+            for i, n in enumerate(nodos):
+                self._ocupar(n, tipo, i)
+        self.pos = {n: self.pos[n] for n in procesos + recursos}
+        self.clave = (procesos, recursos)
+        self.completas += 1
+        return self.pos
+
+    def _disponer_componentes(self, procesos, recursos, particion):
+        self._reiniciar_ranuras("componentes")
+        self.particion = particion
+        self.ultimo_reagrupado = self.reloj()
+        es_proceso = set(procesos)
+        orden = {n: i for i, n in enumerate(procesos + recursos)}
+
+        # Celdas de 2 columnas (procesos | recursos) acomodadas en filas
+        total = len(procesos) + len(recursos)
+        ancho_maximo = max(3, 3 * math.ceil(math.sqrt(total) / 2))
+        pos = {}
+        x, y, alto_fila = 0, 0, 0
+        for componente in sorted(particion, key=lambda c: (-len(c), min(orden[n] for n in c))):
+            ps = sorted((n for n in componente if n in es_proceso), key=orden.__getitem__)
+            rs = sorted((n for n in componente if n not in es_proceso), key=orden.__getitem__)
+            alto = max(len(ps), len(rs))
+            if x and x + 2 > ancho_maximo:
+                x, y, alto_fila = 0, y - alto_fila - 1, 0
+            pos.update({n: (x, y - i) for i, n in enumerate(ps)})
+            pos.update({n: (x + 1, y - i) for i, n in enumerate(rs)})
+            x += 3
+            alto_fila = max(alto_fila, alto)
+
+        # Nodos sueltos: en ranuras (bloques de procesos y de recursos) debajo de
+        # las celdas; ahí van también los nodos que se agreguen después
+        sueltos = max(sum(n not in pos for n in procesos), sum(n not in pos for n in recursos))
+        self.ancho = max(1, math.ceil(math.sqrt(sueltos)))
+        self.y0 = y - alto_fila - 1 if pos else 0
+        self.pos = pos
+        for tipo, nodos in (("P", procesos), ("R", recursos)):
+            for i, n in enumerate(m for m in nodos if m not in pos):
+                self._ocupar(n, tipo, i)
+        self.pos = {n: self.pos[n] for n in procesos + recursos}
+        self.clave = (procesos, recursos)
+        self.completas += 1
+        return self.pos
+
+    def _puede_reagrupar(self):
+        return (self.ultimo_reagrupado is None
+                or self.reloj() - self.ultimo_reagrupado >= self.min_intervalo_s)
+
+    # --- Actualización incremental ---
+    def _actualizar(self, procesos, recursos):
+        nuevos = set(procesos) | set(recursos)
+        for n in [n for n in self.pos if n not in nuevos]:
+            tipo_indice = self.ranura_de.pop(n, None)
+            # Un nodo de una celda (modo "componentes") no tiene ranura: su lugar queda vacío
+            if tipo_indice is not None:
+                del self.ranuras[tipo_indice[0]][tipo_indice[1]]
+
+        anteriores = self.pos
+        self.pos = dict(anteriores)
+        for tipo, nodos in (("P", procesos), ("R", recursos)):
+            libre = 0
+            for n in nodos:
+                if n in anteriores:
+                    continue
+                while libre in self.ranuras[tipo]:
+                    libre += 1
+                self._ocupar(n, tipo, libre)
+        self.pos = {n: self.pos[n] for n in procesos + recursos}
+        self.clave = (procesos, recursos)
+        self.incrementales += 1
+        return self.pos
+
+    # --- Ranuras ---
+    def _reiniciar_ranuras(self, modo):
+        self.modo_actual = modo
+        self.ranuras = {"P": {}, "R": {}}
+        self.ranura_de = {}
+
+    def _posicion(self, tipo, indice):
+        fila, columna = divmod(indice, self.ancho)
+        if tipo == "R":
+            columna += self.ancho + 1
+        return (columna, self.y0 - fila)
+
+    def _ocupar(self, nodo, tipo, indice):
+        self.ranuras[tipo][indice] = nodo
+        self.ranura_de[nodo] = (tipo, indice)
+        self.pos[nodo] = self._posicion(tipo, indice)
+
+
+def _componentes(nodos, aristas):
+    """Componentes conexas (sin dirección) con al menos una arista, como frozenset de frozensets."""
+    padre = {}
+
+    def raiz(n):
+        while padre[n] != n:
+            padre[n] = padre[padre[n]]
+            n = padre[n]
+        return n
+
+    presentes = set(nodos)
+    for u, v in aristas:
+        if u not in presentes or v not in presentes:
+            continue
+        padre.setdefault(u, u)
+        padre.setdefault(v, v)
+        ru, rv = raiz(u), raiz(v)
+        if ru != rv:
+            padre[ru] = rv
+
+    grupos = {}
+    for n in padre:
+        grupos.setdefault(raiz(n), set()).add(n)
+    return frozenset(frozenset(g) for g in grupos.values())
@@ -0,0 +1,124 @@
+"""
+Exportación sin pantalla de una simulación: una imagen PNG por paso o un GIF.
+
+El grafo solo se dibujaba dentro de la ventana de Tk, así que para revisar una
+simulación larga había que mirarla entera. Ahora la simulación puede guardar
+en una Grabacion el estado del grafo de cada paso (lo mismo que recibe
+RenderizadorGrafo.dibujar) y `exportar` lo vuelve a dibujar con el backend
+Agg, sin pantalla, repartiendo los pasos en tramos consecutivos entre varios
+procesos (cada uno con su propio RenderizadorGrafo, así dentro de un tramo
+se aprovechan los artistas retenidos y el blitting):
+
+    grabacion = Grabacion(color_etiqueta="white")
+    grabacion.agregar(pos, colores, aristas, titulo)   # tras cada paso
+    exportar(grabacion, "salida.gif", trabajadores=4)  # o una carpeta para PNG
+
+Para un GIF cada proceso reduce además sus frames a 256 colores (octree, sin
+tramado), que es lo más caro de armarlo; el GIF se arma al final con Pillow
+(dependencia de matplotlib) y guarda todos los frames en memoria, así que
+para corridas muy largas conviene `cada` > 1 o PNG.
+"""
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+
+from .retenido import RenderizadorGrafo
+
+NOMBRE_FRAME = "frame_{:05d}.png"
+
+
+class Grabacion:
+    def __init__(self, tamano=(6, 6), dpi=100, color_fondo=None, **opciones_renderizador):
+        """opciones_renderizador: las de RenderizadorGrafo (forma_nodo, color_etiqueta, ...)."""
+        self.tamano = tamano
+        self.dpi = dpi
+        self.color_fondo = color_fondo
+        self.opciones = opciones_renderizador
+
+        self.posiciones = []   # disposiciones distintas, en orden de aparición
+        self.frames = []       # (índice en posiciones, colores, aristas, titulo)
+        self._ultima_pos = None
+
+    def agregar(self, pos, colores, aristas, titulo=None):
+        # La disposición casi nunca cambia: se guarda una vez y los frames la referencian
+        if not self.posiciones or (pos is not self._ultima_pos and pos != self.posiciones[-1]):
+            self.posiciones.append(dict(pos))
+        self._ultima_pos = pos
+        self.frames.append((len(self.posiciones) - 1, dict(colores), dict(aristas), titulo))
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def exportar(grabacion, destino, trabajadores=None, cada=1, fps=10):
+    """
+    Dibuja uno de cada `cada` frames de la grabación en `trabajadores` procesos
+    (por defecto, uno por núcleo; con 1 se dibuja en este mismo proceso).
+        destino: archivo .gif, o carpeta donde dejar frame_00000.png, ...
+        fps:     frames por segundo del GIF
+    Devuelve la lista de imágenes PNG escritas (vacía si el destino es un GIF).
+    """
+    if cada < 1:
+        raise ValueError("cada debe ser al menos 1")
+    if fps <= 0:
+        raise ValueError("fps debe ser positivo")
+    trabajadores = trabajadores or os.cpu_count() or 1
+    frames = grabacion.frames[::cada]
+    if not frames:
+        raise ValueError("La grabación no tiene frames")
+
+    es_gif = destino.lower().endswith(".gif")
+    if es_gif:
+        with tempfile.TemporaryDirectory() as carpeta:
+            rutas = _renderizar(grabacion, frames, carpeta, trabajadores, cuantizar=True)
+            # Se abren de a uno (Pillow los lee al agregarlos) para no agotar los descriptores
+            resto = (Image.open(ruta) for ruta in rutas[1:])
+            Image.open(rutas[0]).save(destino, save_all=True, append_images=resto,
+                                      duration=round(1000 / fps), loop=0)
+        return []
+
+    os.makedirs(destino, exist_ok=True)
+    return _renderizar(grabacion, frames, destino, trabajadores, cuantizar=False)
+
+
+def _renderizar(grabacion, frames, carpeta, trabajadores, cuantizar):
+    """Reparte los frames en tramos consecutivos y devuelve las rutas de los PNG, en orden."""
+    configuracion = (grabacion.tamano, grabacion.dpi, grabacion.color_fondo, grabacion.opciones)
+    largo = -(-len(frames) // trabajadores)
+    tareas = [(configuracion, grabacion.posiciones, frames[i:i + largo], carpeta, i, cuantizar)
+              for i in range(0, len(frames), largo)]
+    if len(tareas) == 1:
+        resultados = [_renderizar_tramo(tareas[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=len(tareas)) as pool:
+            resultados = list(pool.map(_renderizar_tramo, tareas))
+    return [ruta for rutas in resultados for ruta in rutas]
+
+
+def _renderizar_tramo(tarea):
+    """Dibuja un tramo de frames consecutivos con un solo RenderizadorGrafo (corre en un proceso aparte)."""
+    (tamano, dpi, color_fondo, opciones), posiciones, frames, carpeta, primero, cuantizar = tarea
+    fig = Figure(figsize=tamano, dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if color_fondo is not None:
+        fig.patch.set_facecolor(color_fondo)
+        ax.set_facecolor(color_fondo)
+    renderizador = RenderizadorGrafo(ax, canvas, **opciones)
+
+    rutas = []
+    for k, (indice_pos, colores, aristas, titulo) in enumerate(frames, primero):
+        renderizador.dibujar(posiciones[indice_pos], colores, aristas, titulo)
+        # El frame ya está en el buffer de Agg (savefig volvería a dibujar y omitiría lo animado)
+        ruta = os.path.join(carpeta, NOMBRE_FRAME.format(k))
+        imagen = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert("RGB")
+        if cuantizar:
+            imagen = imagen.quantize(method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        imagen.save(ruta)
+        rutas.append(ruta)
+    return rutas
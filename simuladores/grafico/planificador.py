@@ -0,0 +1,77 @@
+"""
+Planificador de repintados: separa los pasos de la simulación del dibujo.
+
+Antes cada cambio de estado redibujaba en el acto (grafo, estado de los
+procesos, indicadores), así que la simulación no podía ir más rápido que el
+dibujo. Ahora cada paso solo llama a `marcar()`; el planificador repinta como
+máximo `max_fps` veces por segundo, con el último estado, agrupando todos los
+pasos que ocurrieron entre un frame y el siguiente:
+
+    repintado = PlanificadorRepintado(root.after, self.repintar, max_fps=10)
+    ...
+    repintado.marcar()   # tras cada paso
+    repintado.forzar()   # antes de un aviso o al terminar, para mostrar el estado final
+
+Con max_fps=0 se repinta en cada `marcar()` (comportamiento anterior).
+"""
+import math
+import time
+
+
+class PlanificadorRepintado:
+    def __init__(self, programar, repintar, max_fps=10, reloj=time.perf_counter):
+        """
+        programar: función (retardo_ms, funcion) como root.after
+        repintar:  función sin argumentos que dibuja el estado actual
+        """
+        if max_fps < 0:
+            raise ValueError("max_fps no puede ser negativo")
+        self.programar = programar
+        self.repintar = repintar
+        self.intervalo_s = 1 / max_fps if max_fps else 0.0
+        self.reloj = reloj
+
+        self.sucio = False
+        self.pendiente = False  # hay un repintado programado
+        self.ultimo_repintado = None
+
+        # Medición
+        self.marcas = 0
+        self.repintados = 0
+        self.tiempo_repintado_s = 0.0
+
+    def marcar(self):
+        """El estado cambió: programa un repintado si no hay uno pendiente."""
+        self.marcas += 1
+        self.sucio = True
+        if not self.intervalo_s:
+            self._repintar()
+            return
+        if self.pendiente:
+            return
+        espera = 0.0
+        if self.ultimo_repintado is not None:
+            espera = max(0.0, self.intervalo_s - (self.reloj() - self.ultimo_repintado))
+        self.pendiente = True
+        self.programar(math.ceil(espera * 1000), self._al_vencer)
+
+    def forzar(self):
+        """Repinta ya si hay cambios sin mostrar (el repintado programado ya no hará nada)."""
+        if self.sucio:
+            self._repintar()
+
+    def pasos_por_frame(self):
+        return self.marcas / self.repintados if self.repintados else 0.0
+
+    def _al_vencer(self):
+        self.pendiente = False
+        if self.sucio:
+            self._repintar()
+
+    def _repintar(self):
+        self.sucio = False
+        inicio = self.reloj()
+        self.repintar()
+        self.ultimo_repintado = self.reloj()
+        self.repintados += 1
+        self.tiempo_repintado_s += self.ultimo_repintado - inicio
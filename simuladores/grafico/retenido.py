@@ -0,0 +1,226 @@
+"""
+Dibujo "retenido" del grafo de asignación y solicitud.
+
+Los simuladores redibujaban el grafo completo en cada paso (G.clear,
+ax.clear, nx.draw_networkx y canvas.draw), lo que cuesta decenas de
+milisegundos aun con 20 nodos. Aquí los artistas se crean una sola vez y en
+cada paso solo se cambian sus datos:
+    - nodos:     un PathCollection (scatter); solo cambian los colores
+    - etiquetas: un PathCollection con el contorno de cada texto, fijo
+                 (dibujar un Text por nodo cuesta más que todo lo demás)
+    - aristas:   un LineCollection con los trazos y un PathCollection con
+                 las puntas de flecha de las aristas visibles; la geometría
+                 de cada arista se calcula la primera vez que aparece y se
+                 reutiliza mientras no cambie el tamaño de la figura
+y se repintan con blitting: tras cada dibujo completo (evento "draw_event",
+que también ocurre al redimensionar) se guarda el fondo con el título, y en
+cada paso se restaura y se dibujan encima solo los artistas animados.
+
+Si cambian los nodos, sus posiciones o el título se hace un dibujo completo;
+si `pos` es el mismo diccionario del frame anterior (CacheDisposicion lo
+reutiliza mientras no cambien los nodos) ni siquiera se compara. Con más de
+MIN_NODOS_ESCALADO nodos, nodos, etiquetas y flechas se achican para que
+quepan en la separación entre vecinos.
+"""
+import math
+import time
+
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+MIN_NODOS_ESCALADO = 60
+
+
+class RenderizadorGrafo:
+    def __init__(self, ax, canvas=None, forma_nodo="o", tamano_nodo=1000,
+                 color_etiqueta="black", tamano_fuente=9, ancho_arista=1.0,
+                 tamano_flecha=10, color_titulo=None, titulo_y=None):
+        self.ax = ax
+        self.canvas = canvas if canvas is not None else ax.figure.canvas
+        self.forma_nodo = forma_nodo
+        self.tamano_nodo = tamano_nodo
+        self.color_etiqueta = color_etiqueta
+        self.tamano_fuente = tamano_fuente
+        self.ancho_arista = ancho_arista
+        self.tamano_flecha = tamano_flecha
+        self.color_titulo = color_titulo
+        self.titulo_y = titulo_y
+
+        self.pos = {}
+        self.pos_origen = None      # diccionario recibido en el último dibujo completo
+        self.escala = 1.0           # factor de tamaño de nodos, etiquetas y flechas
+        self.nodos = None           # PathCollection con todos los nodos
+        self.etiquetas = None       # PathCollection con el texto de cada nodo
+        self.lineas = None          # LineCollection con los trazos de las aristas visibles
+        self.puntas = None          # PathCollection con sus puntas de flecha
+        self.colores_nodos = None   # último color de cada nodo, en orden de self.pos
+        self.aristas = None         # {(origen, destino): (color, estilo)} dibujadas
+        self.geometria = {}         # (origen, destino) -> (trazo, punta, vértice de la punta)
+        self.titulo = None
+        self.fondo = None
+        self.tamano_ejes = None     # para saber si la figura cambió de tamaño
+        # Sin soporte de blitting (p. ej. al exportar a PDF) todo se dibuja con canvas.draw()
+        self.animado = self.canvas.supports_blit
+
+        # Medición
+        self.frames_completos = 0
+        self.frames_parciales = 0
+        self.ultimo_frame_ms = 0.0
+
+        self.ax.axis("off")
+        self.canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    # --- API ---
+    def dibujar(self, pos, colores_nodos, aristas, titulo=None):
+        """
+        Actualiza la vista.
+            pos:           {nodo: (x, y)}
+            colores_nodos: {nodo: color}
+            aristas:       {(origen, destino): (color, estilo)} de las aristas visibles
+        """
+        inicio = time.perf_counter()
+        completo = pos is not self.pos_origen and pos != self.pos
+        if completo:
+            self._construir(pos)
+        self.pos_origen = pos
+
+        colores = [colores_nodos[n] for n in self.pos]
+        if colores != self.colores_nodos:
+            self.nodos.set_facecolor(colores)
+            self.colores_nodos = colores
+
+        if aristas != self.aristas:
+            self.aristas = dict(aristas)
+            self._actualizar_aristas()
+
+        if titulo is not None and titulo != self.titulo:
+            self.titulo = titulo
+            opciones = {} if self.titulo_y is None else {"y": self.titulo_y}
+            if self.color_titulo is not None:
+                opciones["color"] = self.color_titulo
+            self.ax.set_title(titulo, **opciones)
+            completo = True
+
+        if completo or self.fondo is None or not self.animado:
+            self.canvas.draw()
+            self.frames_completos += 1
+        else:
+            self.canvas.restore_region(self.fondo)
+            self._dibujar_animados()
+            self.canvas.blit(self.ax.figure.bbox)
+            self.frames_parciales += 1
+        self.ultimo_frame_ms = (time.perf_counter() - inicio) * 1e3
+
+    # --- Construcción ---
+    def _construir(self, pos):
+        for artista in (self.nodos, self.etiquetas, self.lineas, self.puntas):
+            if artista is not None:
+                artista.remove()
+        self.pos = dict(pos)
+        self.colores_nodos = None
+        self.aristas = None
+        self.geometria = {}
+        self.fondo = None
+
+        xs = [x for x, _ in self.pos.values()]
+        ys = [y for _, y in self.pos.values()]
+        self.escala = self._calcular_escala(xs, ys)
+        puntos = Affine2D().scale(self.ax.figure.dpi / 72)
+        self.nodos = self.ax.scatter(xs, ys, s=self.tamano_nodo * self.escala ** 2, marker=self.forma_nodo,
+                                     zorder=2, clip_on=False, animated=self.animado)
+
+        fuente = FontProperties(size=self.tamano_fuente * self.escala)
+        textos = []
+        for n in self.pos:
+            texto = TextPath((0, 0), str(n), prop=fuente)
+            # Centrado por los puntos de control (get_extents es exacto pero mucho más lento)
+            (x0, y0), (x1, y1) = texto.vertices.min(axis=0), texto.vertices.max(axis=0)
+            textos.append(texto.transformed(Affine2D().translate(-(x0 + x1) / 2, -(y0 + y1) / 2)))
+        self.etiquetas = PathCollection(textos, offsets=list(self.pos.values()), offset_transform=self.ax.transData,
+                                        transform=puntos, facecolors=self.color_etiqueta, linewidths=0,
+                                        zorder=3, clip_on=False, animated=self.animado)
+        self.ax.add_collection(self.etiquetas, autolim=False)
+
+        self.lineas = LineCollection([], linewidths=self.ancho_arista, zorder=1, animated=self.animado)
+        self.ax.add_collection(self.lineas, autolim=False)
+        self.puntas = PathCollection([], offset_transform=self.ax.transData, transform=puntos,
+                                     linewidths=0, zorder=1, clip_on=False, animated=self.animado)
+        self.ax.add_collection(self.puntas, autolim=False)
+
+        # Mismo margen que deja networkx alrededor de los nodos
+        ancho, alto = max(xs) - min(xs), max(ys) - min(ys)
+        self.ax.update_datalim([(min(xs) - 0.05 * ancho, min(ys) - 0.05 * alto),
+                                (max(xs) + 0.05 * ancho, max(ys) + 0.05 * alto)])
+        self.ax.autoscale_view()
+        self.ax.axis("off")
+
+    def _calcular_escala(self, xs, ys):
+        """Factor (<= 1) para que los nodos no se encimen cuando hay muchos."""
+        if len(xs) <= MIN_NODOS_ESCALADO:
+            return 1.0
+        _, _, ancho_px, alto_px = self.ax.bbox.bounds
+        # Separación en pantalla entre vecinos (las disposiciones usan separación 1)
+        separacion = min(ancho_px / (max(xs) - min(xs) + 1), alto_px / (max(ys) - min(ys) + 1))
+        diametro = math.sqrt(self.tamano_nodo) * self.ax.figure.dpi / 72
+        return min(1.0, 0.8 * separacion / diametro)
+
+    def _geometria_arista(self, origen, destino):
+        """
+        Trazo (en datos) y punta (en puntos, con su vértice en datos) de la arista.
+        La punta toca el borde del nodo destino, como en networkx.
+        """
+        a, b = self.ax.transData.transform([self.pos[origen], self.pos[destino]])
+        dx, dy = b[0] - a[0], b[1] - a[1]
+        largo = math.hypot(dx, dy) or 1.0
+        cos, sin = dx / largo, dy / largo
+        radio = math.sqrt(self.tamano_nodo) * self.escala / 2 * self.ax.figure.dpi / 72
+        vertice = tuple(self.ax.transData.inverted().transform((b[0] - cos * radio, b[1] - sin * radio)))
+
+        # Como el estilo "-|>": largo 0.4 y semiancho 0.2 veces el tamaño de la flecha
+        l, w = 0.4 * self.tamano_flecha * self.escala, 0.2 * self.tamano_flecha * self.escala
+        punta = Path([(0, 0), (-l * cos - w * sin, -l * sin + w * cos),
+                      (-l * cos + w * sin, -l * sin - w * cos), (0, 0)], closed=True)
+        return (self.pos[origen], vertice), punta, vertice
+
+    def _actualizar_aristas(self):
+        if not self.aristas:
+            return
+        trazos, puntas, vertices = [], [], []
+        for clave in self.aristas:
+            if clave not in self.geometria:
+                self.geometria[clave] = self._geometria_arista(*clave)
+            trazo, punta, vertice = self.geometria[clave]
+            trazos.append(trazo)
+            puntas.append(punta)
+            vertices.append(vertice)
+        colores = [color for color, _ in self.aristas.values()]
+        self.lineas.set_segments(trazos)
+        self.lineas.set_color(colores)
+        self.lineas.set_linestyle([estilo for _, estilo in self.aristas.values()])
+        self.puntas.set_paths(puntas)
+        self.puntas.set_offsets(vertices)
+        self.puntas.set_facecolor(colores)
+
+    # --- Blitting ---
+    def _al_dibujar(self, evento):
+        """Tras cada dibujo completo (incluido un cambio de tamaño) guarda el fondo y pinta lo animado."""
+        if self.nodos is None or not self.animado:
+            return
+        tamano = tuple(self.ax.bbox.bounds)
+        if tamano != self.tamano_ejes:
+            # Las puntas dependen de la escala en pantalla: se recalculan
+            self.tamano_ejes = tamano
+            self.geometria = {}
+            self._actualizar_aristas()
+        self.fondo = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self._dibujar_animados()
+
+    def _dibujar_animados(self):
+        if self.aristas:
+            self.ax.draw_artist(self.lineas)
+            self.ax.draw_artist(self.puntas)
+        self.ax.draw_artist(self.nodos)
+        self.ax.draw_artist(self.etiquetas)
@@ -1,145 +1,17 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
 
-# ============================================
-#  MODELO: Algoritmo del Banquero (Evitación)
-# ============================================
-
-class ModeloBanquero:
-    """
-    Implementación del Algoritmo del Banquero para EVITACIÓN de interbloqueos.
-
-    - asignacion[i][j]: recursos del tipo j asignados al proceso i
-    - demanda_maxima[i][j]: demanda máxima del proceso i
-    - disponibles[j]: recursos libres del tipo j en el sistema
-    """
-    def __init__(self, asignacion, demanda_maxima, disponibles,
-                 nombres_procesos=None, nombres_recursos=None):
-
-        # Copias de trabajo
-        self.asignacion = [fila[:] for fila in asignacion]
-        self.demanda_maxima = [fila[:] for fila in demanda_maxima]
-        self.disponibles = disponibles[:]
-
-        # Cantidades
-        self.num_procesos = len(asignacion)
-        self.num_recursos = len(disponibles)
-
-        # Nombres que se muestran en la interfaz
-        self.nombres_procesos = (
-            nombres_procesos or [f"P{i}" for i in range(self.num_procesos)]
-        )
-        self.nombres_recursos = (
-            nombres_recursos or [chr(ord("A") + i) for i in range(self.num_recursos)]
-        )
-
-        # Calculamos la matriz de necesidad: NECESIDAD = DEMANDA_MAX - ASIGNACIÓN
-        self._calcular_necesidad()
-
-    def _calcular_necesidad(self):
-        """Calcula la matriz NECESIDAD = DEMANDA_MAX - ASIGNACIÓN."""
-        self.necesidad = []
-        for i in range(self.num_procesos):
-            fila = []
-            for j in range(self.num_recursos):
-                faltante = self.demanda_maxima[i][j] - self.asignacion[i][j]
-                fila.append(faltante)
-            self.necesidad.append(fila)
-
-    def es_estado_seguro(self):
-        """
-        Verifica si el estado actual del sistema es SEGURO.
-
-        Devuelve:
-            (True, secuencia_segura)  -> si existe una secuencia donde
-                                         todos los procesos pueden terminar.
-            (False, secuencia_parcial) -> secuencia de los que sí pudieron
-                                          terminar antes de quedar bloqueados.
-        """
-        trabajo = self.disponibles[:]          # work
-        terminado = [False] * self.num_procesos  # finish
-        secuencia_segura = []
-
-        while len(secuencia_segura) < self.num_procesos:
-            encontrado = False
-
-            for i in range(self.num_procesos):
-                if not terminado[i]:
-                    # ¿Este proceso puede continuar con los recursos actuales?
-                    if all(self.necesidad[i][j] <= trabajo[j]
-                           for j in range(self.num_recursos)):
-                        # Se “ejecuta” el proceso y libera sus recursos
-                        for j in range(self.num_recursos):
-                            trabajo[j] += self.asignacion[i][j]
-                        terminado[i] = True
-                        secuencia_segura.append(i)
-                        encontrado = True
-
-            if not encontrado:
-                break
-
-        es_seguro = len(secuencia_segura) == self.num_procesos
-        return es_seguro, secuencia_segura
-
-    def solicitar_recursos(self, id_proceso, solicitud):
-        """
-        Intenta conceder una solicitud de recursos de un proceso.
-
-        Parámetros:
-            - id_proceso: índice del proceso que solicita (0, 1, 2, ...)
-            - solicitud: lista con los recursos que pide [r0, r1, r2, ...]
-
-        Devuelve:
-            - (True, secuencia_segura)  si la asignación es segura
-            - (False, mensaje_error)    si NO se puede conceder
-        """
-        if len(solicitud) != self.num_recursos:
-            return False, "Solicitud inválida: cantidad de tipos de recurso incorrecta."
-
-        # 1) La solicitud no puede exceder lo que le falta (NECESIDAD)
-        if any(solicitud[j] > self.necesidad[id_proceso][j]
-               for j in range(self.num_recursos)):
-            return False, "La solicitud excede la NECESIDAD restante del proceso."
-
-        # 2) La solicitud no puede exceder los recursos disponibles
-        if any(solicitud[j] > self.disponibles[j]
-               for j in range(self.num_recursos)):
-            return False, "No hay suficientes recursos DISPONIBLES para la solicitud."
-
-        # Guardamos copias por si tenemos que hacer rollback
-        copia_disponibles = self.disponibles[:]
-        copia_asignacion = [fila[:] for fila in self.asignacion]
-        copia_necesidad = [fila[:] for fila in self.necesidad]
+# Permite importar el paquete `simuladores` al ejecutar este archivo directamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-        # Asignación TENTATIVA
-        for j in range(self.num_recursos):
-            self.disponibles[j] -= solicitud[j]
-            self.asignacion[id_proceso][j] += solicitud[j]
-            self.necesidad[id_proceso][j] -= solicitud[j]
-
-        # Comprobamos si con esta asignación el estado sigue siendo seguro
-        es_seguro, secuencia = self.es_estado_seguro()
-
-        if es_seguro:
-            # Dejamos los cambios, devolvemos la secuencia segura
-            return True, secuencia
-        else:
-            # Hacemos rollback (deshacemos la asignación tentativa)
-            self.disponibles = copia_disponibles
-            self.asignacion = copia_asignacion
-            self.necesidad = copia_necesidad
-            return False, (
-                "La asignación dejaría al sistema en un estado INSEGURO.\n"
-                "Esto significa que podría aparecer un interbloqueo,\n"
-                "por lo que el sistema RECHAZA esta solicitud."
-            )
-
-    def reiniciar(self, asignacion, demanda_maxima, disponibles):
-        """Reinicia el modelo con nuevos datos de matrices y recursos."""
-        self.__init__(asignacion, demanda_maxima, disponibles,
-                      self.nombres_procesos, self.nombres_recursos)
+from simuladores.banquero import ModeloBanquero
+from simuladores.banquero.generador import GeneradorInstancias
 
+# Espera tras el último <Configure> antes de redibujar las tablas
+RETARDO_REDIMENSION_MS = 120
 
 # ============================================
 #  VISTA / CONTROLADOR: Interfaz Tkinter
@@ -174,6 +46,19 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
         # Elementos de dibujo
         self.rectangulos_filas = {"asignacion": [], "max": [], "necesidad": []}
         self.id_texto_secuencia_segura = None
+        # Ids de los textos de cada celda y el valor que muestran, para
+        # actualizar solo lo que cambió (ver _refrescar_tablas)
+        self.textos_celdas = {}       # clave -> [[id por recurso] por proceso]
+        self.valores_celdas = {}      # clave -> [[valor mostrado]]
+        self.textos_disponibles = []
+        self.valores_disponibles = []
+        self.tamano_dibujado = None   # (ancho, alto) del último dibujo completo
+        self.redibujo_pendiente = None
+
+        # Último resultado de es_estado_seguro y el estado al que corresponde
+        self.clave_seguridad = None
+        self.resultado_seguridad = None
+        self.clave_registrada = None  # estado cuyo resultado ya se anotó en el log
 
         # Listas de ejemplos
         self.lista_ejemplos_ok = None
@@ -193,28 +78,18 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
 
         De forma que exista al menos una secuencia segura P0 → P1 → ... → Pn.
         """
-        # Recursos iniciales disponibles (entre 1 y 5 por tipo)
-        disponibles_base = [random.randint(1, 5) for _ in range(num_recursos)]
-        trabajo = disponibles_base[:]  # usado para garantizar necesidad <= trabajo
-
-        asignacion = []
-        demanda_maxima = []
-
-        for _ in range(num_procesos):
-            # Necesidad inicial: siempre ≤ trabajo para asegurar seguridad
-            necesidad_i = [random.randint(0, trabajo[j]) for j in range(num_recursos)]
-            # Asignación: valores pequeños para que se entienda visualmente
-            asignacion_i = [random.randint(0, 3) for _ in range(num_recursos)]
-            demanda_max_i = [necesidad_i[j] + asignacion_i[j] for j in range(num_recursos)]
-
-            asignacion.append(asignacion_i)
-            demanda_maxima.append(demanda_max_i)
-
-            # Simulamos que el proceso se ejecuta y libera recursos
-            for j in range(num_recursos):
-                trabajo[j] += asignacion_i[j]
-
-        return asignacion, demanda_maxima, disponibles_base
+        # Recursos disponibles entre 1 y 5 por tipo, asignaciones entre 0 y 3
+        # para que se entienda visualmente; sin barajar, para que P0 → ... → Pn
+        # sea una secuencia segura.
+        generador = GeneradorInstancias(
+            semilla=random.randrange(2 ** 32),
+            num_procesos=num_procesos,
+            num_recursos=num_recursos,
+            barajar=False,
+            vectorizado=False,
+        )
+        asignacion, demanda_maxima, disponibles, _ = generador.instancia(0)
+        return asignacion, demanda_maxima, disponibles
 
     # ----------------------------------------
     # Construcción de la interfaz
@@ -490,21 +365,39 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
         self.texto_log.pack(fill="both", expand=True, pady=(2, 0))
         self._agregar_log("Simulador iniciado con datos aleatorios. Usa los pasos del panel izquierdo.")
 
-        self.canvas.bind("<Configure>", lambda e: self._dibujar_tablas())
+        self.canvas.bind("<Configure>", self._al_redimensionar)
 
     # ----------------------------------------
     # Dibujo de tablas
     # ----------------------------------------
+    def _al_redimensionar(self, evento):
+        """Agrupa los <Configure> seguidos: redibuja una sola vez cuando dejan de llegar."""
+        if self.redibujo_pendiente is not None:
+            self.after_cancel(self.redibujo_pendiente)
+        self.redibujo_pendiente = self.after(RETARDO_REDIMENSION_MS, self._redibujar_si_cambio_tamano)
+
+    def _redibujar_si_cambio_tamano(self):
+        self.redibujo_pendiente = None
+        if (self.canvas.winfo_width(), self.canvas.winfo_height()) != self.tamano_dibujado:
+            self._dibujar_tablas()
+
     def _dibujar_tablas(self):
+        """Dibuja desde cero los cuatro paneles (al iniciar o al cambiar de tamaño)."""
         self.canvas.delete("all")
         self.rectangulos_filas = {"asignacion": [], "max": [], "necesidad": []}
         self.id_texto_secuencia_segura = None
+        self.textos_celdas = {}
+        self.valores_celdas = {}
+        self.textos_disponibles = []
+        self.valores_disponibles = []
+        self.tamano_dibujado = None
 
         ancho = self.canvas.winfo_width()
         alto = self.canvas.winfo_height()
 
         if ancho < 100 or alto < 100:
             return
+        self.tamano_dibujado = (ancho, alto)
 
         margen = 20
         ancho_columna = (ancho - 2 * margen) / 4
@@ -530,26 +423,88 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             x_inicial, margen, ancho_columna, alto - 80
         )
 
-        es_seguro, secuencia = self.modelo.es_estado_seguro()
+        self.id_texto_secuencia_segura = self.canvas.create_text(
+            ancho / 2, alto - 30,
+            font=("Segoe UI", 11, "bold")
+        )
+        self._mostrar_seguridad()
+
+    def _refrescar_tablas(self):
+        """
+        Tras un cambio del modelo (solicitud, reinicio): cambia el texto solo
+        de las celdas cuyo valor es distinto del que se muestra, sin borrar ni
+        volver a crear nada.
+        """
+        if self.tamano_dibujado is None or len(self.valores_disponibles) != self.modelo.num_recursos:
+            self._dibujar_tablas()
+            return
+
+        for j, nombre_recurso in enumerate(self.modelo.nombres_recursos):
+            valor = self.modelo.disponibles[j]
+            if valor != self.valores_disponibles[j]:
+                self.canvas.itemconfig(self.textos_disponibles[j], text=f"{nombre_recurso}: {valor}")
+                self.valores_disponibles[j] = valor
+
+        for clave, textos in self.textos_celdas.items():
+            matriz = self._matriz(clave)
+            valores = self.valores_celdas[clave]
+            for i, fila in enumerate(textos):
+                for j, id_texto in enumerate(fila):
+                    if matriz[i][j] != valores[i][j]:
+                        self.canvas.itemconfig(id_texto, text=str(matriz[i][j]))
+                        valores[i][j] = matriz[i][j]
+
+        self._mostrar_seguridad()
+
+    def _mostrar_seguridad(self):
+        """HUD y texto inferior con el resultado de seguridad; se anota en el log una vez por estado."""
+        es_seguro, secuencia = self._estado_seguro()
+        registrar = self.clave_seguridad != self.clave_registrada
+        self.clave_registrada = self.clave_seguridad
         if es_seguro:
             self._actualizar_estado_hud("SEGURO", "#22c55e")
             texto = f"Secuencia segura posible: {self._secuencia_a_cadena(secuencia)}"
-            self.id_texto_secuencia_segura = self.canvas.create_text(
-                ancho / 2, alto - 30,
-                text=texto,
-                font=("Segoe UI", 11, "bold"),
-                fill="#4ade80"
-            )
-            self._agregar_log(f"Estado actual SEGURO. {texto}")
+            self.canvas.itemconfig(self.id_texto_secuencia_segura, text=texto, fill="#4ade80")
+            if registrar:
+                self._agregar_log(f"Estado actual SEGURO. {texto}")
         else:
             self._actualizar_estado_hud("INSEGURO", "#ef4444")
-            self.id_texto_secuencia_segura = self.canvas.create_text(
-                ancho / 2, alto - 30,
+            self.canvas.itemconfig(
+                self.id_texto_secuencia_segura,
                 text="Estado INSEGURO: no existe una secuencia que ejecute a todos los procesos.",
-                font=("Segoe UI", 11, "bold"),
                 fill="#f87171"
             )
-            self._agregar_log("Estado actual INSEGURO: no existe una secuencia segura.")
+            if registrar:
+                self._agregar_log("Estado actual INSEGURO: no existe una secuencia segura.")
+
+    # ----------------------------------------
+    # Resultado de seguridad
+    # ----------------------------------------
+    def _clave_estado(self):
+        """Lo que determina el resultado de es_estado_seguro: disponibles, asignación y necesidad."""
+        return (tuple(self.modelo.disponibles),
+                tuple(tuple(fila) for fila in self.modelo.asignacion),
+                tuple(tuple(fila) for fila in self.modelo.necesidad))
+
+    def _estado_seguro(self):
+        """es_estado_seguro() del modelo, reutilizado mientras el estado no cambie."""
+        clave = self._clave_estado()
+        if clave != self.clave_seguridad:
+            self.resultado_seguridad = self.modelo.es_estado_seguro()
+            self.clave_seguridad = clave
+        return self.resultado_seguridad
+
+    def _recordar_seguridad(self, resultado):
+        """Guarda un resultado ya calculado para el estado actual (p. ej. el de solicitar_recursos)."""
+        self.clave_seguridad = self._clave_estado()
+        self.resultado_seguridad = resultado
+
+    def _matriz(self, clave):
+        if clave == "asignacion":
+            return self.modelo.asignacion
+        if clave == "max":
+            return self.modelo.demanda_maxima
+        return self.modelo.necesidad
 
     def _dibujar_seccion_disponibles(self, x, y, ancho, alto):
         titulo = "Disponibles"
@@ -568,12 +523,13 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
         espacio = ancho / (len(self.modelo.nombres_recursos) + 1)
         for j, nombre_recurso in enumerate(self.modelo.nombres_recursos):
             cx = x + espacio * (j + 1)
-            self.canvas.create_text(
+            self.textos_disponibles.append(self.canvas.create_text(
                 cx, y_valores,
                 text=f"{nombre_recurso}: {self.modelo.disponibles[j]}",
                 font=("Segoe UI", 10, "bold"),
                 fill="#a5b4fc"
-            )
+            ))
+            self.valores_disponibles.append(self.modelo.disponibles[j])
 
         self.canvas.create_text(
             x + ancho / 2, y_valores + 40,
@@ -632,14 +588,11 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
                 fill="#9ca3af"
             )
 
-        if clave == "asignacion":
-            matriz = self.modelo.asignacion
-        elif clave == "max":
-            matriz = self.modelo.demanda_maxima
-        else:
-            matriz = self.modelo.necesidad
+        matriz = self._matriz(clave)
 
         lista_rectangulos = []
+        textos_matriz = []
+        valores_matriz = []
         for i, nombre_proceso in enumerate(self.modelo.nombres_procesos):
             y_fila = parte_superior + (i + 1) * alto_fila
 
@@ -651,6 +604,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             )
 
             rectangulos_proceso = []
+            textos_proceso = []
             for j in range(self.modelo.num_recursos):
                 cx = izquierda + ancho_columna * (j + 1) + ancho_columna / 2
                 x0 = cx - ancho_columna / 2 + 3
@@ -663,15 +617,19 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
                     fill="#020617", outline="#1f2937"
                 )
                 rectangulos_proceso.append(rect)
-                self.canvas.create_text(
+                textos_proceso.append(self.canvas.create_text(
                     cx, y_fila,
                     text=str(matriz[i][j]),
                     font=("Segoe UI", 10),
                     fill="#e5e7eb"
-                )
+                ))
             lista_rectangulos.append(rectangulos_proceso)
+            textos_matriz.append(textos_proceso)
+            valores_matriz.append(list(matriz[i]))
 
         self.rectangulos_filas[clave] = lista_rectangulos
+        self.textos_celdas[clave] = textos_matriz
+        self.valores_celdas[clave] = valores_matriz
 
     # ----------------------------------------
     # Animaciones / HUD / Log
@@ -747,7 +705,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
     # Eventos de botones
     # ----------------------------------------
     def _evento_comprobar_seguridad(self):
-        es_seguro, secuencia = self.modelo.es_estado_seguro()
+        es_seguro, secuencia = self._estado_seguro()
         if es_seguro:
             self._actualizar_estado_hud("SEGURO", "#22c55e")
             self._parpadear_estado("#22c55e", "#16a34a")
@@ -759,7 +717,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             )
             messagebox.showinfo("Estado SEGURO", mensaje)
             self._agregar_log(mensaje.replace("\n", " "))
-            self._dibujar_tablas()
+            self._refrescar_tablas()
             self._animar_secuencia_segura(secuencia)
         else:
             self._actualizar_estado_hud("INSEGURO", "#ef4444")
@@ -771,7 +729,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             )
             messagebox.showwarning("Estado INSEGURO", mensaje)
             self._agregar_log(mensaje.replace("\n", " "))
-            self._dibujar_tablas()
+            self._refrescar_tablas()
 
     def _evento_simular_solicitud(self):
         nombre_proceso = self.valor_proceso.get()
@@ -797,6 +755,8 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
         exito, resultado = self.modelo.solicitar_recursos(id_proceso, solicitud)
         if exito:
             secuencia = resultado
+            # solicitar_recursos ya comprobó la seguridad del estado resultante
+            self._recordar_seguridad((True, secuencia))
             self._actualizar_estado_hud("SEGURO", "#22c55e")
             self._parpadear_estado("#22c55e", "#16a34a")
             mensaje = (
@@ -807,7 +767,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             )
             messagebox.showinfo("Solicitud concedida", mensaje)
             self._agregar_log(mensaje.replace("\n", " "))
-            self._dibujar_tablas()
+            self._refrescar_tablas()
             self._animar_secuencia_segura(secuencia)
         else:
             mensaje_error = resultado
@@ -821,7 +781,7 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
             self.num_procesos, self.num_recursos
         )
         self.modelo.reiniciar(asignacion, demanda_maxima, disponibles)
-        self._dibujar_tablas()
+        self._refrescar_tablas()
         self._agregar_log("Ejemplo reiniciado con nuevos datos ALEATORIOS.")
 
         for entrada in self.entradas_solicitud:
@@ -842,42 +802,40 @@ class AplicacionEvitacionInterbloqueos(tk.Tk):
         self.lista_ejemplos_bad.delete(0, "end")
 
         ya_vistos = set()
+        candidatos = []
 
         for id_proceso in range(self.modelo.num_procesos):
             fila_necesidad = self.modelo.necesidad[id_proceso]
 
             # Ejemplo 1: pedir exactamente lo que le falta (necesidad)
             if any(fila_necesidad):
-                solicitud_1 = fila_necesidad[:]
-                self._evaluar_ejemplo(id_proceso, solicitud_1, ya_vistos)
+                solicitud_1 = list(fila_necesidad)
+                self._agregar_ejemplo(candidatos, ya_vistos, id_proceso, solicitud_1)
 
             # Ejemplo 2: pedir 1 unidad de cada recurso que todavía necesita
             solicitud_2 = [1 if n > 0 else 0 for n in fila_necesidad]
             if any(solicitud_2):
-                self._evaluar_ejemplo(id_proceso, solicitud_2, ya_vistos)
+                self._agregar_ejemplo(candidatos, ya_vistos, id_proceso, solicitud_2)
 
             # Ejemplo 3: pasarme un poco de lo que necesita (seguro se rechaza por NECESIDAD)
             solicitud_3 = [n + 1 if n > 0 else 1 for n in fila_necesidad]
-            self._evaluar_ejemplo(id_proceso, solicitud_3, ya_vistos)
+            self._agregar_ejemplo(candidatos, ya_vistos, id_proceso, solicitud_3)
+
+        # Todas las solicitudes se evalúan de una vez contra el estado actual
+        resultados = self.modelo.evaluar_solicitudes(candidatos)
+        for (id_proceso, solicitud), (exito, resultado) in zip(candidatos, resultados):
+            self._mostrar_ejemplo(id_proceso, solicitud, exito, resultado)
 
         self._agregar_log("Ejemplos generados automáticamente para el estado actual.")
 
-    def _evaluar_ejemplo(self, id_proceso, solicitud, ya_vistos):
+    def _agregar_ejemplo(self, candidatos, ya_vistos, id_proceso, solicitud):
         clave = (id_proceso, tuple(solicitud))
         if clave in ya_vistos:
             return
         ya_vistos.add(clave)
+        candidatos.append((id_proceso, solicitud))
 
-        # Modelo temporal (para no modificar el original)
-        modelo_temporal = ModeloBanquero(
-            [fila[:] for fila in self.modelo.asignacion],
-            [fila[:] for fila in self.modelo.demanda_maxima],
-            self.modelo.disponibles[:],
-            self.modelo.nombres_procesos,
-            self.modelo.nombres_recursos
-        )
-
-        exito, resultado = modelo_temporal.solicitar_recursos(id_proceso, solicitud)
+    def _mostrar_ejemplo(self, id_proceso, solicitud, exito, resultado):
         nombre_proceso = self.modelo.nombres_procesos[id_proceso]
 
         if exito:
@@ -1,12 +1,32 @@
-import tkinter as tk
-from tkinter import scrolledtext, ttk, messagebox
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import argparse
+from collections import deque, namedtuple
 import random
 import time
 from datetime import datetime
 import os
+import sys
+
+# Permite importar el paquete `simuladores` al ejecutar este archivo directamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simuladores.deteccion import (DetectorMatricial, GrafoEspera, componentes_fuertemente_conexas,
+                                   victimas_de_costo_minimo, victimas_por_componente)
+from simuladores.deteccion.politicas import POLITICAS_DETECCION, PoliticaDeteccion, crear_politica
+from simuladores.grafico import DISPOSICIONES, CacheDisposicion, PlanificadorRepintado, RenderizadorGrafo
+
+# --- INTERFAZ ---
+# tkinter y pyplot se importan recién al abrir la ventana, así el modo sin
+# interfaz funciona en una máquina sin pantalla ni toolkit gráfico
+tk = scrolledtext = ttk = messagebox = plt = FigureCanvasTkAgg = None
+
+
+def importar_interfaz():
+    global tk, scrolledtext, ttk, messagebox, plt, FigureCanvasTkAgg
+    import tkinter as tk
+    from tkinter import scrolledtext, ttk, messagebox
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
 
 DATA_DIR = os.path.join("data", "logs_deteccion")
 
@@ -15,56 +35,288 @@ NUM_PROCESOS = 10
 LOG_FILENAME = os.path.join(DATA_DIR, "simulacion_deadlock_log.txt")
 METRICS_FILENAME = os.path.join(DATA_DIR, "simulacion_deadlock_metrics.txt")
 
+# "en_linea": el ciclo se detecta al insertar la arista (orden topológico dinámico)
+# "incremental": se busca en cada paso, partiendo solo de las aristas nuevas
+# "componentes": como "en_linea", pero al detectar se calculan TODAS las
+#                componentes fuertemente conexas y se resuelven juntas
+# "matricial": algoritmo de matrices ASIGNACIÓN / SOLICITUD / DISPONIBLES
+#              (Coffman/Shoshani), válido también con recursos de varias unidades;
+#              las víctimas se eligen solo entre los ciclos de espera, no entre
+#              los que esperan detrás de ellos
+MODOS_DETECCION = ("en_linea", "incremental", "componentes", "matricial")
+
+# Pausa por defecto entre la notificación de un interbloqueo y su resolución (puede ser 0)
+RETARDO_RECUPERACION_MS = 3000
+
+# "panel": avisos sin bloquear (panel de estado + cola de eventos)
+# "modal": cuadros de diálogo que detienen la simulación hasta pulsar Aceptar
+MODOS_NOTIFICACION = ("panel", "modal")
+MAX_EVENTOS = 1000        # Eventos guardados en la cola (se descartan los más viejos)
+MAX_AVISOS_PANEL = 50     # Avisos visibles en el panel
+COLORES_AVISO = {"interbloqueo": "#f8d7da", "recuperacion": "#d4edda"}
+
+# Pausa entre pasos de la simulación (en el modo sin interfaz avanza el reloj simulado)
+RETARDO_PASO_MS = 500
+# Repintados por segundo como máximo; los pasos intermedios se agrupan en un frame (0: repintar en cada paso)
+MAX_FPS = 10
+
+# "reinicio": la víctima libera todo y vuelve a empezar
+# "retroceso": la víctima vuelve a su checkpoint más reciente que rompa el interbloqueo
+MODOS_RECUPERACION = ("reinicio", "retroceso")
+INTERVALO_CHECKPOINT_S = 2.0
+MAX_CHECKPOINTS = 8 # Por proceso; si ninguno sirve, el retroceso equivale a reiniciar
+
+# Opciones de detección, recuperación e interfaz de SimuladorDeadlock; los
+# valores por omisión son los de la línea de comandos. Con
+# `configuracion._replace(...)` se derivan variantes para comparar.
+#   modo_deteccion:          uno de MODOS_DETECCION
+#   costo_victima:           None (una víctima por interbloqueo, criterio
+#                            clásico), un nombre de COSTOS_VICTIMA o una
+#                            función (proceso, ahora) -> costo
+#   politica_deteccion:      nombre de POLITICAS_DETECCION (cada simulador
+#                            crea la suya con `opciones_politica`) o instancia
+#   recuperacion:            uno de MODOS_RECUPERACION
+#   notificacion:            uno de MODOS_NOTIFICACION
+#   max_fps y disposicion:   solo afectan a la interfaz (sin ella,
+#                            retardo_paso_ms avanza el reloj simulado)
+ConfiguracionSimulador = namedtuple(
+    "ConfiguracionSimulador",
+    "modo_deteccion costo_victima politica_deteccion opciones_politica recuperacion intervalo_checkpoint_s "
+    "retardo_recuperacion_ms notificacion retardo_paso_ms max_fps disposicion",
+    defaults=("en_linea", None, "cada_paso", None, "reinicio", INTERVALO_CHECKPOINT_S,
+              RETARDO_RECUPERACION_MS, "panel", RETARDO_PASO_MS, MAX_FPS, "auto"),
+)
+
 # --- 2. CLASES DEL SISTEMA ---
 
+# Estado guardado de un proceso: el conjunto de recursos es inmutable y se
+# comparte con el checkpoint anterior mientras no cambie
+Checkpoint = namedtuple("Checkpoint", "tiempo trabajo asignados")
+
+def nombre_proceso(pid):
+    """Nombre para mostrar del proceso `pid` (P0, P1, ...)."""
+    return f"P{pid}"
+
+def nombres_procesos(pids):
+    return [nombre_proceso(pid) for pid in pids]
+
+
 class Proceso:
-    def __init__(self, pid):
-        self.id = f"P{pid}"
+    def __init__(self, pid, tiempo_inicio=None):
+        self.id = pid # Entero: también es su posición en SimuladorDeadlock.procesos
         self.asignados = set()
         self.solicitando = None
-        self.tiempo_inicio = time.time()
+        self.tiempo_inicio = time.time() if tiempo_inicio is None else tiempo_inicio
+        self.tiempo_reinicio = self.tiempo_inicio
+        self.reinicios = 0
         self.tiempo_espera_total = 0
         self.tiempo_bloqueo_inicio = None
+        self.turno_espera = 0 # Cambia en cada bloqueo; invalida los turnos viejos en las colas
+        self.checkpoints = deque(maxlen=MAX_CHECKPOINTS) # Del más viejo al más nuevo
+        self.retrocesos = 0
         self.estado = "Listo" # Listo, Ejecutando, Bloqueado, Terminado
 
+    def trabajo_realizado(self, ahora):
+        """Tiempo sin bloquear desde el último (re)inicio: lo que se pierde si se reinicia."""
+        espera = self.tiempo_espera_total
+        if self.tiempo_bloqueo_inicio is not None:
+            espera += ahora - self.tiempo_bloqueo_inicio
+        return max(0.0, ahora - self.tiempo_reinicio - espera)
+
+    @property
+    def nombre(self):
+        return nombre_proceso(self.id)
+
     def __repr__(self):
-        return f"Proceso({self.id}, Estado: {self.estado})"
+        return f"Proceso({self.nombre}, Estado: {self.estado})"
+
+
+# Criterio clásico de VÍCTIMA: menor cantidad de recursos, desempatando por más antiguo
+def criterio_victima(proceso):
+    # Tupla: (cantidad_recursos_asignados, -tiempo_inicio)
+    return (len(proceso.asignados), -proceso.tiempo_inicio)
+
+
+# Costos para elegir el conjunto de víctimas de costo mínimo (costo_victima=...)
+def costo_recursos(proceso, ahora):
+    return len(proceso.asignados)
+
+def costo_trabajo(proceso, ahora):
+    return proceso.trabajo_realizado(ahora)
+
+def costo_reinicios(proceso, ahora):
+    return proceso.reinicios
+
+COSTOS_VICTIMA = {
+    "recursos": costo_recursos,
+    "trabajo": costo_trabajo,
+    "reinicios": costo_reinicios,
+}
 
 class SimuladorDeadlock:
-    def __init__(self, root):
+    """
+    Con `root=None` funciona SIN INTERFAZ: recorre la misma máquina de estados
+    lo más rápido posible sobre un reloj simulado (cada paso avanza
+    `retardo_paso_ms` y cada recuperación `retardo_recuperacion_ms`), sin
+    dibujar el grafo ni mostrar mensajes, y escribe el mismo log y las mismas
+    métricas. La simulación se lanza con `ejecutar_sin_interfaz()`.
+
+    Los avisos de interbloqueo y recuperación se encolan en `eventos` (ver
+    tomar_eventos) y, con interfaz, se muestran en un panel sin detener la
+    simulación, salvo con notificacion="modal".
+
+    Con interfaz, los pasos no redibujan: marcan la vista como desactualizada
+    y se repinta como máximo `max_fps` veces por segundo (PlanificadorRepintado),
+    así `retardo_paso_ms` puede ser mucho menor que el tiempo de un frame.
+
+    Las opciones de detección, recuperación e interfaz llegan juntas en una
+    ConfiguracionSimulador (por omisión, la de la línea de comandos).
+    """
+    def __init__(self, root, configuracion=None, semilla=None,
+                 archivo_log=LOG_FILENAME, archivo_metricas=METRICS_FILENAME, num_procesos=NUM_PROCESOS):
+        if configuracion is None:
+            configuracion = ConfiguracionSimulador()
+        (modo_deteccion, costo_victima, politica_deteccion, opciones_politica, recuperacion,
+         intervalo_checkpoint_s, retardo_recuperacion_ms, notificacion, retardo_paso_ms, max_fps,
+         disposicion) = configuracion
+        if modo_deteccion not in MODOS_DETECCION:
+            raise ValueError(f"Modo de detección desconocido: {modo_deteccion!r}. "
+                             f"Opciones: {', '.join(MODOS_DETECCION)}")
+        # None: una víctima por interbloqueo con criterio_victima; si no, un
+        # nombre de COSTOS_VICTIMA o una función (proceso, ahora) -> costo
+        if isinstance(costo_victima, str):
+            if costo_victima not in COSTOS_VICTIMA:
+                raise ValueError(f"Costo de víctima desconocido: {costo_victima!r}. "
+                                 f"Opciones: {', '.join(COSTOS_VICTIMA)}")
+            costo_victima = COSTOS_VICTIMA[costo_victima]
+        if recuperacion not in MODOS_RECUPERACION:
+            raise ValueError(f"Modo de recuperación desconocido: {recuperacion!r}. "
+                             f"Opciones: {', '.join(MODOS_RECUPERACION)}")
+        if notificacion not in MODOS_NOTIFICACION:
+            raise ValueError(f"Modo de notificación desconocido: {notificacion!r}. "
+                             f"Opciones: {', '.join(MODOS_NOTIFICACION)}")
+        if retardo_recuperacion_ms < 0:
+            raise ValueError("El retardo de recuperación no puede ser negativo")
+        if retardo_paso_ms < 0:
+            raise ValueError("El retardo entre pasos no puede ser negativo")
         self.root = root
+        self.configuracion = configuracion
+        self.modo_deteccion = modo_deteccion
+        self.costo_victima = costo_victima
+        self.num_procesos = num_procesos
+        # Cuándo ejecutar el detector: nombre de POLITICAS_DETECCION o instancia
+        if not isinstance(politica_deteccion, PoliticaDeteccion):
+            politica_deteccion = crear_politica(politica_deteccion, **(opciones_politica or {}))
+        self.politica = politica_deteccion
+        self.recuperacion = recuperacion
+        self.intervalo_checkpoint_s = intervalo_checkpoint_s
+        self.retardo_recuperacion_ms = retardo_recuperacion_ms
+        self.notificacion = notificacion
+        self.retardo_paso_ms = retardo_paso_ms
+        self.eventos = deque(maxlen=MAX_EVENTOS)
+        self.rng = random.Random(semilla)
+        self.archivo_metricas = archivo_metricas
+
+        # Reloj simulado (solo sin interfaz) y siguiente paso pendiente
+        self.reloj_simulado = time.time()
+        self._siguiente_paso = None
+        self.metricas = None
         
         self.recursos = {} 
 
-        # Lista que contiene los 10 procesos iniciales (P0-P9)
-        self.procesos = [Proceso(i) for i in range(NUM_PROCESOS)]
+        # Lista que contiene los procesos iniciales (P0-P9 por defecto); el
+        # id de cada uno es su posición en la lista
+        self.procesos = [Proceso(i, self.ahora()) for i in range(self.num_procesos)]
+        self.procesos_por_id = {p.id: p for p in self.procesos}
         
         self.procesos_terminados_exitosamente = set()
         self.after_id = None
         self.indice_proceso_actual = 0 
         self.deadlock_cycle = None
-        
+        self.deadlock_componentes = []
+
         # Estadísticas
         self.solicitudes_totales = 0
         self.solicitudes_satisfechas = 0
         self.bloqueos_temporales = 0
         self.interbloqueos_detectados = 0
         self.procesos_victimas = 0
-        self.tiempo_simulacion_inicio = time.time()
+        self.rondas_recuperacion = 0
+        self.rondas_ahorradas = 0
+        self.trabajo_perdido = 0.0
+        self.trabajo_perdido_criterio_clasico = 0.0
+        self.tiempo_simulacion_inicio = self.ahora()
+        self.ticks_deteccion = 0
+        self.aristas_tocadas_total = 0
+        self.contadores_ultimo_tick = {"aristas_modificadas": 0, "aristas_examinadas": 0}
+
+        # Costo de la detección y latencia (tiempo desde que se forma un
+        # interbloqueo hasta que el detector lo encuentra)
+        self.bloqueados = {}                  # pid -> inicio del bloqueo actual
+        self.interbloqueos_sin_detectar = []  # [(inicio, procesos del ciclo)]
+        self.tiempo_deteccion_s = 0.0
+        self.latencias_deteccion = []
+
+        # Checkpoints (modo "retroceso")
+        self.ultimo_checkpoint = self.ahora()
+        self.checkpoints_tomados = 0
+        self.estados_copiados = 0
+        self.estados_compartidos = 0
+        self.tiempo_checkpoints_s = 0.0
+        self.retrocesos = 0
+        self.trabajo_conservado = 0.0
         
         self.patron_interbloqueo = self.generar_multiples_patrones_deadlock()
+
+        # Cola FIFO de (proceso, turno) por recurso: al liberarse, el recurso
+        # pasa directamente al primero que lo esperaba
+        self.colas_espera = {r_id: deque() for r_id in self.recursos}
+
+        # Detector persistente (grafo de espera o matrices): se actualiza con
+        # cada evento en vez de reconstruirse en cada paso
+        self.detector = self.crear_detector()
         
-        self.setup_gui() 
+        self.repintado = None
+        # Posiciones de los nodos: se recalculan solo si cambian los procesos o recursos
+        self.disposicion = CacheDisposicion(disposicion)
+        if self.root is not None:
+            importar_interfaz()
+            self.setup_gui() 
+            self.repintado = PlanificadorRepintado(self.root.after, self.repintar, max_fps)
             
-        try:
-            self.log_file = open(LOG_FILENAME, "w", encoding="utf-8")
-        except Exception as e:
-            print(f"Advertencia: No se pudo abrir el archivo de log con UTF-8: {e}")
-            self.log_file = None 
+        self.log_file = None
+        if archivo_log is not None:
+            try:
+                self.log_file = open(archivo_log, "w", encoding="utf-8")
+            except Exception as e:
+                print(f"Advertencia: No se pudo abrir el archivo de log con UTF-8: {e}")
             
         self.log_event("Simulación Iniciada (Múltiples Interbloqueos Forzados).")
         
-        self.ciclo_simulacion()
+        if self.root is not None:
+            self.ciclo_simulacion()
+
+    # --- Reloj y planificación de pasos ---
+
+    def ahora(self):
+        """Hora real con interfaz; reloj simulado sin ella."""
+        return time.time() if self.root is not None else self.reloj_simulado
+
+    def programar(self, retardo_ms, funcion):
+        """root.after con interfaz; sin ella avanza el reloj y deja `funcion` como siguiente paso."""
+        if self.root is not None:
+            return self.root.after(retardo_ms, funcion)
+        self.reloj_simulado += retardo_ms / 1000
+        self._siguiente_paso = funcion
+        return None
+
+    def ejecutar_sin_interfaz(self):
+        """Ejecuta la simulación completa sin esperas y devuelve las métricas."""
+        self._siguiente_paso = self.ciclo_simulacion
+        while self._siguiente_paso is not None:
+            paso, self._siguiente_paso = self._siguiente_paso, None
+            paso()
+        return self.metricas
 
     def generar_multiples_patrones_deadlock(self):
         """
@@ -73,9 +325,9 @@ class SimuladorDeadlock:
         pattern = {}
         
         deadlock_pairs = [
-            ("P0", "P1", "R0", "R1"),
-            ("P2", "P6", "R2", "R3"),
-            ("P4", "P8", "R4", "R5"),
+            (0, 1, "R0", "R1"),
+            (2, 6, "R2", "R3"),
+            (4, 8, "R4", "R5"),
         ]
         
         recursos_utilizados = set()
@@ -92,8 +344,7 @@ class SimuladorDeadlock:
 
         # Patrón simple para el resto de procesos
         next_free_resource_index = 6
-        for i in range(NUM_PROCESOS):
-            pid = f"P{i}"
+        for pid in range(self.num_procesos):
             if pid not in procesos_ocupados:
                 # Usamos recursos R6, R7, R8, R9
                 r_simple = f"R{next_free_resource_index}"
@@ -105,6 +356,11 @@ class SimuladorDeadlock:
         
         return pattern
 
+    def crear_detector(self):
+        if self.modo_deteccion == "matricial":
+            return DetectorMatricial([p.id for p in self.procesos], self.recursos)
+        return GrafoEspera(en_linea=(self.modo_deteccion != "incremental"))
+
     # --- 3. GESTIÓN DEL SISTEMA ---
 
     def solicitar_recurso(self, proceso, recurso_id):
@@ -116,136 +372,349 @@ class SimuladorDeadlock:
             proceso.asignados.add(recurso_id)
             proceso.solicitando = None
             proceso.estado = "Ejecutando"
+            self.bloqueados.pop(proceso.id, None)
+            self.detector.asignar(proceso.id, recurso_id)
             self.solicitudes_satisfechas += 1
-            self.log_event(f"ASIGNADO: {proceso.id} a {recurso_id}. Estado: {proceso.estado}")
+            self.log_event(f"ASIGNADO: {proceso.nombre} a {recurso_id}. Estado: {proceso.estado}")
             return True
         else:
             proceso.estado = "Bloqueado"
             self.bloqueos_temporales += 1
             if proceso.tiempo_bloqueo_inicio is None:
-                proceso.tiempo_bloqueo_inicio = time.time()
-            self.log_event(f"BLOQUEO: {proceso.id} solicita {recurso_id}, retenido por {self.recursos[recurso_id]}.")
+                proceso.tiempo_bloqueo_inicio = self.ahora()
+            proceso.turno_espera += 1
+            self.colas_espera[recurso_id].append((proceso, proceso.turno_espera))
+            self.bloqueados[proceso.id] = self.ahora()
+            self.detector.esperar(proceso.id, recurso_id, self.recursos[recurso_id])
+            self._registrar_inicio_interbloqueo(proceso)
+            self.log_event(f"BLOQUEO: {proceso.nombre} solicita {recurso_id}, retenido por {nombre_proceso(self.recursos[recurso_id])}.")
             return False
 
-    def liberar_recursos(self, proceso):
-        for rec in list(proceso.asignados):
+    def _registrar_inicio_interbloqueo(self, proceso):
+        """
+        Solo para medir la latencia de detección: cada proceso espera a lo
+        sumo un recurso, así que basta seguir la cadena de dueños desde el que
+        se acaba de bloquear para saber si cerró un ciclo en este instante.
+        """
+        ciclo = [proceso.id]
+        actual = proceso
+        for _ in range(self.num_procesos):
+            dueno = self.recursos.get(actual.solicitando)
+            if dueno is None or dueno not in self.bloqueados:
+                return
+            if dueno == proceso.id:
+                self.interbloqueos_sin_detectar.append((self.ahora(), set(ciclo)))
+                return
+            ciclo.append(dueno)
+            actual = self.procesos_por_id[dueno]
+
+    def liberar_recursos(self, proceso, recursos=None):
+        """Libera `recursos` (por defecto todos los que tiene) y despierta a quienes los esperan."""
+        liberados = []
+        for rec in list(proceso.asignados if recursos is None else recursos):
             if self.recursos.get(rec) == proceso.id:
                  self.recursos[rec] = None
+                 self.detector.liberar(proceso.id, rec)
+                 liberados.append(rec)
             proceso.asignados.remove(rec)
-            self.log_event(f"LIBERADO: {proceso.id} liberó el recurso {rec}.")
+            self.log_event(f"LIBERADO: {proceso.nombre} liberó el recurso {rec}.")
             
         if proceso.tiempo_bloqueo_inicio is not None:
-            proceso.tiempo_espera_total += (time.time() - proceso.tiempo_bloqueo_inicio)
+            proceso.tiempo_espera_total += (self.ahora() - proceso.tiempo_bloqueo_inicio)
             proceso.tiempo_bloqueo_inicio = None
         
         proceso.estado = "Listo"
-        self.despertar_bloqueados()
+        self.bloqueados.pop(proceso.id, None)
+        self.despertar_bloqueados(liberados)
 
     # --- 4. DETECCIÓN Y RECUPERACIÓN ---
 
+    # --- Datos que consultan las políticas de detección ---
+
+    def proporcion_bloqueados(self):
+        activos = self.num_procesos - len(self.procesos_terminados_exitosamente)
+        return len(self.bloqueados) / activos if activos else 0.0
+
+    def espera_maxima(self):
+        return self.ahora() - min(self.bloqueados.values()) if self.bloqueados else 0.0
+
+    def toca_detectar(self):
+        # Si todos los procesos activos están bloqueados nadie más puede
+        # avanzar: se detecta aunque la política diga que aún no
+        activos = self.num_procesos - len(self.procesos_terminados_exitosamente)
+        return len(self.bloqueados) == activos or self.politica.debe_detectar(self)
+
     def detectar_interbloqueo(self):
-        G = nx.DiGraph()
-        
-        # 1. Construir el Grafo de Espera (Edges P -> P)
-        for p in self.procesos:
-            if p.solicitando:
-                recurso_solicitado = p.solicitando
-                proceso_dueno_id = self.recursos.get(recurso_solicitado)
-                # Arista P_solicitante -> P_dueno
-                if proceso_dueno_id and proceso_dueno_id != p.id:
-                    G.add_edge(p.id, proceso_dueno_id)
-        
-        # 2. Buscar Ciclos
-        try:
-            cycle_edges = nx.find_cycle(G, orientation='original')
-            
-            cycle_pids = set()
-            for u, v, data in cycle_edges:
-                cycle_pids.add(u)
-                cycle_pids.add(v)
-                
-            self.interbloqueos_detectados += 1
-            self.deadlock_cycle = sorted(list(cycle_pids)) 
-            self.log_event(f"!!! INTERBLOQUEO DETECTADO !!! Ciclo: {self.deadlock_cycle}.")
-            
-            return True
-        except nx.NetworkXNoCycle:
+        # El Grafo de Espera (P_solicitante -> P_dueno) ya está al día. En modo
+        # "en_linea" el ciclo ya se encontró al bloquearse el proceso; en modo
+        # "incremental" se busca a partir de las aristas nuevas desde la última
+        # detección; en modo "matricial" se obtienen todos los procesos que no
+        # pueden terminar y las víctimas salen solo de sus ciclos de espera
+        inicio = time.perf_counter()
+        ciclo = self.detector.buscar_ciclo()
+        if ciclo is not None and self.modo_deteccion == "componentes":
+            componentes = [sorted(c) for c in self.detector.componentes_en_interbloqueo()]
+        elif ciclo is not None and self.modo_deteccion == "matricial":
+            # `ciclo` ya son todos los que no pueden terminar: no se repite la reducción
+            componentes = [sorted(c) for c in self.detector.componentes_en_interbloqueo(ciclo)]
+        else:
+            componentes = [sorted(ciclo)] if ciclo is not None else []
+        self.tiempo_deteccion_s += time.perf_counter() - inicio
+        self.politica.detecto(self)
+        self._registrar_tick_deteccion()
+
+        if not componentes:
             self.deadlock_cycle = None
+            self.deadlock_componentes = []
             return False
 
+        self.interbloqueos_detectados += len(componentes)
+        self.deadlock_componentes = componentes
+        self.deadlock_cycle = sorted(set().union(*componentes))
+        self._registrar_latencias(set(self.deadlock_cycle))
+        if len(componentes) == 1:
+            self.log_event(f"!!! INTERBLOQUEO DETECTADO !!! Ciclo: {nombres_procesos(self.deadlock_cycle)}.")
+        else:
+            self.log_event(f"!!! {len(componentes)} INTERBLOQUEOS DETECTADOS !!! Componentes: {[nombres_procesos(c) for c in componentes]}.")
+        return True
+
+    def _registrar_latencias(self, encontrados):
+        pendientes = []
+        for inicio, ciclo in self.interbloqueos_sin_detectar:
+            if ciclo <= encontrados:
+                self.latencias_deteccion.append(self.ahora() - inicio)
+            else:
+                pendientes.append((inicio, ciclo))
+        self.interbloqueos_sin_detectar = pendientes
+
+    def _registrar_tick_deteccion(self):
+        contadores = self.detector.tomar_contadores()
+        self.ticks_deteccion += 1
+        self.aristas_tocadas_total += contadores["aristas_modificadas"] + contadores["aristas_examinadas"]
+        self.contadores_ultimo_tick = contadores
+
     def notificar_y_resolver(self):
         
-        self.dibujar_grafo() 
+        self.marcar_cambio(inmediato=True)
         self.actualizar_indicadores_deadlock(is_deadlock_detected=True) # Actualizar indicadores a Verde Total
         
-        if self.after_id:
+        if self.after_id and self.root is not None:
             self.root.after_cancel(self.after_id)
 
-        procesos_ciclo_str = ", ".join(self.deadlock_cycle)
+        procesos_ciclo_str = " | ".join(", ".join(nombres_procesos(c)) for c in self.deadlock_componentes)
+        if self.retardo_recuperacion_ms:
+            cuando = f"en {self.retardo_recuperacion_ms / 1000:g} segundos..."
+        else:
+            cuando = "de inmediato."
             
-        messagebox.showwarning("🚨 Interbloqueo Detectado", 
-                               "Se ha detectado un Interbloqueo (Deadlock). El sistema está estancado.\n\n" \
-                               f"**Procesos involucrados:** {procesos_ciclo_str}\n\n"
-                               "Aplicando medidas correctivas en 3 segundos...")
+        self.notificar("interbloqueo", "🚨 Interbloqueo Detectado",
+                       "Se ha detectado un Interbloqueo (Deadlock). El sistema está estancado.\n\n" \
+                       f"**Procesos involucrados:** {procesos_ciclo_str}\n\n"
+                       f"Aplicando medidas correctivas {cuando}")
         
-        self.root.after(3000, self._resolver_interbloqueo_paso_2)
+        self.programar(self.retardo_recuperacion_ms, self._resolver_interbloqueo_paso_2)
 
     def _resolver_interbloqueo_paso_2(self):
         
         if not self.deadlock_cycle:
             self.log_event("ADVERTENCIA: Intento de resolución sin ciclo detectado. Continuando simulación.")
-            self.actualizar_indicadores_deadlock()
+            self.marcar_cambio()
             self.ciclo_simulacion()
             return
             
-        # 1. Identificar procesos en el ciclo
-        procesos_en_ciclo = [p for p in self.procesos if p.id in self.deadlock_cycle]
-        
-        if not procesos_en_ciclo:
-            self.log_event("ADVERTENCIA: Ciclo detectado pero procesos no encontrados. Continuando simulación.")
-            self.deadlock_cycle = None
-            self.actualizar_indicadores_deadlock()
-            self.ciclo_simulacion()
-            return
+        if self.costo_victima is not None:
+            victimas, componentes_resueltas = self._resolver_con_costo_minimo()
+        else:
+            victimas, componentes_resueltas = self._resolver_una_por_interbloqueo()
 
-        # 2. Seleccionar la VÍCTIMA (criterio de menor cantidad de recursos, desempatando por más antiguo)
-        
-        def criterio_victima(proceso):
-            # Tupla: (cantidad_recursos_asignados, -tiempo_inicio)
-            return (len(proceso.asignados), -proceso.tiempo_inicio)
-        
-        victima = min(procesos_en_ciclo, key=criterio_victima)
-        
-        # Matar al proceso víctima
-        self.log_event(f"💀 RESOLVIENDO: Matando a la víctima {victima.id} del ciclo {self.deadlock_cycle} (Posee {len(victima.asignados)} recursos).")
-        self.procesos_victimas += 1
-        
-        # 3. Liberar y reiniciar
-        self.liberar_recursos(victima)
-        self.reiniciar_proceso(victima) 
+        if victimas:
+            # Cada interbloqueo resuelto aparte habría costado una ronda; con
+            # costo mínimo puede haber varias víctimas en la misma componente
+            self.rondas_recuperacion += 1
+            self.rondas_ahorradas += componentes_resueltas - 1
         
         self.deadlock_cycle = None 
+        self.deadlock_componentes = []
+        # Los ciclos que rompió la recuperación sin haber sido detectados se descartan
+        self.interbloqueos_sin_detectar = [
+            (inicio, ciclo) for inicio, ciclo in self.interbloqueos_sin_detectar
+            if ciclo <= self.bloqueados.keys()
+        ]
+
+        if victimas:
+            self.notificar("recuperacion", "✅ Medidas Correctivas Aplicadas",
+                           f"Medidas correctivas aplicadas.\n"
+                           f"Proceso(s) **{', '.join(nombres_procesos(victimas))}** finalizado(s) (reiniciado(s)) para romper el ciclo.")
         
-        messagebox.showinfo("✅ Medidas Correctivas Aplicadas", 
-                             f"Medidas correctivas aplicadas.\n"
-                             f"Proceso **{victima.id}** finalizado (reiniciado) para romper el ciclo.")
-        
-        self.actualizar_indicadores_deadlock() # Los indicadores vuelven a rojo (al romperse el ciclo)
+        self.marcar_cambio() # Los indicadores vuelven a rojo (al romperse el ciclo)
         self.ciclo_simulacion()
 
+    def _resolver_una_por_interbloqueo(self):
+        """
+        Una víctima por interbloqueo; en modos "componentes" y "matricial" se
+        resuelven todos en esta misma ronda. Devuelve (víctimas, interbloqueos resueltos).
+        """
+        victimas = []
+        for componente in self.deadlock_componentes:
+            # 1. Identificar procesos en el ciclo
+            procesos_en_ciclo = [self.procesos_por_id[pid] for pid in componente if pid in self.procesos_por_id]
+            if not procesos_en_ciclo:
+                self.log_event(f"ADVERTENCIA: Ciclo {nombres_procesos(componente)} detectado pero procesos no encontrados.")
+                continue
+
+            # 2. Seleccionar la VÍCTIMA
+            victima = min(procesos_en_ciclo, key=criterio_victima)
+            
+            # Matar al proceso víctima
+            self.log_event(f"💀 RESOLVIENDO: Matando a la víctima {victima.nombre} del ciclo {nombres_procesos(componente)} (Posee {len(victima.asignados)} recursos).")
+            
+            # 3. Liberar y reiniciar
+            self.matar_victima(victima)
+            victimas.append(victima.id)
+        return victimas, len(victimas)
+
+    def _resolver_con_costo_minimo(self):
+        """
+        Conjunto de víctimas de costo mínimo que deja acíclico TODO el grafo de
+        espera (no solo los ciclos detectados). Para comparar, también se
+        calcula cuánto trabajo habría perdido el criterio clásico aplicado
+        ronda tras ronda sobre el mismo grafo.
+        Devuelve (víctimas, interbloqueos resueltos): las componentes
+        fuertemente conexas con ciclo que contienen alguna víctima.
+        """
+        ahora = self.ahora()
+        por_id = self.procesos_por_id
+        espera = self.grafo_de_espera()
+        costos = {pid: self.costo_victima(por_id[pid], ahora) for pid in espera}
+        desempate = lambda pid: criterio_victima(por_id[pid])
+        elegidas = victimas_de_costo_minimo(espera, espera, costos, desempate)
+        clasicas = victimas_por_componente(espera, espera, desempate)
+        self.trabajo_perdido_criterio_clasico += sum(por_id[pid].trabajo_realizado(ahora) for pid in clasicas)
+
+        self.log_event(f"💀 RESOLVIENDO: Víctimas de costo mínimo {nombres_procesos(elegidas)} "
+                       f"(costo {sum(costos[pid] for pid in elegidas):.2f}; criterio clásico: {nombres_procesos(clasicas)}).")
+        conjunto_victimas = set(elegidas)
+        resueltas = sum(
+            1 for componente in componentes_fuertemente_conexas(espera)
+            if len(componente) > 1 and conjunto_victimas.intersection(componente)
+        )
+        for pid in elegidas:
+            self.matar_victima(por_id[pid])
+        return elegidas, resueltas
+
+    def grafo_de_espera(self):
+        """Proceso bloqueado -> dueño del recurso que pide, según el estado actual."""
+        espera = {}
+        for p in self.procesos:
+            dueno = self.recursos.get(p.solicitando) if p.solicitando else None
+            if dueno is not None and dueno != p.id:
+                espera[p.id] = [dueno]
+        return espera
+
+    def matar_victima(self, victima):
+        self.procesos_victimas += 1
+        if self.recuperacion == "retroceso":
+            self.retroceder_proceso(victima)
+            return
+        self.trabajo_perdido += victima.trabajo_realizado(self.ahora())
+        self.liberar_recursos(victima)
+        self.reiniciar_proceso(victima)
+
+    # --- Checkpoints y retroceso ---
+
+    def tomar_checkpoints(self):
+        """
+        Guarda (tiempo, trabajo, recursos) de cada proceso activo. El conjunto
+        de recursos solo se copia si cambió desde su checkpoint anterior; si
+        no, se comparte el mismo frozenset.
+        """
+        inicio = time.perf_counter()
+        ahora = self.ahora()
+        for p in self.procesos:
+            if p.estado == "Terminado Exitosamente":
+                continue
+            anterior = p.checkpoints[-1].asignados if p.checkpoints else frozenset()
+            if p.asignados == anterior:
+                asignados = anterior
+                self.estados_compartidos += 1
+            else:
+                asignados = frozenset(p.asignados)
+                self.estados_copiados += 1
+            p.checkpoints.append(Checkpoint(ahora, p.trabajo_realizado(ahora), asignados))
+        self.checkpoints_tomados += 1
+        self.ultimo_checkpoint = ahora
+        self.tiempo_checkpoints_s += time.perf_counter() - inicio
+
+    def retroceder_proceso(self, victima):
+        """
+        Vuelve al checkpoint más reciente en el que la víctima no retenía
+        ninguno de los recursos que otros procesos le están esperando (así
+        todos los ciclos que pasan por ella se rompen). Conserva los recursos
+        y el trabajo de ese checkpoint; si ningún checkpoint sirve, se reinicia.
+        """
+        ahora = self.ahora()
+        esperados = set()
+        for pid in self.bloqueados:
+            pedido = self.procesos_por_id[pid].solicitando
+            if self.recursos.get(pedido) == victima.id:
+                esperados.add(pedido)
+
+        while victima.checkpoints and victima.checkpoints[-1].asignados & esperados:
+            victima.checkpoints.pop()
+        if not victima.checkpoints:
+            self.log_event(f"⏪ RETROCESO: {victima.nombre} no tiene un checkpoint que rompa el ciclo; se reinicia.")
+            self.trabajo_perdido += victima.trabajo_realizado(ahora)
+            self.liberar_recursos(victima)
+            self.reiniciar_proceso(victima)
+            return
+
+        destino = victima.checkpoints[-1]
+        conservados = destino.asignados & victima.asignados
+        perdido = max(0.0, victima.trabajo_realizado(ahora) - destino.trabajo)
+        self.trabajo_perdido += perdido
+        self.trabajo_conservado += destino.trabajo
+        self.retrocesos += 1
+        self.log_event(f"⏪ RETROCESO: {victima.nombre} vuelve a su checkpoint de hace {ahora - destino.tiempo:.1f} s "
+                       f"(conserva {sorted(conservados) or 'ningún recurso'}, pierde {perdido:.1f} s de trabajo).")
+
+        self.liberar_recursos(victima, victima.asignados - conservados)
+        victima.solicitando = None
+        victima.tiempo_espera_total = 0
+        victima.tiempo_bloqueo_inicio = None
+        victima.tiempo_reinicio = ahora - destino.trabajo
+        victima.retrocesos += 1
+        victima.estado = "Ejecutando" if victima.asignados else "Listo"
+        self.bloqueados.pop(victima.id, None)
+        self.detector.cancelar_espera(victima.id)
+
     def reiniciar_proceso(self, proceso_victima):
         proceso_victima.asignados.clear()
         proceso_victima.solicitando = None
         proceso_victima.tiempo_espera_total = 0 
         proceso_victima.tiempo_bloqueo_inicio = None
+        proceso_victima.tiempo_reinicio = self.ahora()
+        proceso_victima.reinicios += 1
+        proceso_victima.checkpoints.clear()
         proceso_victima.estado = "Listo"
-        self.log_event(f"Proceso {proceso_victima.id} Reiniciado y puesto en la cola de listos.")
+        self.bloqueados.pop(proceso_victima.id, None)
+        self.detector.cancelar_espera(proceso_victima.id)
+        self.log_event(f"Proceso {proceso_victima.nombre} Reiniciado y puesto en la cola de listos.")
 
-    def despertar_bloqueados(self):
-        for p in [p for p in self.procesos if p.estado == "Bloqueado"]:
-            if p.solicitando and self.recursos.get(p.solicitando) is None:
-                self.log_event(f"Despertando a {p.id}. Recurso {p.solicitando} liberado.")
-                self.solicitar_recurso(p, p.solicitando)
+    def despertar_bloqueados(self, recursos_liberados):
+        """
+        Cada recurso liberado pasa al primero de su cola en O(1) amortizado.
+        Los turnos caducados (el proceso fue reiniciado o ya no espera ese
+        recurso) se descartan al llegar al frente. Como el recurso se entrega
+        en el momento de liberarse, nadie que llegue después puede adelantarse
+        a quien ya esperaba.
+        """
+        for rec in recursos_liberados:
+            cola = self.colas_espera[rec]
+            while cola and self.recursos.get(rec) is None:
+                p, turno = cola.popleft()
+                if p.estado == "Bloqueado" and p.solicitando == rec and p.turno_espera == turno:
+                    self.log_event(f"Despertando a {p.nombre}. Recurso {rec} liberado.")
+                    self.solicitar_recurso(p, rec)
 
     # --- INDICADORES DE DEADLOCK (NUEVA FUNCIÓN) ---
     
@@ -280,6 +749,8 @@ class SimuladorDeadlock:
 
     def actualizar_indicadores_deadlock(self, is_deadlock_detected=False):
         """Actualiza los colores de los indicadores LED en la GUI."""
+        if self.root is None:
+            return
         
         conditions = self._get_deadlock_conditions_state()
         
@@ -298,10 +769,38 @@ class SimuladorDeadlock:
         self.led_ec.config(bg=color_ec)
 
 
+    # --- NOTIFICACIONES ---
+
+    def notificar(self, tipo, titulo, mensaje):
+        """
+        Encola el aviso en `eventos` y lo muestra: en el panel de avisos (sin
+        bloquear) o, con notificacion="modal", en un cuadro de diálogo.
+        """
+        self.eventos.append({"tiempo": self.ahora(), "tipo": tipo, "titulo": titulo, "mensaje": mensaje})
+        if self.root is None:
+            return
+        if self.notificacion == "modal":
+            mostrar = messagebox.showwarning if tipo == "interbloqueo" else messagebox.showinfo
+            mostrar(titulo, mensaje)
+            return
+
+        resumen = " ".join(mensaje.replace("**", "").split())
+        hora = datetime.fromtimestamp(self.ahora()).strftime("%H:%M:%S")
+        self.aviso_label.config(text=f"{titulo}\n{resumen}", bg=COLORES_AVISO.get(tipo, "white"))
+        self.avisos_list.insert(0, f"[{hora}] {titulo}: {resumen}")
+        if self.avisos_list.size() > MAX_AVISOS_PANEL:
+            self.avisos_list.delete(MAX_AVISOS_PANEL, tk.END)
+
+    def tomar_eventos(self):
+        """Devuelve y vacía los avisos pendientes (los más viejos primero)."""
+        eventos = list(self.eventos)
+        self.eventos.clear()
+        return eventos
+
     # --- 5. LOG Y GRÁFICOS ---
 
     def log_event(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = datetime.fromtimestamp(self.ahora()).strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         
         if self.log_file is not None: 
@@ -310,78 +809,72 @@ class SimuladorDeadlock:
             except ValueError:
                 pass 
         
-        self.log_text.insert(tk.END, log_entry + "\n")
-        self.log_text.see(tk.END)
+        if self.root is not None:
+            self.log_text.insert(tk.END, log_entry + "\n")
+            self.log_text.see(tk.END)
+
+    def marcar_cambio(self, inmediato=False):
+        """Pide repintar la vista; con `inmediato` se hace ya (antes de un aviso o al terminar)."""
+        if self.repintado is None:
+            return
+        self.repintado.marcar()
+        if inmediato:
+            self.repintado.forzar()
+
+    def repintar(self):
+        self.dibujar_grafo()
+        self.actualizar_indicadores_deadlock()
 
     def dibujar_grafo(self):
-        self.G.clear()
-        
-        # Crear la lista de procesos (P0-P9) y recursos (R0, R1...)
-        procs_list = sorted([p.id for p in self.procesos])
+        if self.root is None:
+            return
+        # Crear la lista de procesos (P0-P9) y recursos (R0, R1...); los nodos
+        # de los procesos son sus nombres, para no confundirlos con recursos
+        procs_list = [p.nombre for p in self.procesos]
         res_list = sorted(list(self.recursos.keys()))
-        
-        pos = {}
-        # Posición de Procesos (Columna 0)
-        for i, p_id in enumerate(procs_list):
-            proceso = next(p for p in self.procesos if p.id == p_id)
-            self.G.add_node(p_id, type='P', estado=proceso.estado)
-            pos[p_id] = (0, -i * 1.5) 
-            
-        # Posición de Recursos (Columna 1)
-        for i, r_id in enumerate(res_list):
-            self.G.add_node(r_id, type='R')
-            pos[r_id] = (1, -i * 1.5) 
-            
-        # Añadir aristas (Asignación y Solicitud)
+
+        colores = {}
+        # Procesos
+        for p in self.procesos:
+            if p.estado == 'Bloqueado':
+                colores[p.nombre] = 'orange'
+            elif p.estado == 'Terminado Exitosamente':
+                colores[p.nombre] = 'yellow'
+            else:
+                colores[p.nombre] = 'lightblue'
+
+        # Recursos
+        for r_id in res_list:
+            colores[r_id] = 'lightgreen'
+
+        # Aristas (Asignación y Solicitud)
+        aristas = {}
         for p in self.procesos:
             for rec in p.asignados:
-                self.G.add_edge(rec, p.id, type='asignacion') 
-        
+                aristas[(rec, p.nombre)] = ('green', 'solid')
         for p in self.procesos:
             if p.solicitando:
-                self.G.add_edge(p.id, p.solicitando, type='solicitud')
-        
-        self.ax.clear() 
-        
-        node_colors = []
-        for n in self.G.nodes():
-            if self.G.nodes[n]['type'] == 'P':
-                estado = self.G.nodes[n]['estado']
-                if estado == 'Bloqueado':
-                    node_colors.append('orange')
-                elif estado == 'Terminado Exitosamente':
-                    node_colors.append('yellow')
-                else:
-                    node_colors.append('lightblue')
-            else:
-                node_colors.append('lightgreen')
-        
-        edge_colors = []
-        edge_styles = []
-        for u, v, data in self.G.edges(data=True):
-            if data['type'] == 'asignacion':
-                edge_colors.append('green')
-                edge_styles.append('solid')
-            elif data['type'] == 'solicitud':
-                edge_colors.append('red')
-                edge_styles.append('dashed')
-            
-        nx.draw_networkx_nodes(self.G, pos, node_color=node_colors, node_shape='s', node_size=1200, ax=self.ax)
-        nx.draw_networkx_labels(self.G, pos, ax=self.ax)
-        nx.draw_networkx_edges(self.G, pos, edge_color=edge_colors, style=edge_styles, ax=self.ax, arrowsize=20, width=2)
-        
-        self.ax.set_title(f"Grafo de Asignación y Solicitud ({len(self.procesos_terminados_exitosamente)}/{NUM_PROCESOS} Completados)", y=0.95) 
-        self.ax.axis('off') 
-        self.canvas.draw()
+                aristas[(p.nombre, p.solicitando)] = ('red', 'dashed')
+
+        # Posiciones (columnas, cuadrícula o por componentes; ver CacheDisposicion)
+        pos = self.disposicion.posiciones(procs_list, res_list, aristas)
+        self.renderizador.dibujar(
+            pos, colores, aristas,
+            titulo=f"Grafo de Asignación y Solicitud ({len(self.procesos_terminados_exitosamente)}/{self.num_procesos} Completados)")
         
         text_info = f"--- ESTADO DE PROCESOS ---\n"
         for p in self.procesos:
-            info = f"[{p.estado}] {p.id}"
+            info = f"[{p.estado}] {p.nombre}"
             if p.asignados:
                 info += f" (Posee: {', '.join(p.asignados)})"
             if p.solicitando:
                 info += f" (Pide: {p.solicitando})"
             text_info += info + "\n"
+
+        tick = self.contadores_ultimo_tick
+        text_info += (f"Aristas tocadas en el último paso: "
+                      f"{tick['aristas_modificadas'] + tick['aristas_examinadas']} "
+                      f"(modificadas {tick['aristas_modificadas']}, examinadas {tick['aristas_examinadas']})\n")
             
         self.graph_info_label.config(text=text_info, justify=tk.LEFT)
 
@@ -396,7 +889,6 @@ class SimuladorDeadlock:
         graph_frame.grid_columnconfigure(0, weight=1)
         graph_frame.grid_rowconfigure(0, weight=1)
         
-        self.G = nx.DiGraph()
         self.fig, self.ax = plt.subplots(figsize=(6, 8)) 
         self.fig.tight_layout() 
         
@@ -404,6 +896,8 @@ class SimuladorDeadlock:
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.grid(row=0, column=0, sticky="nsew") 
+        self.renderizador = RenderizadorGrafo(self.ax, self.canvas, forma_nodo='s', tamano_nodo=1200,
+                                              tamano_fuente=12, ancho_arista=2, tamano_flecha=20, titulo_y=0.95)
 
         self.graph_info_label = tk.Label(graph_frame, text="Información del Grafo", justify=tk.LEFT, anchor="nw", bg='white', font=('Consolas', 10))
         self.graph_info_label.grid(row=1, column=0, sticky="ew", pady=5) 
@@ -430,6 +924,15 @@ class SimuladorDeadlock:
         self.led_em, self.led_re, self.led_np, self.led_ec = self.leds
         # --- FIN: Panel de Indicadores de Deadlock ---
 
+        # Panel de avisos: reemplaza a los cuadros de diálogo sin detener la simulación
+        avisos_frame = ttk.LabelFrame(right_panel, text="Avisos", padding="5")
+        avisos_frame.pack(fill="x", pady=5)
+        self.aviso_label = tk.Label(avisos_frame, text="Sin interbloqueos por ahora.", justify=tk.LEFT,
+                                    anchor="w", wraplength=420, bg="white")
+        self.aviso_label.pack(fill="x")
+        self.avisos_list = tk.Listbox(avisos_frame, height=4)
+        self.avisos_list.pack(fill="x", pady=(5, 0))
+
         log_frame = ttk.LabelFrame(right_panel, text="Registro de Eventos (Log)", padding="5")
         log_frame.pack(fill="both", expand=True)
 
@@ -440,7 +943,7 @@ class SimuladorDeadlock:
 
     def calcular_metricas(self):
         tiempo_perdido = sum(p.tiempo_espera_total for p in self.procesos)
-        tiempo_simulado = time.time() - self.tiempo_simulacion_inicio
+        tiempo_simulado = self.ahora() - self.tiempo_simulacion_inicio
         
         metricas = {
             "Total de Solicitudes": self.solicitudes_totales,
@@ -450,45 +953,81 @@ class SimuladorDeadlock:
             "Procesos Víctimas (reiniciados)": self.procesos_victimas,
             "Procesos Terminados Exitosamente": len(self.procesos_terminados_exitosamente),
             "Tiempo Perdido Total (s)": tiempo_perdido,
-            "Tiempo Promedio de Espera por Proceso (s)": tiempo_perdido / NUM_PROCESOS if NUM_PROCESOS else 0
+            "Tiempo Promedio de Espera por Proceso (s)": tiempo_perdido / self.num_procesos if self.num_procesos else 0,
+            "Rondas de Recuperación": self.rondas_recuperacion,
+            "Rondas de Recuperación Ahorradas": self.rondas_ahorradas,
+            "Tiempo Simulado Ahorrado (s)": self.rondas_ahorradas * self.retardo_recuperacion_ms / 1000,
+            "Trabajo Perdido por Víctimas (s)": self.trabajo_perdido,
+            "Trabajo Perdido Ahorrado vs. Criterio Clásico (s)": (
+                self.trabajo_perdido_criterio_clasico - self.trabajo_perdido if self.costo_victima is not None else 0.0
+            ),
+            "Modo de Recuperación": self.recuperacion,
+            "Retrocesos a Checkpoint": self.retrocesos,
+            "Trabajo Conservado por Checkpoints (s)": self.trabajo_conservado,
+            "Checkpoints Tomados": self.checkpoints_tomados,
+            "Estados Copiados en Checkpoints": self.estados_copiados,
+            "Estados Compartidos en Checkpoints": self.estados_compartidos,
+            "Tiempo en Checkpoints (ms)": self.tiempo_checkpoints_s * 1000,
+            "Política de Detección": self.politica.describir(),
+            "Pasos de Detección": self.ticks_deteccion,
+            "Tiempo de CPU en Detección (ms)": self.tiempo_deteccion_s * 1000,
+            "Latencia de Detección Media (s)": (
+                sum(self.latencias_deteccion) / len(self.latencias_deteccion) if self.latencias_deteccion else 0.0
+            ),
+            "Latencia de Detección Máxima (s)": max(self.latencias_deteccion, default=0.0),
+            "Aristas Tocadas por Paso (promedio)": self.aristas_tocadas_total / self.ticks_deteccion if self.ticks_deteccion else 0
         }
+        if self.repintado is not None:
+            metricas["Repintados de la Vista"] = self.repintado.repintados
+            metricas["Pasos por Repintado (promedio)"] = self.repintado.pasos_por_frame()
+            metricas["Tiempo Repintando (ms)"] = self.repintado.tiempo_repintado_s * 1000
         
-        # Escribir las métricas en el archivo METRICS_FILENAME
-        with open(METRICS_FILENAME, "w", encoding="utf-8") as f:
-            f.write("--- MÉTRICAS DE LA SIMULACIÓN ---\n")
-            for key, value in metricas.items():
-                if isinstance(value, float):
-                    f.write(f"{key}: {value:.2f}\n")
-                else:
-                    f.write(f"{key}: {value}\n")
+        # Escribir las métricas en el archivo de métricas
+        if self.archivo_metricas is not None:
+            with open(self.archivo_metricas, "w", encoding="utf-8") as f:
+                f.write("--- MÉTRICAS DE LA SIMULACIÓN ---\n")
+                for key, value in metricas.items():
+                    if isinstance(value, float):
+                        f.write(f"{key}: {value:.2f}\n")
+                    else:
+                        f.write(f"{key}: {value}\n")
+            self.log_event(f"Métricas generadas en {self.archivo_metricas}")
 
         # 1. Registrar los eventos de finalización en el log
-        self.log_event(f"Métricas generadas en {METRICS_FILENAME}")
         self.log_event(f"Simulación Finalizada. Tiempo total: {tiempo_simulado:.2f} segundos.")
         
         if self.log_file:
             self.log_file.close()
             self.log_file = None 
+
+        self.metricas = metricas
+        return metricas
             
     # --- 6. CICLO DE EJECUCIÓN ---
 
     def get_next_proceso(self):
-        for i in range(NUM_PROCESOS):
-            idx = (self.indice_proceso_actual + i) % NUM_PROCESOS
+        for i in range(self.num_procesos):
+            idx = (self.indice_proceso_actual + i) % self.num_procesos
             if self.procesos[idx].estado != "Terminado Exitosamente":
                 return self.procesos[idx]
         return None
 
     def ciclo_simulacion(self):
         
-        if len(self.procesos_terminados_exitosamente) == NUM_PROCESOS:
+        if len(self.procesos_terminados_exitosamente) == self.num_procesos:
             self.log_event("✅ OBJETIVO CUMPLIDO: Todos los procesos han terminado exitosamente.")
+            self.marcar_cambio(inmediato=True)
             self.calcular_metricas()
             return
 
+        if (self.recuperacion == "retroceso"
+                and self.ahora() - self.ultimo_checkpoint >= self.intervalo_checkpoint_s):
+            self.tomar_checkpoints()
+
         proceso_actual = self.get_next_proceso()
         
         if not proceso_actual:
+            self.marcar_cambio(inmediato=True)
             self.calcular_metricas()
             return
 
@@ -496,18 +1035,16 @@ class SimuladorDeadlock:
         
         # 1. Ejecución Exitosa (Si ya tiene ambos)
         if r1 in proceso_actual.asignados and r2 in proceso_actual.asignados:
-            if random.random() < 0.60: 
-                self.log_event(f"🌟 TERMINACIÓN: {proceso_actual.id} completó su tarea con {r1} y {r2}.")
+            if self.rng.random() < 0.60: 
+                self.log_event(f"🌟 TERMINACIÓN: {proceso_actual.nombre} completó su tarea con {r1} y {r2}.")
                 self.liberar_recursos(proceso_actual)
                 proceso_actual.estado = "Terminado Exitosamente"
                 self.procesos_terminados_exitosamente.add(proceso_actual.id)
                 
-                self.dibujar_grafo()
-                self.actualizar_indicadores_deadlock()
-                current_pid_num = int(proceso_actual.id.split('P')[1])
-                self.indice_proceso_actual = (current_pid_num + 1) % NUM_PROCESOS
+                self.marcar_cambio()
+                self.indice_proceso_actual = (proceso_actual.id + 1) % self.num_procesos
                 
-                self.after_id = self.root.after(500, self.ciclo_simulacion) 
+                self.after_id = self.programar(self.retardo_paso_ms, self.ciclo_simulacion) 
                 return
             
         # 2. Lógica de Solicitud 
@@ -525,27 +1062,119 @@ class SimuladorDeadlock:
                 elif r1 in proceso_actual.asignados and not r2 in proceso_actual.asignados:
                     self.solicitar_recurso(proceso_actual, r2)
         
-        # 3. Detección y Resolución
-        if self.detectar_interbloqueo():
+        # 3. Detección y Resolución (cuando la política lo indique)
+        if self.toca_detectar() and self.detectar_interbloqueo():
             self.notificar_y_resolver()
             return 
         
         # 4. Avanzar el índice y Continuar
-        current_pid_num = int(proceso_actual.id.split('P')[1])
-        self.indice_proceso_actual = (current_pid_num + 1) % NUM_PROCESOS
+        self.indice_proceso_actual = (proceso_actual.id + 1) % self.num_procesos
         
-        self.dibujar_grafo()
-        self.actualizar_indicadores_deadlock() # Actualiza después de la acción de solicitud/bloqueo
-        self.after_id = self.root.after(500, self.ciclo_simulacion) 
+        self.marcar_cambio() # Grafo e indicadores, en el próximo frame
+        self.after_id = self.programar(self.retardo_paso_ms, self.ciclo_simulacion) 
         
-# --- MAIN ---
-if __name__ == "__main__":
+# --- 7. MODO SIN INTERFAZ ---
+
+def ejecutar_escenarios(num_escenarios, configuracion=None, semilla=None, carpeta=DATA_DIR,
+                        num_procesos=NUM_PROCESOS):
+    """
+    Ejecuta `num_escenarios` simulaciones sin interfaz (la k-ésima con semilla
+    "semilla:k") y devuelve la lista de métricas. Con una sola simulación se
+    escriben el log y las métricas habituales; con varias, un par de archivos
+    por escenario; con carpeta=None no se escribe nada. Cada escenario crea
+    su propia política de detección a partir de `configuracion`.
+    """
+    resultados = []
+    for k in range(num_escenarios):
+        archivo_log = archivo_metricas = None
+        if carpeta is not None:
+            if num_escenarios == 1:
+                nombre_log, nombre_metricas = os.path.basename(LOG_FILENAME), os.path.basename(METRICS_FILENAME)
+            else:
+                nombre_log = f"simulacion_deadlock_log_{k:04d}.txt"
+                nombre_metricas = f"simulacion_deadlock_metrics_{k:04d}.txt"
+            archivo_log = os.path.join(carpeta, nombre_log)
+            archivo_metricas = os.path.join(carpeta, nombre_metricas)
+        semilla_escenario = None if semilla is None else f"{semilla}:{k}"
+        simulador = SimuladorDeadlock(None, configuracion, semilla_escenario, archivo_log, archivo_metricas,
+                                      num_procesos)
+        resultados.append(simulador.ejecutar_sin_interfaz())
+    return resultados
+
+
+def imprimir_resumen(resultados, segundos):
+    print(f"Escenarios: {len(resultados)} en {segundos:.2f} s "
+          f"({len(resultados) / segundos * 60 if segundos else 0:.0f} por minuto)")
+    for clave in ("Total de Solicitudes", "Procesos Víctimas (reiniciados)", "Rondas de Recuperación",
+                  "Pasos de Detección", "Tiempo Perdido Total (s)", "Trabajo Perdido por Víctimas (s)",
+                  "Trabajo Perdido Ahorrado vs. Criterio Clásico (s)", "Tiempo de CPU en Detección (ms)",
+                  "Latencia de Detección Media (s)", "Latencia de Detección Máxima (s)",
+                  "Trabajo Conservado por Checkpoints (s)", "Tiempo en Checkpoints (ms)"):
+        valores = [r[clave] for r in resultados]
+        print(f"  {clave}: media {sum(valores) / len(valores):.2f}, máx {max(valores):.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de detección y recuperación de interbloqueos")
+    parser.add_argument("--modo", choices=MODOS_DETECCION, default="en_linea")
+    parser.add_argument("--costo-victima", choices=COSTOS_VICTIMA,
+                        help="elegir víctimas de costo mínimo (por defecto: una por interbloqueo, criterio clásico)")
+    parser.add_argument("--politica", choices=POLITICAS_DETECCION, default="cada_paso",
+                        help="cuándo ejecutar el detector")
+    parser.add_argument("--cada-k", type=int, dest="k", help="solicitudes entre detecciones (política cada_k)")
+    parser.add_argument("--intervalo", type=float, dest="intervalo_s",
+                        help="segundos entre detecciones (política temporizador)")
+    parser.add_argument("--umbral-bloqueados", type=float, help="proporción de bloqueados (política adaptativa)")
+    parser.add_argument("--umbral-espera", type=float, dest="umbral_espera_s",
+                        help="espera más larga en segundos (política adaptativa)")
+    parser.add_argument("--recuperacion", choices=MODOS_RECUPERACION, default="reinicio")
+    parser.add_argument("--intervalo-checkpoint", type=float, default=INTERVALO_CHECKPOINT_S,
+                        help="segundos entre checkpoints (recuperación por retroceso)")
+    parser.add_argument("--retardo-recuperacion", type=int, default=RETARDO_RECUPERACION_MS,
+                        help="milisegundos entre el aviso de un interbloqueo y su resolución (0: inmediata)")
+    parser.add_argument("--notificacion", choices=MODOS_NOTIFICACION, default="panel",
+                        help="avisos en un panel sin bloquear o en cuadros de diálogo modales")
+    parser.add_argument("--retardo-paso", type=int, default=RETARDO_PASO_MS,
+                        help="milisegundos entre pasos con interfaz")
+    parser.add_argument("--fps", type=float, default=MAX_FPS,
+                        help="repintados por segundo como máximo (0: repintar en cada paso)")
+    parser.add_argument("--disposicion", choices=DISPOSICIONES, default="auto",
+                        help="ubicación de los nodos del grafo (auto: columnas o cuadrícula según la cantidad)")
+    parser.add_argument("--sin-interfaz", action="store_true",
+                        help="ejecutar sin ventana, sobre un reloj simulado")
+    parser.add_argument("--escenarios", type=int, default=1, help="simulaciones a ejecutar sin interfaz")
+    parser.add_argument("--semilla", type=int)
+    parser.add_argument("--carpeta", default=DATA_DIR, help="carpeta de logs y métricas del modo sin interfaz")
+    parser.add_argument("--sin-archivos", action="store_true",
+                        help="no escribir logs ni métricas (solo el resumen)")
+    args = parser.parse_args(argv)
+    opciones_politica = {"k": args.k, "intervalo_s": args.intervalo_s,
+                         "umbral_bloqueados": args.umbral_bloqueados, "umbral_espera_s": args.umbral_espera_s}
+    configuracion = ConfiguracionSimulador(
+        args.modo, args.costo_victima, args.politica, opciones_politica, args.recuperacion,
+        args.intervalo_checkpoint, args.retardo_recuperacion, args.notificacion, args.retardo_paso, args.fps,
+        args.disposicion)
+
+    if args.sin_interfaz:
+        carpeta = None if args.sin_archivos else args.carpeta
+        if carpeta is not None:
+            os.makedirs(carpeta, exist_ok=True)
+        inicio = time.perf_counter()
+        resultados = ejecutar_escenarios(args.escenarios, configuracion, args.semilla, carpeta)
+        imprimir_resumen(resultados, time.perf_counter() - inicio)
+        return
+
+    importar_interfaz()
     root = tk.Tk()
-    app = SimuladorDeadlock(root)
+    app = SimuladorDeadlock(root, configuracion, args.semilla)
     
     def cerrar_simulador():
         app.calcular_metricas() 
         root.destroy()
         
     root.protocol("WM_DELETE_WINDOW", cerrar_simulador)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+# --- MAIN ---
+if __name__ == "__main__":
+    main()
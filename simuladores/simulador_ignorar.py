@@ -1,4 +1,6 @@
+import argparse
 import os
+import sys
 import random
 import time
 import ttkbootstrap as tb
@@ -10,12 +12,21 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 
+# Permite importar el paquete `simuladores` al ejecutar este archivo directamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simuladores.grafico import DISPOSICIONES, CacheDisposicion, PlanificadorRepintado, RenderizadorGrafo
+
 # --- CONFIGURACIÓN DE SIMULACIÓN ---
 USE_FIXED_SEED = True
 FIXED_SEED_VALUE = 7  # Mantiene el comportamiento fijo en cada ejecución
 if USE_FIXED_SEED:
     random.seed(FIXED_SEED_VALUE)
 
+# --- RITMO DE LA SIMULACIÓN ---
+INTERVALO_PASO_MS = 700  # Pausa entre pasos
+MAX_FPS = 10             # Repintados por segundo como máximo (0: repintar en cada paso)
+
 # --- ARCHIVOS DE SALIDA ---
 DATA_DIR = os.path.join("data", "logs_ignorar")
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -38,8 +49,11 @@ class Proceso:
 
 # --- CLASE PRINCIPAL ---
 class SimuladorIgnorar:
-    def __init__(self, root):
+    def __init__(self, root, intervalo_paso_ms=INTERVALO_PASO_MS, max_fps=MAX_FPS, disposicion="auto"):
         self.root = root
+        self.intervalo_paso_ms = intervalo_paso_ms
+        # Posiciones de los nodos: se recalculan solo si cambian los procesos o recursos
+        self.disposicion = CacheDisposicion(disposicion)
         self.root.title("Simulador — Política de Ignorar Interbloqueos")
         self.root.geometry("1400x800")
         self.style = tb.Style("darkly")
@@ -53,7 +67,6 @@ class SimuladorIgnorar:
         self.NUM_RECURSOS = 10
         self.recursos = {f"R{i}": None for i in range(self.NUM_RECURSOS)}
         self.procesos = [Proceso(i) for i in range(self.NUM_PROCESOS)]
-        self.G = nx.DiGraph()
         self.deadlock_detectado = False
 
         # Estadísticas
@@ -65,6 +78,8 @@ class SimuladorIgnorar:
         self.simulacion_activa = True
 
         self.crear_interfaz()
+        # Los pasos solo marcan la vista; se repinta como máximo max_fps veces por segundo
+        self.repintado = PlanificadorRepintado(self.root.after, self.repintar, max_fps)
         self.log_evento("💤 Simulación iniciada bajo política de IGNORAR (sin prevención ni resolución).")
         self.iniciar_simulacion()
 
@@ -91,6 +106,8 @@ class SimuladorIgnorar:
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
         self.canvas.get_tk_widget().pack(fill=BOTH, expand=True)
+        self.renderizador = RenderizadorGrafo(self.ax, self.canvas, color_etiqueta="white",
+                                              color_titulo=self.text_color)
 
         # === Zona inferior ===
         bottom_frame = tb.Frame(left_frame)
@@ -159,7 +176,7 @@ class SimuladorIgnorar:
     def iniciar_simulacion(self):
         if self.simulacion_activa:
             self.simular_paso()
-            self.root.after(700, self.iniciar_simulacion)
+            self.root.after(self.intervalo_paso_ms, self.iniciar_simulacion)
 
     def simular_paso(self):
         if self.deadlock_detectado:
@@ -203,8 +220,8 @@ class SimuladorIgnorar:
             self.solicitudes_bloqueadas += 1
             self.log_evento(f"⏳ {proceso.id} espera {recurso} (retenido por {self.recursos[recurso]}).")
 
+        self.repintado.marcar()
         self.detectar_interbloqueo()
-        self.dibujar_grafo()
 
     # === DETECCIÓN VISUAL DE INTERBLOQUEO ===
     def detectar_interbloqueo(self):
@@ -223,73 +240,44 @@ class SimuladorIgnorar:
             self.deadlock_detectado = True
             self.simulacion_activa = False
             self.log_evento(f"💥 INTERBLOQUEO DETECTADO: {' - '.join(procesos_ciclo)}")
+            self.repintado.forzar()  # Mostrar el ciclo antes del aviso
             messagebox.showwarning("💥 Interbloqueo Detectado", f"Procesos involucrados: {', '.join(procesos_ciclo)}\n\nSimulación detenida.")
         except nx.NetworkXNoCycle:
             pass
 
     # === GRAFO ===
+    def repintar(self):
+        self.dibujar_grafo()
+
     def dibujar_grafo(self):
-        self.G.clear()
         procesos = [p.id for p in self.procesos]
         recursos = list(self.recursos.keys())
 
-        pos = {p: (0, -i) for i, p in enumerate(procesos)}
-        pos.update({r: (1, -i) for i, r in enumerate(recursos)})
-
+        colores = {}
         for p in self.procesos:
-            self.G.add_node(p.id, tipo="P", estado=p.estado)
-        for r in recursos:
-            self.G.add_node(r, tipo="R")
+            if p.estado == "Bloqueado":
+                colores[p.id] = "#e74c3c"  # rojo fuerte
+            elif p.estado == "Ejecutando":
+                colores[p.id] = "#3498db"
+            elif p.estado == "Terminado":
+                colores[p.id] = "#2ecc71"
+            else:
+                colores[p.id] = "#95a5a6"
+        colores.update({r: "#2ecc71" for r in recursos})
 
+        aristas = {}
         for p in self.procesos:
             for rec in p.asignados:
-                self.G.add_edge(p.id, rec, tipo="posee")
+                aristas[(p.id, rec)] = ("#2ecc71", "solid")
             if p.solicitando:
-                self.G.add_edge(p.id, p.solicitando, tipo="solicita")
-
-        self.ax.clear()
-        node_colors = []
-        for n in self.G.nodes():
-            if self.G.nodes[n]["tipo"] == "P":
-                estado = self.G.nodes[n]["estado"]
-                if estado == "Bloqueado":
-                    node_colors.append("#e74c3c")  # rojo fuerte
-                elif estado == "Ejecutando":
-                    node_colors.append("#3498db")
-                elif estado == "Terminado":
-                    node_colors.append("#2ecc71")
-                else:
-                    node_colors.append("#95a5a6")
-            else:
-                node_colors.append("#2ecc71")
-
-        edge_colors = []
-        styles = []
-        for _, _, data in self.G.edges(data=True):
-            if data["tipo"] == "posee":
-                edge_colors.append("#2ecc71"); styles.append("solid")
-            elif data["tipo"] == "solicita":
-                edge_colors.append("#f1c40f"); styles.append("dashed")
-
-        nx.draw_networkx(
-            self.G,
-            pos,
-            node_color=node_colors,
-            node_shape="o",
-            node_size=1000,
-            font_color="white",
-            font_size=9,
-            edge_color=edge_colors,
-            style=styles,
-            ax=self.ax,
-        )
+                aristas[(p.id, p.solicitando)] = ("#f1c40f", "dashed")
 
+        pos = self.disposicion.posiciones(procesos, recursos, aristas)
         completados = sum(p.finalizado for p in self.procesos)
-        self.ax.set_title(
-            f"Grafo de Asignación y Solicitud ({completados}/{self.NUM_PROCESOS} Completados)",
-            color=self.text_color
+        self.renderizador.dibujar(
+            pos, colores, aristas,
+            titulo=f"Grafo de Asignación y Solicitud ({completados}/{self.NUM_PROCESOS} Completados)",
         )
-        self.canvas.draw()
         self.actualizar_estado_procesos()
 
     # === ESTADO ===
@@ -308,6 +296,7 @@ class SimuladorIgnorar:
     # === FINALIZACIÓN ===
     def finalizar_simulacion(self):
         self.simulacion_activa = False
+        self.repintado.forzar()
         tiempo_total = time.time() - self.tiempo_inicio
 
         metricas = {
@@ -316,6 +305,8 @@ class SimuladorIgnorar:
             "Solicitudes bloqueadas": self.solicitudes_bloqueadas,
             "Procesos completados": sum(p.finalizado for p in self.procesos),
             "Duración total (s)": round(tiempo_total, 2),
+            "Repintados de la vista": self.repintado.repintados,
+            "Pasos por repintado (promedio)": round(self.repintado.pasos_por_frame(), 2),
         }
 
         with open(METRICS_FILE, "w", encoding="utf-8") as f:
@@ -330,6 +321,15 @@ class SimuladorIgnorar:
 
 # --- MAIN ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulador de la política de ignorar interbloqueos")
+    parser.add_argument("--intervalo-paso", type=int, default=INTERVALO_PASO_MS, help="milisegundos entre pasos")
+    parser.add_argument("--fps", type=float, default=MAX_FPS,
+                        help="repintados por segundo como máximo (0: repintar en cada paso)")
+    parser.add_argument("--disposicion", choices=DISPOSICIONES, default="auto",
+                        help="ubicación de los nodos del grafo (auto: columnas o cuadrícula según la cantidad)")
+    args = parser.parse_args()
+
     root = tb.Window(themename="darkly")
-    app = SimuladorIgnorar(root)
+    app = SimuladorIgnorar(root, intervalo_paso_ms=args.intervalo_paso, max_fps=args.fps,
+                           disposicion=args.disposicion)
     root.mainloop()
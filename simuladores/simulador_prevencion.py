@@ -1,27 +1,47 @@
+import argparse
 import os
+import sys
 import random
 import time
-import ttkbootstrap as tb
-from ttkbootstrap.constants import *
-import tkinter as tk
-from tkinter import scrolledtext
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime
 
+# Permite importar el paquete `simuladores` al ejecutar este archivo directamente
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simuladores.grafico import (DISPOSICIONES, CacheDisposicion, Grabacion, PlanificadorRepintado,
+                                 RenderizadorGrafo, exportar)
+
 # --- CONFIGURACION DE SIMULACION ---
 USE_FIXED_SEED = True
 FIXED_SEED_VALUE = 7
 if USE_FIXED_SEED:
     random.seed(FIXED_SEED_VALUE)
 
+# --- RITMO DE LA SIMULACIÓN ---
+INTERVALO_PASO_MS = 700  # Pausa entre pasos
+MAX_FPS = 10             # Repintados por segundo como máximo (0: repintar en cada paso)
+
 # --- CONFIGURACIÓN DE ARCHIVOS ---
 DATA_DIR = os.path.join("data", "logs_prevencion")
 os.makedirs(DATA_DIR, exist_ok=True)
 LOG_FILE = os.path.join(DATA_DIR, "simulacion_prevencion_log.txt")
 METRICS_FILE = os.path.join(DATA_DIR, "simulacion_prevencion_metrics.txt")
 
+# --- INTERFAZ ---
+# ttkbootstrap, tkinter y pyplot se importan recién al abrir la ventana, así
+# --exportar funciona en una máquina sin pantalla ni toolkit gráfico
+tb = tk = scrolledtext = plt = FigureCanvasTkAgg = None
+
+
+def importar_interfaz():
+    global tb, tk, scrolledtext, plt, FigureCanvasTkAgg, BOTH, LEFT, RIGHT, X, Y, DISABLED
+    import tkinter as tk
+    from tkinter import scrolledtext
+    import ttkbootstrap as tb
+    from ttkbootstrap.constants import BOTH, LEFT, RIGHT, X, Y, DISABLED
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
 
 # --- CLASE PROCESO ---
 class Proceso:
@@ -42,16 +62,32 @@ class Proceso:
 
 # --- CLASE PRINCIPAL ---
 class SimuladorPrevencion:
-    def __init__(self, root):
+    """
+    Con root=None corre sin interfaz (ver ejecutar_sin_interfaz); con
+    grabar=True cada paso guarda el estado del grafo en `grabacion`, para
+    exportarlo después a imágenes o GIF (simuladores.grafico.exportar).
+    Con archivo_log / archivo_metricas en None no se escribe ese archivo.
+    """
+    def __init__(self, root, intervalo_paso_ms=INTERVALO_PASO_MS, max_fps=MAX_FPS, disposicion="auto",
+                 grabar=False, archivo_log=LOG_FILE, archivo_metricas=METRICS_FILE):
         self.root = root
-        self.root.title("Simulador de Prevención de Interbloqueos — SO")
-        self.root.geometry("1400x800")
-        self.style = tb.Style("darkly")
+        self.intervalo_paso_ms = intervalo_paso_ms
+        self.archivo_metricas = archivo_metricas
+        # Posiciones de los nodos: se recalculan solo si cambian los procesos o recursos
+        self.disposicion = CacheDisposicion(disposicion)
+        if self.root is not None:
+            importar_interfaz()
+            self.root.title("Simulador de Prevención de Interbloqueos — SO")
+            self.root.geometry("1400x800")
+            self.style = tb.Style("darkly")
 
         # Colores base
         self.bg_main = "#1e2a33"
         self.bg_panel = "#27343e"
         self.text_color = "#f1f5f9"
+        # Opciones del grafo, las mismas en la ventana y al exportar
+        self.opciones_grafo = {"color_etiqueta": "white", "color_titulo": self.text_color}
+        self.grabacion = Grabacion(color_fondo=self.bg_panel, **self.opciones_grafo) if grabar else None
 
         # Configuración general
         self.NUM_PROCESOS = 10
@@ -66,10 +102,17 @@ class SimuladorPrevencion:
         self.tiempo_inicio_simulacion = time.time()
         self.simulacion_activa = True
         self.pasos_totales = 0
-
-        self.crear_interfaz()
+        self.recurso_denegado = None  # (proceso, recurso) denegado en el último paso
+
+        self.repintado = None
+        self.log_file = open(archivo_log, "w", encoding="utf-8") if archivo_log is not None else None
+        if self.root is not None:
+            self.crear_interfaz()
+            # Los pasos solo marcan la vista; se repinta como máximo max_fps veces por segundo
+            self.repintado = PlanificadorRepintado(self.root.after, self.repintar, max_fps)
         self.log_evento("🧠 Simulación de PREVENCIÓN iniciada.")
-        self.iniciar_simulacion()
+        if self.root is not None:
+            self.iniciar_simulacion()
 
     # === INTERFAZ ===
     def crear_interfaz(self):
@@ -87,7 +130,6 @@ class SimuladorPrevencion:
         graph_frame = tb.Labelframe(left_frame, text="Grafo — Política de Prevención", bootstyle="info", padding=10)
         graph_frame.pack(fill=BOTH, expand=True)
 
-        self.G = nx.DiGraph()
         self.fig, self.ax = plt.subplots(figsize=(6, 6))
         self.ax.set_facecolor(self.bg_panel)
         self.fig.patch.set_facecolor(self.bg_panel)
@@ -96,6 +138,7 @@ class SimuladorPrevencion:
         self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=BOTH, expand=True)
+        self.renderizador = RenderizadorGrafo(self.ax, self.canvas, **self.opciones_grafo)
 
         # === Zona inferior ===
         bottom_frame = tb.Frame(left_frame)
@@ -150,21 +193,26 @@ class SimuladorPrevencion:
         )
         self.log_text.pack(fill=BOTH, expand=True, padx=5, pady=5)
 
-        self.log_file = open(LOG_FILE, "w", encoding="utf-8")
-
     # === LOG ===
     def log_evento(self, mensaje):
         timestamp = datetime.now().strftime("%H:%M:%S")
         texto = f"[{timestamp}] {mensaje}"
-        self.log_text.insert(tk.END, texto + "\n")
-        self.log_text.see(tk.END)
-        self.log_file.write(texto + "\n")
+        if self.root is not None:
+            self.log_text.insert(tk.END, texto + "\n")
+            self.log_text.see(tk.END)
+        if self.log_file is not None:
+            self.log_file.write(texto + "\n")
 
     # === SIMULACIÓN ===
     def iniciar_simulacion(self):
         if self.simulacion_activa:
             self.simular_paso()
-            self.root.after(700, self.iniciar_simulacion)
+            self.root.after(self.intervalo_paso_ms, self.iniciar_simulacion)
+
+    def ejecutar_sin_interfaz(self):
+        """Ejecuta la simulación completa sin esperas (con root=None)."""
+        while self.simulacion_activa:
+            self.simular_paso()
 
     def simular_paso(self):
         self.pasos_totales += 1
@@ -183,6 +231,7 @@ class SimuladorPrevencion:
         proceso = random.choice([p for p in self.procesos if not p.finalizado])
         recurso = random.choice(list(self.recursos.keys()))
         self.solicitudes_totales += 1
+        self.recurso_denegado = None
 
         # Política de prevención: mantener orden ascendente
         if proceso.asignados:
@@ -205,7 +254,8 @@ class SimuladorPrevencion:
                     self.log_evento(
                         f"🔁 {proceso.id} reinicia su ciclo de solicitudes para evitar espera circular."
                     )
-                self.dibujar_grafo(recurso_denegado=(proceso.id, recurso))
+                self.recurso_denegado = (proceso.id, recurso)
+                self.marcar_cambio()
                 return
 
         # Asignación de recurso si libre
@@ -237,81 +287,53 @@ class SimuladorPrevencion:
             proceso.intentos_fallidos += 1
             self.log_evento(f"⏳ {proceso.id} espera {recurso} (retenido por {self.recursos[recurso]}).")
 
-        self.dibujar_grafo()
+        self.marcar_cambio()
 
     # === DIBUJAR GRAFO ===
-    def dibujar_grafo(self, recurso_denegado=None):
-        self.G.clear()
-        pos = {}
+    def marcar_cambio(self):
+        """El estado cambió: se graba el frame (si se está grabando) y se pide repintar la vista."""
+        if self.grabacion is not None:
+            self.grabacion.agregar(*self.estado_grafo(recurso_denegado=self.recurso_denegado))
+        if self.repintado is not None:
+            self.repintado.marcar()
+
+    def repintar(self):
+        self.dibujar_grafo(recurso_denegado=self.recurso_denegado)
+
+    def estado_grafo(self, recurso_denegado=None):
+        """(pos, colores, aristas, titulo) del grafo, lo que recibe RenderizadorGrafo.dibujar."""
         procesos = [p.id for p in self.procesos]
-        recursos = [r for r in self.recursos.keys()]
-
-        for i, p in enumerate(procesos):
-            pos[p] = (0, -i)
-        for i, r in enumerate(recursos):
-            pos[r] = (1, -i)
+        recursos = list(self.recursos.keys())
 
+        colores = {}
         for p in self.procesos:
-            self.G.add_node(p.id, tipo="P", estado=p.estado)
-        for r in recursos:
-            self.G.add_node(r, tipo="R")
+            if p.estado == "Bloqueado":
+                colores[p.id] = "#e67e22"
+            elif p.estado == "Ejecutando":
+                colores[p.id] = "#3498db"
+            elif p.estado == "Terminado":
+                colores[p.id] = "#2ecc71"
+            elif p.estado == "Esperando":
+                colores[p.id] = "#9b59b6"
+            else:
+                colores[p.id] = "#95a5a6"
+        colores.update({r: "#2ecc71" for r in recursos})
 
+        aristas = {}
         for p in self.procesos:
             for rec in p.asignados:
-                self.G.add_edge(p.id, rec, tipo="posee")
+                aristas[(p.id, rec)] = ("#2ecc71", "solid")
             if p.solicitando:
-                self.G.add_edge(p.id, p.solicitando, tipo="solicita")
-
+                aristas[(p.id, p.solicitando)] = ("#f1c40f", "dashed")
         if recurso_denegado:
-            self.G.add_edge(recurso_denegado[0], recurso_denegado[1], tipo="denegado")
-
-        self.ax.clear()
-        node_colors = []
-        for n in self.G.nodes():
-            if self.G.nodes[n]["tipo"] == "P":
-                estado = self.G.nodes[n]["estado"]
-                if estado == "Bloqueado":
-                    node_colors.append("#e67e22")
-                elif estado == "Ejecutando":
-                    node_colors.append("#3498db")
-                elif estado == "Terminado":
-                    node_colors.append("#2ecc71")
-                elif estado == "Esperando":
-                    node_colors.append("#9b59b6")
-                else:
-                    node_colors.append("#95a5a6")
-            else:
-                node_colors.append("#2ecc71")
-
-        edge_colors, styles = [], []
-        for _, _, data in self.G.edges(data=True):
-            if data["tipo"] == "posee":
-                edge_colors.append("#2ecc71"); styles.append("solid")
-            elif data["tipo"] == "solicita":
-                edge_colors.append("#f1c40f"); styles.append("dashed")
-            elif data["tipo"] == "denegado":
-                edge_colors.append("#e74c3c"); styles.append("dashed")
-
-        nx.draw_networkx(
-            self.G,
-            pos,
-            node_color=node_colors,
-            node_shape="o",
-            node_size=1000,
-            font_color="white",
-            font_size=9,
-            edge_color=edge_colors,
-            style=styles,
-            ax=self.ax,
-        )
+            aristas[recurso_denegado] = ("#e74c3c", "dashed")
 
+        pos = self.disposicion.posiciones(procesos, recursos, aristas)
         completados = sum(p.finalizado for p in self.procesos)
-        self.ax.set_title(
-            f"Grafo de Asignación y Solicitud ({completados}/{self.NUM_PROCESOS} Completados)",
-            color=self.text_color
-        )
-        self.ax.axis("off")
-        self.canvas.draw()
+        return pos, colores, aristas, f"Grafo de Asignación y Solicitud ({completados}/{self.NUM_PROCESOS} Completados)"
+
+    def dibujar_grafo(self, recurso_denegado=None):
+        self.renderizador.dibujar(*self.estado_grafo(recurso_denegado))
         self.actualizar_estado_procesos()
 
     # === ESTADO DE PROCESOS ===
@@ -332,6 +354,8 @@ class SimuladorPrevencion:
     # === FINALIZACIÓN Y MÉTRICAS ===
     def finalizar_simulacion(self):
         self.simulacion_activa = False
+        if self.repintado is not None:
+            self.repintado.forzar()
         tiempo_total = time.time() - self.tiempo_inicio_simulacion
 
         metricas = {
@@ -342,19 +366,51 @@ class SimuladorPrevencion:
             "Duración total (s)": round(tiempo_total, 2),
             "Duración promedio por proceso (s)": round(tiempo_total / self.NUM_PROCESOS, 2),
         }
-
-        with open(METRICS_FILE, "w", encoding="utf-8") as f:
-            f.write("--- MÉTRICAS DE SIMULACIÓN DE PREVENCIÓN ---\n")
-            for k, v in metricas.items():
-                f.write(f"{k}: {v}\n")
+        if self.repintado is not None:
+            metricas["Repintados de la vista"] = self.repintado.repintados
+            metricas["Pasos por repintado (promedio)"] = round(self.repintado.pasos_por_frame(), 2)
 
         self.log_evento("✅ Simulación finalizada — todos los procesos completaron sus solicitudes.")
-        self.log_evento(f"📊 Métricas guardadas en: {METRICS_FILE}")
-        self.log_file.close()
+        if self.archivo_metricas is not None:
+            with open(self.archivo_metricas, "w", encoding="utf-8") as f:
+                f.write("--- MÉTRICAS DE SIMULACIÓN DE PREVENCIÓN ---\n")
+                for k, v in metricas.items():
+                    f.write(f"{k}: {v}\n")
+            self.log_evento(f"📊 Métricas guardadas en: {self.archivo_metricas}")
+        if self.log_file is not None:
+            self.log_file.close()
 
 
 # --- MAIN ---
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulador de prevención de interbloqueos")
+    parser.add_argument("--intervalo-paso", type=int, default=INTERVALO_PASO_MS, help="milisegundos entre pasos")
+    parser.add_argument("--fps", type=float, default=MAX_FPS,
+                        help="repintados por segundo como máximo (0: repintar en cada paso)")
+    parser.add_argument("--disposicion", choices=DISPOSICIONES, default="auto",
+                        help="ubicación de los nodos del grafo (auto: columnas o cuadrícula según la cantidad)")
+    parser.add_argument("--exportar", metavar="DESTINO",
+                        help="simular sin ventana y exportar el grafo de cada paso a un .gif o a una carpeta de PNG")
+    parser.add_argument("--trabajadores", type=int, help="procesos que dibujan los frames (por defecto, uno por núcleo)")
+    parser.add_argument("--cada", type=int, default=1, help="exportar uno de cada N pasos")
+    parser.add_argument("--fps-gif", type=float, default=10, help="frames por segundo del GIF")
+    args = parser.parse_args()
+
+    if args.exportar:
+        inicio = time.perf_counter()
+        # Sin logs ni métricas: una exportación no pisa los de la última corrida con ventana
+        app = SimuladorPrevencion(None, disposicion=args.disposicion, grabar=True,
+                                  archivo_log=None, archivo_metricas=None)
+        app.ejecutar_sin_interfaz()
+        simulado = time.perf_counter()
+        exportar(app.grabacion, args.exportar, trabajadores=args.trabajadores, cada=args.cada, fps=args.fps_gif)
+        print(f"{app.pasos_totales} pasos simulados en {simulado - inicio:.2f} s; "
+              f"{len(app.grabacion.frames[::args.cada])} frames exportados a {args.exportar} "
+              f"en {time.perf_counter() - simulado:.2f} s")
+        sys.exit()
+
+    importar_interfaz()
     root = tb.Window(themename="darkly")
-    app = SimuladorPrevencion(root)
+    app = SimuladorPrevencion(root, intervalo_paso_ms=args.intervalo_paso, max_fps=args.fps,
+                              disposicion=args.disposicion)
     root.mainloop()
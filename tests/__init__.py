@@ -0,0 +1,6 @@
+"""
+Pruebas de equivalencia y de validación de los módulos sin interfaz.
+
+    python -m pytest -q
+    python -m unittest discover tests
+"""
@@ -0,0 +1,76 @@
+"""
+Almacenamiento compacto del banquero: MatrizCompacta se usa igual que una
+lista de listas y las instantáneas no comparten el buffer.
+"""
+import pickle
+import unittest
+
+import numpy as np
+
+from simuladores.banquero import MatrizCompacta, ModeloBanquero
+from simuladores.banquero.almacenamiento import copiar_matriz
+
+FILAS = [[1, 2, 3], [4, 5, 6]]
+
+
+class PruebaMatrizCompacta(unittest.TestCase):
+    def setUp(self):
+        self.matriz = MatrizCompacta.desde_filas(FILAS)
+
+    def test_acceso_como_lista_de_listas(self):
+        self.assertEqual(len(self.matriz), 2)
+        self.assertEqual(self.matriz[1][2], 6)
+        self.assertEqual(self.matriz[-1][0], 4)
+        self.assertEqual([list(fila) for fila in self.matriz], FILAS)
+        self.assertEqual(self.matriz, FILAS)
+        self.matriz[0][1] += 10
+        self.matriz[1] = [7, 8, 9]
+        self.assertEqual(self.matriz.tolist(), [[1, 12, 3], [7, 8, 9]])
+        with self.assertRaises(IndexError):
+            self.matriz[2]
+
+    def test_filas_son_vistas_y_copias_independientes(self):
+        fila = self.matriz[0]
+        self.matriz[0][0] = 99
+        self.assertEqual(fila[0], 99)
+
+        copia = self.matriz.copiar()
+        otra = copiar_matriz(self.matriz)
+        self.matriz[1][1] = -1
+        self.assertEqual(copia[1][1], 5)
+        self.assertEqual(otra[1][1], 5)
+        self.assertNotEqual(copia, self.matriz)
+
+    def test_dimensiones_invalidas(self):
+        with self.assertRaises(ValueError):
+            MatrizCompacta.desde_filas([[1, 2], [3]])
+        with self.assertRaises(ValueError):
+            MatrizCompacta(2, 2, self.matriz.datos)
+
+    def test_numpy_resta_y_pickle(self):
+        np.testing.assert_array_equal(np.asarray(self.matriz), np.array(FILAS))
+        demanda = MatrizCompacta.desde_filas([[5, 5, 5], [6, 6, 6]])
+        self.assertEqual(demanda.restar(self.matriz).tolist(), [[4, 3, 2], [2, 1, 0]])
+        self.assertEqual(pickle.loads(pickle.dumps(self.matriz)), self.matriz)
+        self.assertEqual(self.matriz.nbytes, 6 * self.matriz.datos.itemsize)
+
+
+class PruebaModeloCompacto(unittest.TestCase):
+    def test_instantanea_y_restaurar(self):
+        modelo = ModeloBanquero([[0, 1], [1, 0]], [[2, 2], [2, 1]], [3, 3], almacenamiento="compacto")
+        self.assertIsInstance(modelo.necesidad, MatrizCompacta)
+        instantanea = modelo.instantanea()
+        self.assertTrue(modelo.solicitar_recursos(0, [1, 1])[0])
+        self.assertEqual(modelo.asignacion.tolist(), [[1, 2], [1, 0]])
+        modelo.restaurar(instantanea)
+        self.assertEqual(modelo.asignacion.tolist(), [[0, 1], [1, 0]])
+        self.assertEqual(modelo.necesidad.tolist(), [[2, 1], [1, 1]])
+        self.assertEqual(modelo.disponibles, [3, 3])
+
+    def test_almacenamiento_desconocido(self):
+        with self.assertRaises(ValueError):
+            ModeloBanquero([[0]], [[1]], [1], almacenamiento="disco")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Lectura de estados y solicitudes del banquero sin interfaz: se rechazan los
+valores que no son enteros no negativos en vez de convertirlos.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from simuladores.banquero import ModeloBanquero, cargar_estado, cargar_solicitudes, convertir_solicitudes
+
+ESTADO = {
+    "asignacion": [[0, 1, 0], [2, 0, 0]],
+    "demanda_maxima": [[5, 3, 2], [3, 2, 2]],
+    "disponibles": [3, 3, 2],
+}
+
+
+class PruebaArchivos(unittest.TestCase):
+    def setUp(self):
+        self.modelo = ModeloBanquero(ESTADO["asignacion"], ESTADO["demanda_maxima"], ESTADO["disponibles"])
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(self.carpeta.cleanup)
+
+    def escribir(self, nombre, datos):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(datos, f)
+        return ruta
+
+    def test_solicitudes_validas(self):
+        lista = [{"proceso": "P1", "solicitud": [1, 0, 2]}, {"proceso": 0, "solicitud": [0, 0, 0]}]
+        self.assertEqual(convertir_solicitudes(self.modelo, lista), [(1, [1, 0, 2]), (0, [0, 0, 0])])
+        ruta = self.escribir("solicitudes.json", {"solicitudes": lista})
+        self.assertEqual(cargar_solicitudes(ruta, self.modelo), [(1, [1, 0, 2]), (0, [0, 0, 0])])
+
+    def test_solicitudes_invalidas(self):
+        for entrada in (
+            {"proceso": "P1", "solicitud": [0.9, 0, 0]},
+            {"proceso": "P1", "solicitud": [1.0, 0, 0]},
+            {"proceso": "P1", "solicitud": [True, 0, 0]},
+            {"proceso": "P1", "solicitud": ["1", 0, 0]},
+            {"proceso": "P1", "solicitud": [-1, 0, 0]},
+            {"proceso": "P1", "solicitud": "1,0,0"},
+            {"proceso": True, "solicitud": [0, 0, 0]},
+            {"proceso": 2, "solicitud": [0, 0, 0]},
+            {"proceso": "P9", "solicitud": [0, 0, 0]},
+            {"solicitud": [0, 0, 0]},
+            [0, 0, 0],
+        ):
+            with self.subTest(entrada=entrada), self.assertRaisesRegex(ValueError, "Solicitud #2 inválida"):
+                convertir_solicitudes(self.modelo, [{"proceso": "P0", "solicitud": [0, 0, 0]}, entrada])
+
+    def test_estado_invalido(self):
+        for clave, valor in (
+            ("disponibles", [3, 3.5, 2]),
+            ("disponibles", [3, -1, 2]),
+            ("asignacion", [[0, True, 0], [2, 0, 0]]),
+            ("demanda_maxima", [[5, 3, 2], [3, 2]]),
+        ):
+            with self.subTest(clave=clave, valor=valor), self.assertRaises(ValueError):
+                cargar_estado(self.escribir("estado.json", {**ESTADO, clave: valor}))
+
+    def test_estado_valido(self):
+        modelo, datos = cargar_estado(self.escribir("estado.json", ESTADO), motor="numpy")
+        self.assertEqual(modelo.motor, "numpy")
+        self.assertEqual(modelo.disponibles, [3, 3, 2])
+        self.assertTrue(modelo.es_estado_seguro()[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Suite de benchmarks del banquero: detección de regresiones contra una línea
+base y ejecución completa de una rejilla pequeña.
+"""
+import contextlib
+import copy
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from simuladores.banquero.benchmark import METRICAS_COMPARADAS, comparar_con_base, main
+
+
+def caso(clave, chequeo=100.0, solicitud=200.0, pico=1000):
+    return {
+        "clave": clave,
+        "chequeo_us": {"media": chequeo, "p50": chequeo, "p99": chequeo},
+        "solicitud_us": {"media": solicitud, "p50": solicitud, "p99": solicitud},
+        "pico_bytes": pico,
+    }
+
+
+class PruebaComparacion(unittest.TestCase):
+    def setUp(self):
+        self.base = {"resultados": [caso("a"), caso("b")]}
+
+    def test_sin_cambios(self):
+        self.assertEqual(comparar_con_base(self.base["resultados"], self.base, 0.3), [])
+
+    def test_regresion_por_encima_del_umbral(self):
+        regresiones = comparar_con_base([caso("a", chequeo=140.0), caso("b", chequeo=120.0)], self.base, 0.3)
+        self.assertEqual({(clave, metrica) for clave, metrica, *_ in regresiones},
+                         {("a", "chequeo_us.p50"), ("a", "chequeo_us.media")})
+        clave, metrica, valor_base, valor_nuevo, cambio = regresiones[0]
+        self.assertEqual((valor_base, valor_nuevo), (100.0, 140.0))
+        self.assertAlmostEqual(cambio, 0.4)
+
+    def test_mejoras_no_son_regresiones(self):
+        self.assertEqual(comparar_con_base([caso("a", chequeo=10.0, pico=1)], self.base, 0.0), [])
+
+    def test_minimo_absoluto_solo_para_tiempos(self):
+        # +50 % en tiempo pero solo 1 us: ruido; +50 % en memoria sí cuenta
+        base = {"resultados": [caso("a", chequeo=2.0, solicitud=2.0, pico=1000)]}
+        regresiones = comparar_con_base([caso("a", chequeo=3.0, solicitud=3.0, pico=1500)], base, 0.3, minimo_us=5.0)
+        self.assertEqual([metrica for _, metrica, *_ in regresiones], ["pico_bytes"])
+
+    def test_casos_sin_base_y_valores_nulos(self):
+        base = {"resultados": [caso("a", chequeo=0.0, solicitud=0.0, pico=0)]}
+        self.assertEqual(comparar_con_base([caso("a"), caso("nuevo", chequeo=1e9)], base, 0.3), [])
+
+    def test_metricas_comparadas(self):
+        regresiones = comparar_con_base([caso("a", chequeo=1e6, solicitud=1e6, pico=10 ** 9)], self.base, 0.3)
+        self.assertEqual(sorted(metrica for _, metrica, *_ in regresiones), sorted(METRICAS_COMPARADAS))
+
+
+class PruebaLineaDeComandos(unittest.TestCase):
+    ARGUMENTOS = ["--procesos", "6", "--recursos", "2", "--proporciones", "1.0", "--motores", "python",
+                  "--instancias", "2", "--repeticiones", "1", "--rondas", "1", "--solicitudes", "3"]
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(self.carpeta.cleanup)
+
+    def ejecutar(self, *argumentos):
+        salida = io.StringIO()
+        with contextlib.redirect_stdout(salida):
+            codigo = main(self.ARGUMENTOS + list(argumentos))
+        return codigo, salida.getvalue()
+
+    def test_guarda_resultados_y_compara(self):
+        ruta = os.path.join(self.carpeta.name, "base.json")
+        codigo, _ = self.ejecutar("--salida", ruta)
+        self.assertEqual(codigo, 0)
+        with open(ruta, encoding="utf-8") as f:
+            base = json.load(f)
+        self.assertEqual(base["metadatos"]["parametros"]["procesos"], [6])
+        [resultado] = base["resultados"]
+        self.assertEqual(resultado["instancias_seguras"], 2)
+
+        # Una base que la ejecución nueva no puede igualar marca regresión
+        rapida = copy.deepcopy(base)
+        rapida["resultados"][0]["pico_bytes"] = 1
+        ruta_rapida = os.path.join(self.carpeta.name, "rapida.json")
+        with open(ruta_rapida, "w", encoding="utf-8") as f:
+            json.dump(rapida, f)
+        codigo, texto = self.ejecutar("--salida", os.path.join(self.carpeta.name, "nueva.json"),
+                                      "--base", ruta_rapida)
+        self.assertEqual(codigo, 1)
+        self.assertIn("REGRESIONES", texto)
+        self.assertIn("pico_bytes", texto)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Recuperación por retroceso: la víctima vuelve al último checkpoint que rompe
+el ciclo conservando sus recursos y su trabajo, o se reinicia si no hay uno.
+"""
+import unittest
+
+from simuladores.simulador_deteccion import MAX_CHECKPOINTS, ConfiguracionSimulador, SimuladorDeadlock
+
+RETROCESO = ConfiguracionSimulador(recuperacion="retroceso")
+
+
+class PruebaRetroceso(unittest.TestCase):
+    def setUp(self):
+        self.simulador = SimuladorDeadlock(None, RETROCESO, archivo_log=None, archivo_metricas=None,
+                                           num_procesos=2)
+        self.p0, self.p1 = self.simulador.procesos
+
+    def avanzar(self, segundos):
+        self.simulador.reloj_simulado += segundos
+
+    def interbloquear(self):
+        """P0 retiene R1 y pide R2; P1 retiene R2 y pide R1."""
+        simulador = self.simulador
+        simulador.solicitar_recurso(self.p0, "R1")
+        simulador.solicitar_recurso(self.p1, "R2")
+        self.avanzar(1)
+        simulador.solicitar_recurso(self.p1, "R1")
+        simulador.solicitar_recurso(self.p0, "R2")
+        self.assertEqual(sorted(simulador.grafo_de_espera()), [0, 1])
+
+    def test_conserva_recursos_y_trabajo_del_checkpoint(self):
+        simulador = self.simulador
+        simulador.solicitar_recurso(self.p0, "R0")
+        self.avanzar(3)
+        simulador.tomar_checkpoints()
+        self.avanzar(1)
+        self.interbloquear()
+
+        simulador.matar_victima(self.p0)
+        # Conserva R0 (lo tenía en el checkpoint) y suelta R1, que pasa a P1
+        self.assertEqual(self.p0.asignados, {"R0"})
+        self.assertEqual(simulador.recursos["R1"], self.p1.id)
+        self.assertEqual(simulador.grafo_de_espera(), {})
+        self.assertEqual((self.p0.retrocesos, self.p0.reinicios), (1, 0))
+        self.assertEqual(self.p0.estado, "Ejecutando")
+        self.assertAlmostEqual(self.p0.trabajo_realizado(simulador.ahora()), 3)
+        self.assertAlmostEqual(simulador.trabajo_conservado, 3)
+        # Trabajó 2 s más después del checkpoint antes de bloquearse
+        self.assertAlmostEqual(simulador.trabajo_perdido, 2)
+
+    def test_descarta_checkpoints_con_recursos_esperados(self):
+        simulador = self.simulador
+        simulador.tomar_checkpoints()
+        simulador.solicitar_recurso(self.p0, "R1")
+        self.avanzar(2)
+        simulador.tomar_checkpoints()
+        self.interbloquear()
+
+        # El checkpoint más nuevo retiene R1, que P1 espera: se vuelve al anterior
+        simulador.matar_victima(self.p0)
+        self.assertEqual(self.p0.asignados, set())
+        self.assertEqual(len(self.p0.checkpoints), 1)
+        self.assertEqual(simulador.recursos["R1"], self.p1.id)
+        self.assertEqual(simulador.grafo_de_espera(), {})
+
+    def test_sin_checkpoint_util_se_reinicia(self):
+        simulador = self.simulador
+        self.interbloquear()
+        simulador.tomar_checkpoints()
+        simulador.matar_victima(self.p0)
+        self.assertEqual((self.p0.retrocesos, self.p0.reinicios), (0, 1))
+        self.assertEqual(self.p0.asignados, set())
+        self.assertEqual(len(self.p0.checkpoints), 0)
+        self.assertEqual(simulador.grafo_de_espera(), {})
+
+    def test_estados_sin_cambios_se_comparten(self):
+        simulador = self.simulador
+        simulador.solicitar_recurso(self.p0, "R0")
+        simulador.tomar_checkpoints()
+        compartidos, copiados = simulador.estados_compartidos, simulador.estados_copiados
+        simulador.tomar_checkpoints()
+        self.assertEqual(simulador.estados_compartidos - compartidos, 2)
+        self.assertEqual(simulador.estados_copiados, copiados)
+        self.assertIs(self.p0.checkpoints[-1].asignados, self.p0.checkpoints[-2].asignados)
+
+        simulador.solicitar_recurso(self.p0, "R1")
+        simulador.tomar_checkpoints()
+        self.assertEqual(simulador.estados_copiados - copiados, 1)
+        self.assertEqual(self.p0.checkpoints[-1].asignados, {"R0", "R1"})
+
+        for _ in range(2 * MAX_CHECKPOINTS):
+            simulador.tomar_checkpoints()
+        self.assertEqual(len(self.p0.checkpoints), MAX_CHECKPOINTS)
+
+
+class PruebaSimuladorConRetroceso(unittest.TestCase):
+    def test_ejecucion_completa(self):
+        for semilla in range(3):
+            with self.subTest(semilla=semilla):
+                simulador = SimuladorDeadlock(None, RETROCESO, semilla=semilla, archivo_log=None,
+                                              archivo_metricas=None)
+                simulador.ejecutar_sin_interfaz()
+                self.assertEqual(len(simulador.procesos_terminados_exitosamente), simulador.num_procesos)
+                self.assertGreater(simulador.checkpoints_tomados, 0)
+                self.assertGreater(simulador.retrocesos, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
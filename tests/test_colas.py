@@ -0,0 +1,88 @@
+"""
+Colas de espera del simulador de detección: cada liberación entrega el
+recurso al primero que lo esperaba, con trabajo constante por liberación.
+"""
+from collections import deque
+import random
+import unittest
+
+from simuladores.simulador_deteccion import SimuladorDeadlock
+
+
+class ColaContada(deque):
+    """Cola que cuenta cuántas veces se saca un turno del frente."""
+    extracciones = 0
+
+    def popleft(self):
+        self.extracciones += 1
+        return super().popleft()
+
+
+class SinDetector:
+    """
+    Con un solo recurso, cada cambio de dueño mueve las aristas de todos los
+    que esperan en el grafo de espera; aquí se mide solo la cola.
+    """
+    def esperar(self, pid, recurso, dueno):
+        pass
+
+    def asignar(self, pid, recurso):
+        pass
+
+    def liberar(self, pid, recurso):
+        pass
+
+    def cancelar_espera(self, pid):
+        pass
+
+
+class PruebaColasEspera(unittest.TestCase):
+    def simulador(self, num_procesos):
+        simulador = SimuladorDeadlock(None, archivo_log=None, archivo_metricas=None, num_procesos=num_procesos)
+        simulador.colas_espera["R0"] = ColaContada()
+        return simulador
+
+    def test_diez_mil_procesos_en_orden_de_llegada(self):
+        simulador = self.simulador(10000)
+        simulador.detector = SinDetector()
+        llegada = random.Random(17).sample(simulador.procesos, len(simulador.procesos))
+        for proceso in llegada:
+            simulador.solicitar_recurso(proceso, "R0")
+        cola = simulador.colas_espera["R0"]
+        self.assertEqual(len(cola), len(llegada) - 1)
+
+        for dueno, siguiente in zip(llegada, llegada[1:]):
+            self.assertEqual(simulador.recursos["R0"], dueno.id)
+            extracciones, solicitudes = cola.extracciones, simulador.solicitudes_totales
+            simulador.liberar_recursos(dueno)
+            # Se despierta exactamente al primero de la cola, sin revisar a nadie más
+            self.assertEqual(simulador.recursos["R0"], siguiente.id)
+            self.assertEqual(cola.extracciones - extracciones, 1)
+            self.assertEqual(simulador.solicitudes_totales - solicitudes, 1)
+            self.assertEqual(siguiente.estado, "Ejecutando")
+        self.assertEqual(len(cola), 0)
+        self.assertEqual(simulador.bloqueados, {})
+
+    def test_turnos_caducados_y_llegadas_tardias(self):
+        simulador = self.simulador(5)
+        p0, p1, p2, p3, p4 = simulador.procesos
+        for proceso in (p0, p1, p2, p3):
+            simulador.solicitar_recurso(proceso, "R0")
+
+        # P2 se reinicia mientras espera y vuelve a pedir: pasa al final
+        simulador.reiniciar_proceso(p2)
+        simulador.solicitar_recurso(p2, "R0")
+        duenos = []
+        for proceso in (p0, p1):
+            simulador.liberar_recursos(proceso)
+            duenos.append(simulador.recursos["R0"])
+        # Quien llega después de una liberación no se adelanta a los que esperaban
+        simulador.solicitar_recurso(p4, "R0")
+        for proceso in (p3, p2):
+            simulador.liberar_recursos(proceso)
+            duenos.append(simulador.recursos["R0"])
+        self.assertEqual(duenos, [p1.id, p3.id, p2.id, p4.id])
+
+
+if __name__ == "__main__":
+    unittest.main()
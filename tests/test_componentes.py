@@ -0,0 +1,60 @@
+"""
+Todos los interbloqueos en una sola ronda: componentes fuertemente conexas
+frente a networkx y conteo de las rondas de recuperación ahorradas.
+"""
+import random
+import unittest
+from unittest import mock
+
+from simuladores import simulador_deteccion
+from simuladores.deteccion import componentes_fuertemente_conexas
+from simuladores.simulador_deteccion import ConfiguracionSimulador, SimuladorDeadlock
+
+from .utilidades import componentes_networkx
+
+
+class PruebaComponentes(unittest.TestCase):
+    def test_componentes_fuertemente_conexas(self):
+        rng = random.Random(8)
+        for _ in range(200):
+            nodos = list(range(rng.randint(1, 25)))
+            sucesores = {p: rng.sample(nodos, min(rng.randint(0, 3), len(nodos))) for p in nodos}
+            componentes = componentes_fuertemente_conexas(sucesores)
+            self.assertEqual(sorted(sorted(c) for c in componentes if len(c) > 1),
+                             componentes_networkx(sucesores, nodos))
+            self.assertEqual(sorted(p for c in componentes for p in c), nodos)
+
+    def test_grafo_grande_sin_recursion(self):
+        nodos = list(range(20000))
+        sucesores = {p: [(p + 1) % len(nodos)] for p in nodos}
+        self.assertEqual([sorted(c) for c in componentes_fuertemente_conexas(sucesores)], [nodos])
+
+
+class PruebaRondasAhorradas(unittest.TestCase):
+    def test_una_ronda_para_varios_interbloqueos(self):
+        configuracion = ConfiguracionSimulador("componentes", politica_deteccion="cada_k")
+        simulador = SimuladorDeadlock(None, configuracion, semilla=3, archivo_log=None, archivo_metricas=None)
+        simulador.ejecutar_sin_interfaz()
+        self.assertGreater(simulador.rondas_ahorradas, 0)
+        self.assertEqual(simulador.rondas_ahorradas,
+                         simulador.interbloqueos_detectados - simulador.rondas_recuperacion)
+
+    def test_costo_minimo_cuenta_componentes_no_victimas(self):
+        # P0 <-> P1 en un solo interbloqueo; aunque se maten los dos, no se ahorra ninguna ronda
+        configuracion = ConfiguracionSimulador("componentes", costo_victima="trabajo")
+        simulador = SimuladorDeadlock(None, configuracion, semilla=3, archivo_log=None, archivo_metricas=None)
+        p0, p1 = simulador.procesos[:2]
+        for proceso, recurso in ((p0, "R0"), (p1, "R1"), (p0, "R1"), (p1, "R0")):
+            simulador.solicitar_recurso(proceso, recurso)
+        self.assertTrue(simulador.detectar_interbloqueo())
+
+        with mock.patch.object(simulador_deteccion, "victimas_de_costo_minimo",
+                               lambda espera, procesos, costos, desempate=None: sorted(procesos)):
+            simulador._resolver_interbloqueo_paso_2()
+        self.assertEqual(simulador.procesos_victimas, 2)
+        self.assertEqual(simulador.rondas_recuperacion, 1)
+        self.assertEqual(simulador.rondas_ahorradas, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
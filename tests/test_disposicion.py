@@ -0,0 +1,88 @@
+"""
+Caché de disposiciones del grafo: reutiliza `pos` mientras no cambien los
+nodos, los conserva en su lugar al agregar o quitar otros y no encima nodos
+en ningún modo.
+"""
+import random
+import unittest
+
+from simuladores.grafico import DISPOSICIONES, CacheDisposicion
+from simuladores.grafico.disposicion import MAX_PROCESOS_COLUMNAS
+
+
+def nodos(num_procesos, num_recursos):
+    return [f"P{i}" for i in range(num_procesos)], [f"R{i}" for i in range(num_recursos)]
+
+
+class PruebaCacheDisposicion(unittest.TestCase):
+    def test_mismos_nodos_mismo_diccionario(self):
+        cache = CacheDisposicion("columnas")
+        procesos, recursos = nodos(4, 3)
+        pos = cache.posiciones(procesos, recursos)
+        self.assertIs(cache.posiciones(list(procesos), list(recursos)), pos)
+        self.assertEqual((cache.completas, cache.reutilizadas), (1, 1))
+        self.assertEqual(pos["P3"], (0, -3))
+        self.assertEqual(pos["R0"], (2, 0))
+
+    def test_cambios_conservan_las_demas_posiciones(self):
+        for modo in ("columnas", "cuadricula"):
+            with self.subTest(modo=modo):
+                cache = CacheDisposicion(modo)
+                procesos, recursos = nodos(9, 4)
+                antes = cache.posiciones(procesos, recursos)
+
+                # Sale P1 y entran P9 (a su ranura) y R4
+                procesos = [p for p in procesos if p != "P1"] + ["P9"]
+                despues = cache.posiciones(procesos, recursos + ["R4"])
+                self.assertEqual(cache.incrementales, 1)
+                self.assertNotIn("P1", despues)
+                self.assertEqual(despues["P9"], antes["P1"])
+                self.assertTrue(all(despues[n] == antes[n] for n in antes if n in despues))
+                self.assertEqual(list(despues), procesos + recursos + ["R4"])
+
+    def test_sin_nodos_encimados(self):
+        rng = random.Random(2)
+        procesos, recursos = nodos(200, 150)
+        aristas = [(rng.choice(procesos), rng.choice(recursos)) for _ in range(120)]
+        for modo in DISPOSICIONES:
+            with self.subTest(modo=modo):
+                pos = CacheDisposicion(modo).posiciones(procesos, recursos, aristas)
+                self.assertEqual(set(pos), set(procesos + recursos))
+                self.assertEqual(len(set(pos.values())), len(pos))
+
+    def test_auto_segun_cantidad_de_procesos(self):
+        cache = CacheDisposicion()
+        cache.posiciones(*nodos(MAX_PROCESOS_COLUMNAS, 2))
+        self.assertEqual(cache.modo_actual, "columnas")
+        pos = cache.posiciones(*nodos(MAX_PROCESOS_COLUMNAS + 70, 2))
+        self.assertEqual(cache.modo_actual, "cuadricula")
+        self.assertEqual(cache.completas, 2)
+        # Cuadrícula de 10 columnas: P99 en la última fila
+        self.assertEqual(pos["P99"], (9, -9))
+
+    def test_componentes_agrupadas_y_reagrupado_limitado(self):
+        reloj = [0.0]
+        cache = CacheDisposicion("componentes", min_intervalo_s=2.0, reloj=lambda: reloj[0])
+        procesos, recursos = nodos(6, 4)
+        aristas = [("P0", "R0"), ("R0", "P3"), ("P3", "R1"), ("P5", "R2")]
+        pos = cache.posiciones(procesos, recursos, aristas)
+        # P0, P3, R0 y R1 en la misma celda: procesos en una columna y recursos en la siguiente
+        self.assertEqual({pos[n][0] for n in ("P0", "P3")}, {pos["P0"][0]})
+        self.assertEqual({pos[n][0] for n in ("R0", "R1")}, {pos["P0"][0] + 1})
+        self.assertEqual(pos["P5"][0], pos["R2"][0] - 1)
+        self.assertNotEqual(pos["P5"][0], pos["P0"][0])
+
+        # Cambian las componentes: no se reagrupa hasta pasado el intervalo
+        aristas.append(("P1", "R3"))
+        self.assertIs(cache.posiciones(procesos, recursos, aristas), pos)
+        reloj[0] = 2.5
+        self.assertIsNot(cache.posiciones(procesos, recursos, aristas), pos)
+        self.assertEqual(cache.completas, 2)
+
+    def test_modo_desconocido(self):
+        with self.assertRaises(ValueError):
+            CacheDisposicion("circular")
+
+
+if __name__ == "__main__":
+    unittest.main()
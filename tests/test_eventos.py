@@ -0,0 +1,67 @@
+"""
+Avisos sin bloqueo del simulador de detección: la cola de eventos está
+acotada y la recuperación puede aplicarse sin retardo.
+"""
+import unittest
+
+from simuladores.simulador_deteccion import MAX_EVENTOS, ConfiguracionSimulador, SimuladorDeadlock
+
+
+def simulador(**opciones):
+    return SimuladorDeadlock(None, ConfiguracionSimulador(**opciones), semilla=1,
+                             archivo_log=None, archivo_metricas=None)
+
+
+class PruebaColaEventos(unittest.TestCase):
+    def test_cola_acotada_y_tomar_eventos(self):
+        s = simulador()
+        for i in range(MAX_EVENTOS + 10):
+            s.notificar("recuperacion", "Aviso", str(i))
+        eventos = s.tomar_eventos()
+        # Se descartan los más viejos
+        self.assertEqual(len(eventos), MAX_EVENTOS)
+        self.assertEqual(eventos[0]["mensaje"], "10")
+        self.assertEqual(eventos[-1]["mensaje"], str(MAX_EVENTOS + 9))
+        self.assertEqual(s.tomar_eventos(), [])
+
+    def test_cada_interbloqueo_avisa_deteccion_y_recuperacion(self):
+        s = simulador(retardo_recuperacion_ms=0)
+        s.ejecutar_sin_interfaz()
+        tipos = [evento["tipo"] for evento in s.tomar_eventos()]
+        self.assertGreater(s.rondas_recuperacion, 0)
+        self.assertEqual(tipos.count("interbloqueo"), s.rondas_recuperacion)
+        self.assertEqual(tipos.count("recuperacion"), s.rondas_recuperacion)
+        # Cada aviso de recuperación sigue al de su interbloqueo
+        self.assertTrue(all(tipos[i:i + 2] == ["interbloqueo", "recuperacion"]
+                            for i, tipo in enumerate(tipos) if tipo == "interbloqueo"))
+
+
+class PruebaRetardoRecuperacion(unittest.TestCase):
+    def pares(self, retardo_ms):
+        """(hora de detección, hora de recuperación) de cada interbloqueo."""
+        s = simulador(retardo_recuperacion_ms=retardo_ms)
+        s.ejecutar_sin_interfaz()
+        eventos = s.tomar_eventos()
+        return [(a["tiempo"], b["tiempo"]) for a, b in zip(eventos, eventos[1:])
+                if (a["tipo"], b["tipo"]) == ("interbloqueo", "recuperacion")]
+
+    def test_sin_retardo_se_recupera_en_el_mismo_instante(self):
+        pares = self.pares(0)
+        self.assertTrue(pares)
+        self.assertTrue(all(recuperacion == deteccion for deteccion, recuperacion in pares))
+
+    def test_retardo_configurado(self):
+        pares = self.pares(1500)
+        self.assertTrue(pares)
+        for deteccion, recuperacion in pares:
+            self.assertAlmostEqual(recuperacion - deteccion, 1.5)
+
+    def test_configuracion_invalida(self):
+        with self.assertRaises(ValueError):
+            simulador(retardo_recuperacion_ms=-1)
+        with self.assertRaises(ValueError):
+            simulador(notificacion="sonido")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Exportación sin pantalla: los frames dibujados en varios procesos son los
+mismos que en uno solo, en orden, y el GIF tiene un frame por paso exportado.
+"""
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from simuladores.grafico import Grabacion, exportar
+from simuladores.simulador_prevencion import SimuladorPrevencion
+
+POS = {"P0": (0, 0), "P1": (0, -1), "R0": (1, 0), "R1": (1, -1)}
+
+
+def grabacion(pasos=6):
+    """P0 y P1 se turnan para pedir R0 y R1; a mitad de camino aparece P2."""
+    resultado = Grabacion(tamano=(2, 2), dpi=40)
+    pos = POS
+    for paso in range(pasos):
+        if paso == pasos // 2:
+            pos = {**POS, "P2": (0, -2)}
+        colores = {n: "#e74c3c" if n == f"P{paso % 2}" else "#95a5a6" for n in pos}
+        aristas = {(f"P{paso % 2}", f"R{(paso // 2) % 2}"): ("red", "dashed")}
+        resultado.agregar(pos, colores, aristas, f"Paso {paso // 3}")
+    return resultado
+
+
+def pixeles(rutas):
+    return [np.asarray(Image.open(ruta)) for ruta in rutas]
+
+
+class PruebaExportar(unittest.TestCase):
+    def setUp(self):
+        carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(carpeta.cleanup)
+        self.carpeta = carpeta.name
+
+    def test_grabacion_guarda_cada_disposicion_una_vez(self):
+        g = grabacion()
+        self.assertEqual(len(g), 6)
+        self.assertEqual(len(g.posiciones), 2)
+        self.assertEqual([indice for indice, *_ in g.frames], [0, 0, 0, 1, 1, 1])
+
+    def test_png_en_paralelo_igual_que_en_un_proceso(self):
+        g = grabacion()
+        serie = exportar(g, os.path.join(self.carpeta, "serie"), trabajadores=1)
+        paralelo = exportar(g, os.path.join(self.carpeta, "paralelo"), trabajadores=3)
+        self.assertEqual([os.path.basename(r) for r in paralelo], [f"frame_{k:05d}.png" for k in range(6)])
+        for a, b in zip(pixeles(serie), pixeles(paralelo)):
+            np.testing.assert_array_equal(a, b)
+        # Los pasos son distintos entre sí
+        self.assertFalse(np.array_equal(*pixeles(serie[:2])))
+
+    def test_gif_y_cada(self):
+        destino = os.path.join(self.carpeta, "corrida.gif")
+        self.assertEqual(exportar(grabacion(), destino, trabajadores=2, cada=2, fps=5), [])
+        with Image.open(destino) as gif:
+            self.assertEqual(gif.n_frames, 3)
+            self.assertEqual(gif.info["duration"], 200)
+            self.assertEqual(gif.size, (80, 80))
+
+    def test_argumentos_invalidos(self):
+        for opciones in ({"cada": 0}, {"fps": 0}):
+            with self.assertRaises(ValueError):
+                exportar(grabacion(), self.carpeta, **opciones)
+        with self.assertRaises(ValueError):
+            exportar(Grabacion(), self.carpeta)
+
+    def test_simulador_de_prevencion_sin_pantalla(self):
+        app = SimuladorPrevencion(None, grabar=True, archivo_log=None, archivo_metricas=None)
+        app.ejecutar_sin_interfaz()
+        # Un frame por paso, salvo el último, que solo termina la simulación
+        self.assertEqual(len(app.grabacion), app.pasos_totales - 1)
+        cada = max(1, len(app.grabacion) // 4)
+        rutas = exportar(app.grabacion, os.path.join(self.carpeta, "prevencion"), trabajadores=2, cada=cada)
+        self.assertEqual(len(rutas), len(app.grabacion.frames[::cada]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Generador de instancias del banquero: la etiqueta coincide con el modelo y
+cada instancia depende solo de (semilla, k).
+"""
+import contextlib
+import io
+import itertools
+import json
+import unittest
+
+from simuladores.banquero import ModeloBanquero
+from simuladores.banquero.generador import GeneradorInstancias, main
+
+
+class PruebaGeneradorInstancias(unittest.TestCase):
+    def test_etiqueta_coincide_con_el_modelo(self):
+        for vectorizado in (False, True):
+            generador = GeneradorInstancias(semilla=42, num_procesos=30, num_recursos=4,
+                                            proporcion_seguras=0.5, densidad=0.6, vectorizado=vectorizado)
+            etiquetas = set()
+            for asignacion, demanda_maxima, disponibles, segura in generador.generar(100):
+                modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles)
+                self.assertEqual(modelo.es_estado_seguro()[0], segura)
+                etiquetas.add(segura)
+            self.assertEqual(etiquetas, {False, True})
+
+    def test_reproducible_e_independiente_del_orden(self):
+        for vectorizado in (False, True):
+            generador = GeneradorInstancias(semilla=7, num_procesos=8, num_recursos=3,
+                                            proporcion_seguras=0.5, vectorizado=vectorizado)
+            otro = GeneradorInstancias(semilla=7, num_procesos=8, num_recursos=3,
+                                       proporcion_seguras=0.5, vectorizado=vectorizado)
+            self.assertEqual(list(generador.generar(5, inicio=10)), [otro.instancia(k) for k in range(10, 15)])
+
+    def test_densidad_y_flujo_perezoso(self):
+        generador = GeneradorInstancias(semilla=3, num_procesos=50, num_recursos=10, densidad=0.2)
+        asignacion, demanda_maxima, _, _ = next(iter(generador))
+        celdas = [a for fila in asignacion for a in fila]
+        self.assertLess(sum(1 for a in celdas if a) / len(celdas), 0.5)
+        # El flujo infinito se puede cortar sin generar el resto
+        self.assertEqual(list(itertools.islice(generador, 3)), list(generador.generar(3)))
+
+    def test_parametros_invalidos(self):
+        for opciones in ({"num_procesos": 0}, {"num_recursos": 0}, {"proporcion_seguras": 1.5},
+                         {"densidad": 0.0}, {"num_procesos": 1, "proporcion_seguras": 0.5}):
+            with self.subTest(opciones=opciones), self.assertRaises(ValueError):
+                GeneradorInstancias(semilla=1, **opciones)
+
+    def test_linea_de_comandos(self):
+        salida = io.StringIO()
+        with contextlib.redirect_stdout(salida):
+            main(["--cantidad", "3", "--inicio", "5", "--procesos", "4", "--semilla", "9"])
+        instancias = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+        generador = GeneradorInstancias(semilla=9, num_procesos=4, num_recursos=3)
+        self.assertEqual([(i["asignacion"], i["demanda_maxima"], i["disponibles"], i["segura"]) for i in instancias],
+                         list(generador.generar(3, inicio=5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Grafo de espera incremental: coincide con el que se reconstruye desde cero
+(frente a networkx) y la búsqueda de ciclos solo recorre la región afectada;
+en línea, el ciclo se conoce al insertar la arista que lo cierra.
+"""
+import random
+import unittest
+
+import networkx as nx
+
+from simuladores.deteccion import GrafoEspera
+from simuladores.deteccion.orden_dinamico import OrdenTopologicoDinamico
+from simuladores.simulador_deteccion import ConfiguracionSimulador, SimuladorDeadlock
+
+from .utilidades import Escenario, componentes_networkx
+
+
+class PruebaGrafoEspera(unittest.TestCase):
+    def test_grafo_espera_frente_a_networkx(self):
+        rng = random.Random(4)
+        for _ in range(150):
+            num_procesos = rng.randint(2, 10)
+            en_linea, incremental = GrafoEspera(en_linea=True), GrafoEspera()
+            escenario = Escenario(rng, num_procesos, rng.randint(1, 8), [en_linea, incremental])
+
+            for _ in range(60):
+                escenario.paso()
+                espera = escenario.grafo_de_espera()
+                esperadas = componentes_networkx(espera, escenario.procesos)
+                hay_ciclo = bool(esperadas)
+
+                for detector in (en_linea, incremental):
+                    self.assertEqual({p: set(d) for p, d in detector.sucesores.items() if d},
+                                     {p: set(d) for p, d in espera.items()})
+                    ciclo = detector.buscar_ciclo()
+                    self.assertEqual(ciclo is not None, hay_ciclo)
+                    if ciclo is not None:
+                        self.assertTrue(any(set(ciclo) <= set(c) for c in esperadas))
+                    self.assertEqual(sorted(sorted(c) for c in detector.componentes_en_interbloqueo()), esperadas)
+
+    def test_busqueda_solo_desde_aristas_nuevas(self):
+        # Cadena acíclica larga: P0 -> P1 -> ... -> P999
+        grafo = GrafoEspera()
+        n = 1000
+        for i in range(n):
+            grafo.asignar(i, f"R{i}")
+        for i in range(n - 1):
+            grafo.esperar(i, f"R{i + 1}", i + 1)
+        self.assertIsNone(grafo.buscar_ciclo())
+        grafo.tomar_contadores()
+
+        # Sin eventos nuevos no se examina nada
+        self.assertIsNone(grafo.buscar_ciclo())
+        self.assertEqual(grafo.tomar_contadores()["aristas_examinadas"], 0)
+
+        # Una arista nueva al final de la cadena: se recorre solo desde su origen
+        grafo.asignar(n, f"R{n}")
+        grafo.esperar(n - 1, f"R{n}", n)
+        self.assertIsNone(grafo.buscar_ciclo())
+        contadores = grafo.tomar_contadores()
+        self.assertEqual(contadores["aristas_modificadas"], 1)
+        self.assertLessEqual(contadores["aristas_examinadas"], 2)
+
+    def test_liberar_y_cancelar_quitan_aristas(self):
+        grafo = GrafoEspera()
+        grafo.asignar(0, "R0")
+        grafo.esperar(1, "R0", 0)
+        grafo.esperar(2, "R0", 0)
+        self.assertEqual(grafo.num_aristas, 2)
+        grafo.cancelar_espera(2)
+        grafo.liberar(0, "R0")
+        self.assertEqual(grafo.num_aristas, 0)
+        # El nuevo dueño hereda a los que siguen esperando
+        grafo.esperar(3, "R0", None)
+        grafo.asignar(1, "R0")
+        self.assertEqual(dict(grafo.sucesores), {3: {1}})
+
+
+class PruebaOrdenDinamico(unittest.TestCase):
+    def test_frente_a_networkx(self):
+        rng = random.Random(12)
+        for _ in range(100):
+            orden, referencia = OrdenTopologicoDinamico(), nx.DiGraph()
+            nodos = list(range(rng.randint(2, 15)))
+            for _ in range(40):
+                origen, destino = rng.sample(nodos, 2)
+                if rng.random() < 0.2 and referencia.has_edge(origen, destino):
+                    orden.quitar_arista(origen, destino)
+                    referencia.remove_edge(origen, destino)
+                    continue
+                cierra = referencia.has_node(destino) and referencia.has_node(origen) \
+                    and nx.has_path(referencia, destino, origen)
+                ciclo = orden.agregar_arista(origen, destino)
+                self.assertEqual(ciclo is not None, cierra)
+                if ciclo is None:
+                    referencia.add_edge(origen, destino)
+                else:
+                    # [destino, ..., origen]: un camino del grafo que la arista cierra
+                    self.assertEqual((ciclo[0], ciclo[-1]), (destino, origen))
+                    self.assertTrue(all(referencia.has_edge(u, v) for u, v in zip(ciclo, ciclo[1:])))
+                # El orden sigue siendo topológico
+                self.assertTrue(all(orden.orden[u] < orden.orden[v] for u, v in referencia.edges))
+
+
+class PruebaGrafoEnLinea(unittest.TestCase):
+    def test_ciclo_al_insertar_y_reintento_de_diferidas(self):
+        grafo = GrafoEspera(en_linea=True)
+        for pid in range(3):
+            grafo.asignar(pid, f"R{pid}")
+        grafo.esperar(0, "R1", 1)
+        grafo.esperar(1, "R2", 2)
+        self.assertEqual(grafo.diferidas, {})
+        grafo.esperar(2, "R0", 0)
+        self.assertEqual(list(grafo.diferidas), [(2, 0)])
+        grafo.tomar_contadores()
+        self.assertEqual(sorted(grafo.buscar_ciclo()), [0, 1, 2])
+        # Consultar no recorre el grafo
+        self.assertEqual(grafo.tomar_contadores()["aristas_examinadas"], 0)
+
+        # Al romperse el ciclo la arista diferida pasa al orden; al volver, se difiere otra vez
+        grafo.cancelar_espera(1)
+        self.assertIsNone(grafo.buscar_ciclo())
+        self.assertEqual(grafo.diferidas, {})
+        grafo.esperar(1, "R2", 2)
+        self.assertEqual(sorted(grafo.buscar_ciclo()), [0, 1, 2])
+
+
+class PruebaSimuladorGrafoEspera(unittest.TestCase):
+    def test_detector_al_dia_en_cada_paso(self):
+        for modo in ("en_linea", "incremental"):
+            simulador = SimuladorDeadlock(None, ConfiguracionSimulador(modo), semilla=6,
+                                          archivo_log=None, archivo_metricas=None)
+            ciclo_original = simulador.ciclo_simulacion
+
+            def ciclo_comprobado():
+                detector = {p: set(d) for p, d in simulador.detector.sucesores.items() if d}
+                self.assertEqual(detector, {p: set(d) for p, d in simulador.grafo_de_espera().items()})
+                ciclo_original()
+
+            with self.subTest(modo=modo):
+                simulador.ciclo_simulacion = ciclo_comprobado
+                simulador.ejecutar_sin_interfaz()
+                self.assertEqual(len(simulador.procesos_terminados_exitosamente), simulador.num_procesos)
+
+
+if __name__ == "__main__":
+    unittest.main()
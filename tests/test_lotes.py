@@ -0,0 +1,58 @@
+"""
+Evaluación por lotes del banquero: mismos veredictos que solicitar una por
+una sobre el estado base, sin modificarlo y analizándolo una sola vez.
+"""
+import random
+import unittest
+from unittest import mock
+
+from simuladores.banquero import MENSAJE_ESTADO_INSEGURO, MOTORES_SEGURIDAD, ModeloBanquero
+from simuladores.banquero.generador import GeneradorInstancias
+
+from .test_motores import estado
+from .test_transaccional import ASIGNACION, DEMANDA_MAXIMA, DISPONIBLES
+
+
+class PruebaEvaluarSolicitudes(unittest.TestCase):
+    def test_evaluar_solicitudes_no_modifica_el_estado(self):
+        rng = random.Random(3)
+        generador = GeneradorInstancias(semilla=2, num_procesos=5, num_recursos=3)
+        for asignacion, demanda_maxima, disponibles, _ in generador.generar(20):
+            for motor in MOTORES_SEGURIDAD:
+                modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor=motor)
+                antes = estado(modelo)
+                solicitudes = [(rng.randrange(5), [rng.randint(0, 2) for _ in range(3)]) for _ in range(15)]
+                resultados = modelo.evaluar_solicitudes(solicitudes)
+                self.assertEqual(estado(modelo), antes)
+
+                for (id_proceso, solicitud), (exito, _) in zip(solicitudes, resultados):
+                    copia = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor=motor)
+                    self.assertEqual(exito, copia.solicitar_recursos(id_proceso, solicitud)[0])
+
+    def test_holgura_evita_la_comprobacion_completa(self):
+        modelo = ModeloBanquero(ASIGNACION, DEMANDA_MAXIMA, DISPONIBLES)
+        # Ninguna supera la holgura de los procesos que van antes en la secuencia base
+        solicitudes = [(1, [1, 0, 2]), (3, [0, 1, 0]), (4, [1, 1, 0])]
+        with mock.patch.object(modelo, "es_estado_seguro", wraps=modelo.es_estado_seguro) as comprobacion:
+            resultados = modelo.evaluar_solicitudes(solicitudes)
+        self.assertEqual(comprobacion.call_count, 1)
+        self.assertTrue(all(exito for exito, _ in resultados))
+
+    def test_estado_base_inseguro_rechaza_todo(self):
+        modelo = ModeloBanquero(ASIGNACION, DEMANDA_MAXIMA, [0, 0, 0])
+        self.assertFalse(modelo.es_estado_seguro()[0])
+        resultados = modelo.evaluar_solicitudes([(1, [0, 0, 0]), (3, [0, 0, 0])])
+        self.assertEqual(resultados, [(False, MENSAJE_ESTADO_INSEGURO)] * 2)
+
+    def test_errores_en_su_posicion(self):
+        modelo = ModeloBanquero(ASIGNACION, DEMANDA_MAXIMA, DISPONIBLES)
+        resultados = modelo.evaluar_solicitudes([(1, [1, 0, 2]), (9, [0, 0, 0]), (1, [-1, 0, 0]), (1, [1, 0])])
+        self.assertTrue(resultados[0][0])
+        self.assertEqual([exito for exito, _ in resultados[1:]], [False] * 3)
+        self.assertIn("Proceso inválido", resultados[1][1])
+        self.assertIn("negativas", resultados[2][1])
+        self.assertIn("tipos de recurso", resultados[3][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Detector matricial (Coffman / Shoshani): procesos que no pueden terminar y,
+para elegir víctimas, solo los ciclos de espera entre ellos.
+"""
+import random
+import unittest
+from unittest import mock
+
+from simuladores.deteccion import DetectorMatricial, matricial, procesos_en_interbloqueo
+from simuladores.simulador_deteccion import ConfiguracionSimulador, SimuladorDeadlock
+
+from .utilidades import Escenario, componentes_networkx
+
+
+class PruebaDetectorMatricial(unittest.TestCase):
+    def test_frente_a_networkx(self):
+        rng = random.Random(4)
+        for _ in range(150):
+            escenario = Escenario(rng, rng.randint(2, 10), rng.randint(1, 8), [])
+            detector = DetectorMatricial(escenario.procesos, escenario.recursos)
+            escenario.detectores = [detector]
+
+            for _ in range(60):
+                escenario.paso()
+                esperadas = componentes_networkx(escenario.grafo_de_espera(), escenario.procesos)
+                bloqueados = detector.buscar_ciclo()
+                self.assertEqual(sorted(bloqueados or []), escenario.procesos_sin_terminar())
+                self.assertEqual(sorted(sorted(c) for c in detector.componentes_en_interbloqueo()), esperadas)
+                if bloqueados is not None:
+                    self.assertEqual(sorted(sorted(c) for c in detector.componentes_en_interbloqueo(bloqueados)),
+                                     esperadas)
+
+    def test_quien_espera_detras_no_es_victima(self):
+        # P0 <-> P1 en interbloqueo; P2 espera a P1 y P3 a P2: no pueden terminar, pero no están en el ciclo
+        detector = DetectorMatricial(["P0", "P1", "P2", "P3"], ["R0", "R1", "R2", "R3"])
+        for pid, recurso in (("P0", "R0"), ("P1", "R1"), ("P2", "R2"), ("P3", "R3")):
+            detector.asignar(pid, recurso)
+        for pid, recurso, dueno in (("P0", "R1", "P1"), ("P1", "R0", "P0"), ("P2", "R1", "P1"), ("P3", "R2", "P2")):
+            detector.esperar(pid, recurso, dueno)
+        self.assertEqual(sorted(detector.buscar_ciclo()), ["P0", "P1", "P2", "P3"])
+        self.assertEqual([sorted(c) for c in detector.componentes_en_interbloqueo()], [["P0", "P1"]])
+
+    def test_sin_ciclo_devuelve_todos(self):
+        # Pedir más unidades de las que existen: no puede terminar, aunque no haya ciclo
+        detector = DetectorMatricial(["P0"], ["R0"], unidades=[2])
+        detector.asignar("P0", "R0", 1)
+        detector.esperar("P0", "R0", cantidad=5)
+        self.assertEqual(detector.componentes_en_interbloqueo(), [["P0"]])
+
+    def test_varias_unidades_frente_al_recorrido_clasico(self):
+        """procesos_en_interbloqueo (NumPy y su continuación indexada) frente al recorrido clásico."""
+        rng = random.Random(15)
+        for _ in range(300):
+            n, m = rng.randint(1, 40), rng.randint(1, 5)
+            asignacion = [[rng.randint(0, 2) for _ in range(m)] for _ in range(n)]
+            solicitud = [[rng.randint(0, 3) for _ in range(m)] for _ in range(n)]
+            disponibles = [rng.randint(0, 3) for _ in range(m)]
+
+            trabajo = disponibles[:]
+            pendientes = [i for i in range(n) if any(asignacion[i])]
+            cambio = True
+            while cambio:
+                cambio = False
+                for i in list(pendientes):
+                    if all(solicitud[i][j] <= trabajo[j] for j in range(m)):
+                        trabajo = [t + a for t, a in zip(trabajo, asignacion[i])]
+                        pendientes.remove(i)
+                        cambio = True
+            self.assertEqual(sorted(procesos_en_interbloqueo(asignacion, solicitud, disponibles).tolist()),
+                             pendientes)
+
+
+class PruebaSimuladorMatricial(unittest.TestCase):
+    def test_una_reduccion_por_deteccion(self):
+        simulador = SimuladorDeadlock(None, ConfiguracionSimulador("matricial"), semilla=1, archivo_log=None, archivo_metricas=None)
+        with mock.patch.object(matricial, "procesos_en_interbloqueo",
+                               wraps=matricial.procesos_en_interbloqueo) as reduccion:
+            simulador.ejecutar_sin_interfaz()
+        self.assertGreater(simulador.interbloqueos_detectados, 0)
+        self.assertEqual(reduccion.call_count, simulador.ticks_deteccion)
+
+
+if __name__ == "__main__":
+    unittest.main()
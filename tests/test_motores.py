@@ -0,0 +1,125 @@
+"""
+Motores de seguridad del banquero: todas las variantes del modelo conceden,
+rechazan y dejan el estado igual que el recorrido clásico en listas.
+"""
+import random
+import unittest
+
+from simuladores.banquero import ALMACENAMIENTOS, MOTORES_SEGURIDAD, IndiceNecesidadOrdenada, ModeloBanquero
+from simuladores.banquero.generador import GeneradorInstancias
+
+from .utilidades import es_secuencia_segura
+
+
+def estado(modelo):
+    return ([list(f) for f in modelo.asignacion], [list(f) for f in modelo.necesidad],
+            list(modelo.disponibles))
+
+
+def variantes(asignacion, demanda_maxima, disponibles):
+    """Un modelo por cada combinación de motor, almacenamiento y modo transaccional."""
+    return {
+        (motor, almacenamiento, transaccional): ModeloBanquero(
+            asignacion, demanda_maxima, disponibles, motor=motor,
+            transaccional=transaccional, almacenamiento=almacenamiento)
+        for motor in MOTORES_SEGURIDAD
+        for almacenamiento in ALMACENAMIENTOS
+        for transaccional in (False, True)
+    }
+
+
+class PruebaVariantesDelModelo(unittest.TestCase):
+    def test_misma_secuencia_de_operaciones(self):
+        rng = random.Random(11)
+        generador = GeneradorInstancias(semilla=5, num_procesos=6, num_recursos=3, proporcion_seguras=0.7)
+        for asignacion, demanda_maxima, disponibles, _ in generador.generar(40):
+            modelos = variantes(asignacion, demanda_maxima, disponibles)
+            referencia = modelos[("python", "listas", False)]
+
+            for _ in range(30):
+                i = rng.randrange(referencia.num_procesos)
+                if rng.random() < 0.25:
+                    operacion = ("liberar", i, [rng.randint(0, a) for a in referencia.asignacion[i]])
+                else:
+                    operacion = ("solicitar", i, [rng.randint(0, 2) for _ in range(referencia.num_recursos)])
+
+                resultados = {}
+                for clave, modelo in modelos.items():
+                    nombre, id_proceso, cantidades = operacion
+                    if nombre == "liberar":
+                        resultados[clave] = modelo.liberar_recursos(id_proceso, cantidades)
+                    else:
+                        resultados[clave] = modelo.solicitar_recursos(id_proceso, cantidades)
+
+                esperado_exito, esperado = resultados[("python", "listas", False)]
+                for clave, (exito, resultado) in resultados.items():
+                    with self.subTest(variante=clave, operacion=operacion):
+                        self.assertEqual(exito, esperado_exito)
+                        if operacion[0] == "solicitar" and exito:
+                            # Los motores pueden encontrar secuencias distintas; basta que sea válida
+                            self.assertTrue(es_secuencia_segura(*estado(modelos[clave]), resultado))
+                        else:
+                            self.assertEqual(resultado, esperado)
+                        self.assertEqual(estado(modelos[clave]), estado(referencia))
+
+    def test_motores_coinciden_en_seguridad(self):
+        generador = GeneradorInstancias(semilla=9, num_procesos=12, num_recursos=4, proporcion_seguras=0.5)
+        for asignacion, demanda_maxima, disponibles, _ in generador.generar(60):
+            modelos = variantes(asignacion, demanda_maxima, disponibles)
+            seguros = {clave: modelo.es_estado_seguro()[0] for clave, modelo in modelos.items()}
+            self.assertEqual(len(set(seguros.values())), 1, seguros)
+
+
+class PruebaMotorNumpy(unittest.TestCase):
+    def test_instancias_grandes(self):
+        generador = GeneradorInstancias(semilla=13, num_procesos=300, num_recursos=8, proporcion_seguras=0.5)
+        veredictos = set()
+        for asignacion, demanda_maxima, disponibles, segura in generador.generar(10):
+            clasico = ModeloBanquero(asignacion, demanda_maxima, disponibles)
+            numpy = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor="numpy")
+            es_seguro, secuencia = numpy.es_estado_seguro()
+            self.assertEqual(es_seguro, clasico.es_estado_seguro()[0])
+            self.assertEqual(es_seguro, segura)
+            if es_seguro:
+                self.assertTrue(es_secuencia_segura(*estado(numpy), secuencia))
+            else:
+                # Los que alcanzan a terminar son los mismos, aunque en otro orden
+                self.assertEqual(sorted(secuencia), sorted(clasico.es_estado_seguro()[1]))
+            veredictos.add(es_seguro)
+        self.assertEqual(veredictos, {False, True})
+
+
+class PruebaIndiceNecesidadOrdenada(unittest.TestCase):
+    def test_indice_incremental_igual_al_reconstruido(self):
+        rng = random.Random(8)
+        generador = GeneradorInstancias(semilla=4, num_procesos=20, num_recursos=5, proporcion_seguras=1.0)
+        for asignacion, demanda_maxima, disponibles, _ in generador.generar(10):
+            modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor="indexado")
+            for _ in range(50):
+                i = rng.randrange(modelo.num_procesos)
+                if rng.random() < 0.3:
+                    modelo.liberar_recursos(i, [rng.randint(0, a) for a in modelo.asignacion[i]])
+                else:
+                    modelo.solicitar_recursos(i, [rng.randint(0, 1) for _ in range(modelo.num_recursos)])
+            reconstruido = IndiceNecesidadOrdenada(*estado(modelo))
+            self.assertEqual(modelo._motor_seguridad.ordenados, reconstruido.ordenados)
+            self.assertEqual(modelo.es_estado_seguro(), reconstruido.es_estado_seguro())
+
+    def test_orden_seguro_inverso_al_de_indices(self):
+        # Cada proceso solo puede terminar cuando terminó el siguiente: el
+        # recorrido clásico necesita n pasadas, el índice una sola
+        n = 200
+        asignacion = [[1] for _ in range(n)]
+        demanda_maxima = [[n - i + 1] for i in range(n)]
+        modelo = ModeloBanquero(asignacion, demanda_maxima, [1], motor="indexado")
+        es_seguro, secuencia = modelo.es_estado_seguro()
+        self.assertTrue(es_seguro)
+        self.assertEqual(secuencia, list(range(n - 1, -1, -1)))
+
+    def test_sin_tipos_de_recurso(self):
+        modelo = ModeloBanquero([[], []], [[], []], [], motor="indexado")
+        self.assertEqual(modelo.es_estado_seguro(), (True, [0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Planificador de repintados con un `after` y un reloj falsos: muchos pasos por
+frame, como máximo max_fps repintados por segundo y nada pendiente al forzar.
+"""
+import unittest
+
+from simuladores.grafico import PlanificadorRepintado
+
+
+class Bucle:
+    """Reemplazo de root.after: guarda lo programado y lo ejecuta al avanzar el reloj."""
+    def __init__(self):
+        self.ahora = 0.0
+        self.programados = []
+
+    def after(self, retardo_ms, funcion):
+        self.programados.append((self.ahora + retardo_ms / 1000, funcion))
+
+    def avanzar(self, segundos):
+        fin = self.ahora + segundos
+        while True:
+            vencidos = [programado for programado in self.programados if programado[0] <= fin]
+            if not vencidos:
+                break
+            siguiente = min(vencidos, key=lambda programado: programado[0])
+            self.programados.remove(siguiente)
+            self.ahora, funcion = siguiente
+            funcion()
+        self.ahora = fin
+
+
+class PruebaPlanificadorRepintado(unittest.TestCase):
+    def setUp(self):
+        self.bucle = Bucle()
+        self.dibujos = []
+
+    def planificador(self, max_fps):
+        return PlanificadorRepintado(self.bucle.after, lambda: self.dibujos.append(self.bucle.ahora),
+                                     max_fps=max_fps, reloj=lambda: self.bucle.ahora)
+
+    def test_agrupa_pasos_y_limita_la_frecuencia(self):
+        repintado = self.planificador(max_fps=10)
+        # Un paso cada milisegundo durante un segundo
+        for _ in range(1000):
+            repintado.marcar()
+            self.bucle.avanzar(0.001)
+        self.assertLessEqual(repintado.repintados, 11)
+        self.assertGreaterEqual(repintado.repintados, 9)
+        self.assertTrue(all(b - a >= 0.1 - 1e-9 for a, b in zip(self.dibujos, self.dibujos[1:])))
+        self.assertGreater(repintado.pasos_por_frame(), 50)
+
+    def test_sin_cambios_no_repinta(self):
+        repintado = self.planificador(max_fps=10)
+        repintado.marcar()
+        self.bucle.avanzar(1)
+        repintado.forzar()
+        self.bucle.avanzar(1)
+        self.assertEqual(repintado.repintados, 1)
+        self.assertEqual(self.bucle.programados, [])
+
+    def test_forzar_muestra_el_ultimo_estado(self):
+        repintado = self.planificador(max_fps=10)
+        repintado.marcar()
+        self.bucle.avanzar(0.5)
+        repintado.marcar()
+        repintado.forzar()
+        self.assertEqual(repintado.repintados, 2)
+        # El repintado que quedó programado ya no tiene nada que mostrar
+        self.bucle.avanzar(1)
+        self.assertEqual(repintado.repintados, 2)
+
+    def test_max_fps_cero_repinta_en_cada_marca(self):
+        repintado = self.planificador(max_fps=0)
+        for _ in range(5):
+            repintado.marcar()
+        self.assertEqual(repintado.repintados, 5)
+        self.assertEqual(self.bucle.programados, [])
+        with self.assertRaises(ValueError):
+            self.planificador(max_fps=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Políticas de detección: cuándo piden ejecutar el detector, sobre un
+simulador de mentira, y su efecto en el simulador real.
+"""
+import unittest
+
+from simuladores.deteccion.politicas import (
+    POLITICAS_DETECCION,
+    Adaptativa,
+    CadaKSolicitudes,
+    CadaPaso,
+    PoliticaDeteccion,
+    Temporizador,
+    crear_politica,
+)
+from simuladores.simulador_deteccion import ConfiguracionSimulador, ejecutar_escenarios
+
+
+class SimuladorFalso:
+    """Lo que consultan las políticas, con valores fijados por la prueba."""
+    def __init__(self):
+        self.reloj = 100.0
+        self.solicitudes_totales = 0
+        self.bloqueados = 0.0
+        self.espera = 0.0
+
+    def ahora(self):
+        return self.reloj
+
+    def proporcion_bloqueados(self):
+        return self.bloqueados
+
+    def espera_maxima(self):
+        return self.espera
+
+
+class PruebaPoliticas(unittest.TestCase):
+    def setUp(self):
+        self.simulador = SimuladorFalso()
+
+    def test_cada_paso(self):
+        politica = CadaPaso()
+        self.assertTrue(politica.debe_detectar(self.simulador))
+        politica.detecto(self.simulador)
+        self.assertTrue(politica.debe_detectar(self.simulador))
+
+    def test_cada_k_solicitudes(self):
+        politica = CadaKSolicitudes(k=3)
+        for solicitudes, esperado in ((0, False), (2, False), (3, True), (7, True)):
+            self.simulador.solicitudes_totales = solicitudes
+            self.assertEqual(politica.debe_detectar(self.simulador), esperado, solicitudes)
+        politica.detecto(self.simulador)
+        self.assertFalse(politica.debe_detectar(self.simulador))
+        self.simulador.solicitudes_totales = 10
+        self.assertTrue(politica.debe_detectar(self.simulador))
+
+    def test_temporizador(self):
+        politica = Temporizador(intervalo_s=2.0)
+        # La primera consulta pone en marcha el temporizador
+        self.assertFalse(politica.debe_detectar(self.simulador))
+        self.simulador.reloj += 1.5
+        self.assertFalse(politica.debe_detectar(self.simulador))
+        self.simulador.reloj += 0.5
+        self.assertTrue(politica.debe_detectar(self.simulador))
+        politica.detecto(self.simulador)
+        self.assertFalse(politica.debe_detectar(self.simulador))
+
+    def test_adaptativa(self):
+        politica = Adaptativa(umbral_bloqueados=0.5, umbral_espera_s=3.0)
+        self.simulador.bloqueados = 0.9
+        # Sin solicitudes nuevas desde la última detección no se repite
+        self.assertFalse(politica.debe_detectar(self.simulador))
+
+        self.simulador.solicitudes_totales = 1
+        for bloqueados, espera, esperado in ((0.2, 1.0, False), (0.5, 0.0, True), (0.0, 3.0, True)):
+            self.simulador.bloqueados, self.simulador.espera = bloqueados, espera
+            self.assertEqual(politica.debe_detectar(self.simulador), esperado, (bloqueados, espera))
+        politica.detecto(self.simulador)
+        self.assertFalse(politica.debe_detectar(self.simulador))
+
+    def test_crear_politica(self):
+        self.assertEqual(set(POLITICAS_DETECCION), {"cada_paso", "cada_k", "temporizador", "adaptativa"})
+        # Las opciones que la política no acepta, o en None, se ignoran
+        politica = crear_politica("cada_k", k=4, intervalo_s=9.0, umbral_bloqueados=None)
+        self.assertEqual(politica.describir(), "cada_k(k=4)")
+        self.assertEqual(crear_politica("temporizador", k=4).intervalo_s, 5.0)
+        with self.assertRaises(ValueError):
+            crear_politica("nunca")
+        with self.assertRaises(ValueError):
+            crear_politica("cada_k", k=0)
+        with self.assertRaises(ValueError):
+            crear_politica("temporizador", intervalo_s=0)
+
+    def test_subclase_incompleta(self):
+        class SinDecision(PoliticaDeteccion):
+            nombre = "sin_decision"
+
+        with self.assertRaises(TypeError):
+            SinDecision()
+        with self.assertRaises(TypeError):
+            PoliticaDeteccion()
+
+
+class PruebaPoliticasEnSimulador(unittest.TestCase):
+    def ejecutar(self, politica, **opciones):
+        configuracion = ConfiguracionSimulador("incremental", politica_deteccion=politica,
+                                               opciones_politica=opciones)
+        return ejecutar_escenarios(20, configuracion, semilla=2, carpeta=None)
+
+    def test_menos_detecciones_que_cada_paso(self):
+        cada_paso = self.ejecutar("cada_paso")
+        for politica, opciones in (("cada_k", {"k": 4}), ("temporizador", {"intervalo_s": 3.0}),
+                                   ("adaptativa", {})):
+            with self.subTest(politica=politica):
+                resultados = self.ejecutar(politica, **opciones)
+                self.assertLess(sum(r["Pasos de Detección"] for r in resultados),
+                                sum(r["Pasos de Detección"] for r in cada_paso))
+                # Aun detectando menos, todos los escenarios terminan
+                self.assertTrue(all(r["Procesos Terminados Exitosamente"] == 10 for r in resultados))
+
+    def test_cada_paso_no_tiene_latencia(self):
+        self.assertTrue(all(r["Latencia de Detección Máxima (s)"] == 0 for r in self.ejecutar("cada_paso")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Dibujo retenido del grafo (backend Agg): los artistas se reutilizan entre
+frames, solo se redibuja todo si cambian los nodos o el título, y el
+resultado es el mismo que dibujar desde cero.
+"""
+import unittest
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from simuladores.grafico import RenderizadorGrafo
+
+POS = {"P0": (0, 0), "P1": (0, -1), "R0": (1, 0), "R1": (1, -1)}
+LISTOS = dict.fromkeys(POS, "#95a5a6")
+BLOQUEADOS = {**LISTOS, "P1": "#e74c3c"}
+ARISTAS = {("R0", "P0"): ("black", "solid"), ("P1", "R0"): ("red", "dashed")}
+
+
+def renderizador():
+    figura = Figure(figsize=(4, 3), dpi=50)
+    FigureCanvasAgg(figura)
+    return RenderizadorGrafo(figura.add_subplot())
+
+
+def imagen(renderizador):
+    return np.asarray(renderizador.canvas.buffer_rgba()).copy()
+
+
+class PruebaRenderizadorGrafo(unittest.TestCase):
+    def test_reutiliza_artistas(self):
+        r = renderizador()
+        r.dibujar(POS, LISTOS, {}, "Inicio")
+        self.assertEqual((r.frames_completos, r.frames_parciales), (1, 0))
+        nodos, lineas = r.nodos, r.lineas
+
+        # Mismos nodos (aunque sea otro diccionario): solo cambian colores y aristas
+        r.dibujar(dict(POS), BLOQUEADOS, ARISTAS, "Inicio")
+        self.assertEqual((r.frames_completos, r.frames_parciales), (1, 1))
+        self.assertIs(r.nodos, nodos)
+        self.assertIs(r.lineas, lineas)
+        self.assertEqual(len(r.lineas.get_segments()), len(ARISTAS))
+        self.assertEqual(len(r.puntas.get_paths()), len(ARISTAS))
+        np.testing.assert_allclose(r.nodos.get_facecolor()[1][:3], (0xe7 / 255, 0x4c / 255, 0x3c / 255))
+
+    def test_nodos_o_titulo_nuevos_redibujan_todo(self):
+        r = renderizador()
+        r.dibujar(POS, LISTOS, {}, "Inicio")
+        r.dibujar(POS, LISTOS, {}, "Terminados: 1")
+        self.assertEqual(r.frames_completos, 2)
+
+        nodos = r.nodos
+        pos = {**POS, "P2": (0, -2)}
+        r.dibujar(pos, {**LISTOS, "P2": "white"}, {})
+        self.assertEqual(r.frames_completos, 3)
+        self.assertIsNot(r.nodos, nodos)
+        self.assertEqual(len(r.nodos.get_offsets()), len(pos))
+        # Los artistas viejos ya no están en los ejes
+        self.assertNotIn(nodos, r.ax.collections)
+
+    def test_blitting_igual_a_dibujo_desde_cero(self):
+        incremental = renderizador()
+        incremental.dibujar(POS, LISTOS, {}, "Inicio")
+        antes = imagen(incremental)
+        incremental.dibujar(POS, BLOQUEADOS, ARISTAS, "Inicio")
+        self.assertEqual(incremental.frames_parciales, 1)
+        self.assertFalse(np.array_equal(imagen(incremental), antes))
+
+        desde_cero = renderizador()
+        desde_cero.dibujar(POS, BLOQUEADOS, ARISTAS, "Inicio")
+        np.testing.assert_array_equal(imagen(incremental), imagen(desde_cero))
+
+
+if __name__ == "__main__":
+    unittest.main()
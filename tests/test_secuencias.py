@@ -0,0 +1,60 @@
+"""
+Enumerador de secuencias seguras frente a probar todas las permutaciones, y
+estados con miles de procesos (la DFS no puede depender de la recursión).
+"""
+import itertools
+import unittest
+
+from simuladores.banquero import EnumeradorSecuencias, ModeloBanquero
+from simuladores.banquero.generador import GeneradorInstancias
+
+from .utilidades import es_secuencia_segura
+
+
+def cadena(num_procesos):
+    """
+    Una sola secuencia segura P0, P1, ...: el proceso k retiene una unidad y
+    necesita k + 1, justo lo que hay libre cuando terminaron los anteriores.
+    """
+    asignacion = [[1] for _ in range(num_procesos)]
+    demanda_maxima = [[k + 2] for k in range(num_procesos)]
+    return ModeloBanquero(asignacion, demanda_maxima, [1])
+
+
+class PruebaEnumeradorSecuencias(unittest.TestCase):
+    """El enumerador con máscaras de bits frente a probar todas las permutaciones."""
+
+    def test_frente_a_fuerza_bruta(self):
+        generador = GeneradorInstancias(semilla=21, num_procesos=6, num_recursos=2, proporcion_seguras=0.7,
+                                        max_asignacion=2, max_disponibles=3)
+        for asignacion, demanda_maxima, disponibles, _ in generador.generar(40):
+            modelo = ModeloBanquero(asignacion, demanda_maxima, disponibles)
+            esperadas = [
+                list(p) for p in itertools.permutations(range(modelo.num_procesos))
+                if es_secuencia_segura(modelo.asignacion, modelo.necesidad, modelo.disponibles, p)
+            ]
+            enumerador = EnumeradorSecuencias(modelo)
+            self.assertEqual(enumerador.contar(), len(esperadas))
+            self.assertEqual(list(enumerador.secuencias()), esperadas)
+            self.assertEqual(list(enumerador.secuencias(limite=3)), esperadas[:3])
+            for muestra in enumerador.muestrear(5, semilla=1):
+                self.assertIn(muestra, esperadas)
+
+    def test_cadena_larga_sin_recursion(self):
+        num_procesos = 1500
+        enumerador = EnumeradorSecuencias(cadena(num_procesos))
+        self.assertEqual(enumerador.contar(), 1)
+        self.assertEqual(list(enumerador.secuencias()), [list(range(num_procesos))])
+        self.assertEqual(enumerador.muestrear(1, semilla=0), [list(range(num_procesos))])
+
+    def test_cadena_larga_insegura(self):
+        modelo = cadena(1500)
+        modelo.disponibles[0] = 0
+        modelo.necesidad[0][0] = 2
+        enumerador = EnumeradorSecuencias(modelo)
+        self.assertEqual(enumerador.contar(), 0)
+        self.assertEqual(list(enumerador.secuencias()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
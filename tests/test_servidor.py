@@ -0,0 +1,151 @@
+"""
+Servidor de admisión: validación de las peticiones (`atender` resuelve una
+petición ya decodificada) y atención de varias conexiones con pipelining
+sobre un socket local.
+"""
+import asyncio
+import unittest
+
+from simuladores.banquero import ModeloBanquero
+from simuladores.banquero.cliente import ConexionCliente
+from simuladores.banquero.servidor import ServidorAdmision
+
+from .test_motores import estado
+
+
+class PruebaValidacionServidor(unittest.TestCase):
+    def setUp(self):
+        modelo = ModeloBanquero([[0, 1, 0], [2, 0, 0], [3, 0, 2]],
+                                [[7, 3, 3], [3, 2, 2], [5, 0, 2]],
+                                [3, 3, 2])
+        self.servidor = ServidorAdmision(modelo)
+        self.estado_inicial = self.servidor.estado()
+
+    def atender(self, **peticion):
+        return self.servidor.atender({"id": 1, **peticion})
+
+    def assertError(self, respuesta):
+        self.assertIn("error", respuesta)
+        self.assertEqual(self.servidor.estado(), self.estado_inicial)
+
+    def test_solicitud_valida(self):
+        respuesta = self.atender(op="solicitar", proceso="P1", solicitud=[1, 0, 2])
+        self.assertTrue(respuesta["concedida"])
+        self.assertEqual(self.servidor.estado()["disponibles"], [2, 3, 0])
+
+    def test_solicitud_rechazada_no_es_error(self):
+        respuesta = self.atender(op="solicitar", proceso="P0", solicitud=[3, 3, 0])
+        self.assertFalse(respuesta["concedida"])
+        self.assertNotIn("error", respuesta)
+
+    def test_cantidades_invalidas(self):
+        for cantidades in ([-5, 0, 0], [0.9, 0, 0], [1.0, 0, 0], [True, 0, 0], ["1", 0, 0], "1,0,0"):
+            for op, campo in (("solicitar", "solicitud"), ("liberar", "liberacion")):
+                with self.subTest(op=op, cantidades=cantidades):
+                    self.assertError(self.atender(op=op, proceso="P2", **{campo: cantidades}))
+        # Sin liberación se libera todo; sin solicitud es un error
+        self.assertError(self.atender(op="solicitar", proceso="P2", solicitud=None))
+
+    def test_procesos_invalidos(self):
+        for proceso in (True, False, -1, 3, "P9", None, 1.0):
+            with self.subTest(proceso=proceso):
+                self.assertError(self.atender(op="solicitar", proceso=proceso, solicitud=[0, 0, 0]))
+                self.assertError(self.atender(op="liberar", proceso=proceso))
+
+    def test_proceso_por_indice(self):
+        self.assertTrue(self.atender(op="liberar", proceso=1, liberacion=[1, 0, 0])["liberada"])
+        self.assertEqual(self.servidor.estado()["disponibles"], [4, 3, 2])
+
+    def test_longitud_incorrecta(self):
+        respuesta = self.atender(op="solicitar", proceso="P1", solicitud=[1, 0])
+        self.assertFalse(respuesta["concedida"])
+        self.assertEqual(self.servidor.estado(), self.estado_inicial)
+
+    def test_liberar_mas_de_lo_asignado(self):
+        respuesta = self.atender(op="liberar", proceso="P0", liberacion=[0, 2, 0])
+        self.assertFalse(respuesta["liberada"])
+        self.assertEqual(self.servidor.estado(), self.estado_inicial)
+
+    def test_operacion_desconocida(self):
+        self.assertError(self.atender(op="borrar"))
+        self.assertEqual(self.servidor.metricas()["errores"], 1)
+
+
+class PruebaValidacionDelModelo(unittest.TestCase):
+    def setUp(self):
+        self.modelo = ModeloBanquero([[0, 1], [1, 0]], [[2, 2], [2, 1]], [3, 3])
+
+    def test_rechaza_cantidades_negativas(self):
+        antes = estado(self.modelo)
+        exito, mensaje = self.modelo.solicitar_recursos(0, [-5, 0])
+        self.assertFalse(exito)
+        self.assertIn("negativas", mensaje)
+        self.assertFalse(self.modelo.liberar_recursos(0, [0, -1])[0])
+        self.assertEqual(estado(self.modelo), antes)
+
+    def test_rechaza_procesos_invalidos(self):
+        for id_proceso in (-1, 2, True, 0.0, "0"):
+            with self.subTest(id_proceso=id_proceso):
+                self.assertFalse(self.modelo.solicitar_recursos(id_proceso, [0, 0])[0])
+                self.assertFalse(self.modelo.liberar_recursos(id_proceso, [0, 0])[0])
+
+
+class PruebaServidorEnRed(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        modelo = ModeloBanquero([[0, 1, 0], [2, 0, 0], [3, 0, 2]],
+                                [[7, 3, 3], [3, 2, 2], [5, 0, 2]],
+                                [3, 3, 2])
+        self.servidor = ServidorAdmision(modelo, tam_lote=8)
+        self.servidor.iniciar()
+        self.srv = await asyncio.start_server(self.servidor.atender_conexion, "127.0.0.1", 0)
+        self.puerto = self.srv.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.srv.close()
+        await self.srv.wait_closed()
+        await self.servidor.detener()
+
+    def totales(self):
+        actual = self.servidor.estado()
+        return [sum(columna) for columna in zip(*actual["asignacion"], actual["disponibles"])]
+
+    async def test_conexiones_concurrentes(self):
+        totales = self.totales()
+        conexiones = [await ConexionCliente.abrir("127.0.0.1", self.puerto) for _ in range(3)]
+        try:
+            peticiones = [
+                {"op": "solicitar", "proceso": f"P{k % 3}", "solicitud": [k % 2, (k + 1) % 2, 0]}
+                if k % 4 else {"op": "liberar", "proceso": k % 3}
+                for k in range(60)
+            ]
+            respuestas = await asyncio.gather(*(
+                conexiones[k % 3].pedir(peticion) for k, peticion in enumerate(peticiones)
+            ))
+        finally:
+            for conexion in conexiones:
+                await conexion.cerrar()
+
+        for peticion, respuesta in zip(peticiones, respuestas):
+            self.assertNotIn("error", respuesta)
+            self.assertIn("concedida" if peticion["op"] == "solicitar" else "liberada", respuesta)
+        metricas = self.servidor.metricas()
+        self.assertEqual(metricas["solicitudes"], 45)
+        self.assertEqual(metricas["concedidas"] + metricas["rechazadas"], 45)
+        # Los recursos no se crean ni se pierden y el estado sigue siendo seguro
+        self.assertEqual(self.totales(), totales)
+        self.assertTrue(self.servidor.modelo.es_estado_seguro()[0])
+
+    async def test_json_invalido(self):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", self.puerto)
+        escritor.write(b'no es json\n[1, 2]\n{"id": 7, "op": "estado"}\n')
+        await escritor.drain()
+        respuestas = [await lector.readline() for _ in range(3)]
+        escritor.close()
+        await escritor.wait_closed()
+        self.assertEqual(respuestas[:2], [b'{"error": "JSON invalido"}\n'] * 2)
+        self.assertIn(b'"id": 7', respuestas[2])
+        self.assertEqual(self.servidor.errores, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
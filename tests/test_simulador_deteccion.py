@@ -0,0 +1,62 @@
+"""
+Simulador de detección sin interfaz: avanza sobre el reloj simulado, escribe
+el log y las métricas y no necesita tkinter ni pyplot.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from simuladores.simulador_deteccion import LOG_FILENAME, METRICS_FILENAME, ejecutar_escenarios
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PruebaSinInterfaz(unittest.TestCase):
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.addCleanup(self.carpeta.cleanup)
+
+    def leer(self, nombre):
+        with open(os.path.join(self.carpeta.name, nombre), encoding="utf-8") as f:
+            return f.read()
+
+    def test_escribe_log_y_metricas(self):
+        [metricas] = ejecutar_escenarios(1, semilla=1, carpeta=self.carpeta.name)
+        log = self.leer(os.path.basename(LOG_FILENAME))
+        self.assertIn("INTERBLOQUEO DETECTADO", log)
+        self.assertIn("RESOLVIENDO", log)
+        contenido = self.leer(os.path.basename(METRICS_FILENAME))
+        self.assertIn(f"Total de Solicitudes: {metricas['Total de Solicitudes']}", contenido)
+        self.assertGreater(metricas["Procesos Terminados Exitosamente"], 0)
+
+    def test_un_par_de_archivos_por_escenario(self):
+        resultados = ejecutar_escenarios(3, semilla=1, carpeta=self.carpeta.name)
+        self.assertEqual(len(resultados), 3)
+        self.assertEqual(sorted(os.listdir(self.carpeta.name)), [
+            f"simulacion_deadlock_{tipo}_{k:04d}.txt" for tipo in ("log", "metrics") for k in range(3)
+        ])
+
+    def test_sin_carpeta_no_escribe_nada(self):
+        ejecutar_escenarios(1, semilla=1, carpeta=None)
+        self.assertEqual(os.listdir(self.carpeta.name), [])
+
+    def test_reproducible_con_semilla(self):
+        claves = ("Total de Solicitudes", "Procesos Víctimas (reiniciados)", "Rondas de Recuperación",
+                  "Pasos de Detección")
+        a, b = (ejecutar_escenarios(2, semilla=5, carpeta=None) for _ in range(2))
+        self.assertEqual([[m[c] for c in claves] for m in a], [[m[c] for c in claves] for m in b])
+
+    def test_no_importa_la_interfaz(self):
+        # Con tkinter y pyplot bloqueados, cualquier import de la interfaz fallaría
+        codigo = ("import sys; sys.modules['tkinter'] = sys.modules['matplotlib.pyplot'] = None; "
+                  "from simuladores.simulador_deteccion import main; "
+                  "main(['--sin-interfaz', '--sin-archivos', '--semilla', '1', '--escenarios', '2'])")
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True)
+        self.assertEqual(salida.returncode, 0, salida.stderr)
+        self.assertIn("Escenarios: 2", salida.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Modo transaccional del banquero: la asignación tentativa se aplica en el
+lugar y se deshace con el registro, sin copiar las matrices.
+"""
+import unittest
+from unittest import mock
+
+from simuladores.banquero import ALMACENAMIENTOS, MOTORES_SEGURIDAD, ModeloBanquero
+
+from .test_motores import estado
+
+# Estado seguro del ejemplo clásico (secuencia P1, P3, P4, P0, P2)
+ASIGNACION = [[0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]]
+DEMANDA_MAXIMA = [[7, 5, 3], [3, 2, 2], [9, 0, 2], [2, 2, 2], [4, 3, 3]]
+DISPONIBLES = [3, 3, 2]
+
+
+class PruebaTransaccional(unittest.TestCase):
+    def modelos(self):
+        for motor in MOTORES_SEGURIDAD:
+            for almacenamiento in ALMACENAMIENTOS:
+                yield ModeloBanquero(ASIGNACION, DEMANDA_MAXIMA, DISPONIBLES, motor=motor,
+                                     transaccional=True, almacenamiento=almacenamiento)
+
+    def test_no_copia_el_estado(self):
+        for modelo in self.modelos():
+            with self.subTest(motor=modelo.motor, almacenamiento=modelo.almacenamiento), \
+                    mock.patch.object(modelo, "instantanea", side_effect=AssertionError("copia")):
+                self.assertTrue(modelo.solicitar_recursos(1, [1, 0, 2])[0])
+                self.assertFalse(modelo.solicitar_recursos(0, [0, 2, 0])[0])
+
+    def test_rechazo_deja_el_estado_intacto(self):
+        for modelo in self.modelos():
+            with self.subTest(motor=modelo.motor, almacenamiento=modelo.almacenamiento):
+                self.assertTrue(modelo.solicitar_recursos(1, [1, 0, 2])[0])
+                antes = estado(modelo)
+                # Cabe en lo disponible, pero deja el estado inseguro
+                exito, _ = modelo.solicitar_recursos(0, [0, 2, 0])
+                self.assertFalse(exito)
+                self.assertEqual(estado(modelo), antes)
+                self.assertEqual(modelo._registro_deshacer, [])
+                # El motor quedó sincronizado con la fila restaurada
+                asignacion, necesidad, disponibles = antes
+                demanda_maxima = [[a + n for a, n in zip(fa, fn)] for fa, fn in zip(asignacion, necesidad)]
+                nuevo = ModeloBanquero(asignacion, demanda_maxima, disponibles, motor=modelo.motor)
+                self.assertEqual(modelo.es_estado_seguro(), nuevo.es_estado_seguro())
+
+    def test_concesion_vacia_el_registro(self):
+        for modelo in self.modelos():
+            with self.subTest(motor=modelo.motor, almacenamiento=modelo.almacenamiento):
+                self.assertTrue(modelo.solicitar_recursos(1, [1, 0, 2])[0])
+                self.assertEqual(modelo._registro_deshacer, [])
+                self.assertEqual(modelo.disponibles, [2, 3, 0])
+                self.assertEqual(list(modelo.asignacion[1]), [3, 0, 2])
+                self.assertEqual(list(modelo.necesidad[1]), [0, 2, 0])
+
+    def test_deshace_en_orden_inverso(self):
+        modelo = ModeloBanquero(ASIGNACION, DEMANDA_MAXIMA, DISPONIBLES, transaccional=True)
+        antes = estado(modelo)
+        for id_proceso, solicitud in ((1, [1, 0, 0]), (3, [0, 1, 1]), (1, [0, 1, 0])):
+            modelo._aplicar_tentativa(id_proceso, solicitud)
+        self.assertNotEqual(estado(modelo), antes)
+        modelo._deshacer()
+        self.assertEqual(estado(modelo), antes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Selección de víctimas: costo mínimo frente a fuerza bruta sobre grafos
+pequeños al azar, desempates y uso desde el simulador.
+"""
+import itertools
+import random
+import unittest
+
+from simuladores.deteccion import victimas_de_costo_minimo, victimas_por_componente
+from simuladores.deteccion.victimas import costo_total
+from simuladores.simulador_deteccion import COSTOS_VICTIMA, ConfiguracionSimulador, SimuladorDeadlock
+
+from .utilidades import tiene_ciclo
+
+
+class PruebaVictimas(unittest.TestCase):
+    def optimo(self, sucesores, nodos, costos):
+        """Costo mínimo probando todos los subconjuntos de víctimas."""
+        return min(
+            costo_total(victimas, costos)
+            for tamano in range(len(nodos) + 1)
+            for victimas in itertools.combinations(nodos, tamano)
+            if not tiene_ciclo(sucesores, set(nodos) - set(victimas))
+        )
+
+    def test_costo_minimo_frente_a_fuerza_bruta(self):
+        rng = random.Random(23)
+        for _ in range(120):
+            nodos = list(range(rng.randint(1, 8)))
+            sucesores = {p: rng.sample([q for q in nodos if q != p], min(rng.randint(0, 3), len(nodos) - 1))
+                         for p in nodos}
+            costos = {p: rng.randint(0, 5) for p in nodos}
+            optimo = self.optimo(sucesores, nodos, costos)
+
+            exactas = victimas_de_costo_minimo(sucesores, nodos, costos)
+            self.assertFalse(tiene_ciclo(sucesores, set(nodos) - set(exactas)))
+            self.assertEqual(costo_total(exactas, costos), optimo)
+
+            voraces = victimas_de_costo_minimo(sucesores, nodos, costos, limite_exacto=0)
+            self.assertFalse(tiene_ciclo(sucesores, set(nodos) - set(voraces)))
+            self.assertGreaterEqual(costo_total(voraces, costos), optimo)
+
+            clasicas = victimas_por_componente(sucesores, nodos, costos.__getitem__)
+            self.assertFalse(tiene_ciclo(sucesores, set(nodos) - set(clasicas)))
+            self.assertGreaterEqual(costo_total(clasicas, costos), optimo)
+
+    def test_proceso_compartido_rompe_varios_ciclos(self):
+        # Dos ciclos que comparten P0: basta una víctima, aunque no sea la más barata de cada ciclo
+        sucesores = {0: [1, 3], 1: [2], 2: [0], 3: [4], 4: [0]}
+        costos = {0: 3, 1: 2, 2: 2, 3: 2, 4: 2}
+        self.assertEqual(victimas_de_costo_minimo(sucesores, list(sucesores), costos), [0])
+        # Una por componente, ronda tras ronda: la más barata de cada ciclo, costo 4
+        clasicas = victimas_por_componente(sucesores, list(sucesores), costos.__getitem__)
+        self.assertEqual(costo_total(clasicas, costos), 4)
+
+    def test_desempate_entre_costos_iguales(self):
+        sucesores = {0: [1], 1: [2], 2: [0]}
+        costos = dict.fromkeys(sucesores, 1)
+        self.assertEqual(victimas_de_costo_minimo(sucesores, [0, 1, 2], costos), [0])
+        self.assertEqual(victimas_de_costo_minimo(sucesores, [0, 1, 2], costos, desempate=lambda p: -p), [2])
+        # Sin desempate, gana el que aparece antes en `procesos`
+        self.assertEqual(victimas_de_costo_minimo(sucesores, [1, 2, 0], costos), [1])
+
+
+class PruebaSimuladorConCosto(unittest.TestCase):
+    def test_ejecucion_completa_con_cada_costo(self):
+        for costo in COSTOS_VICTIMA:
+            with self.subTest(costo=costo):
+                simulador = SimuladorDeadlock(None, ConfiguracionSimulador("incremental", costo), semilla=3,
+                                              archivo_log=None, archivo_metricas=None)
+                simulador.ejecutar_sin_interfaz()
+                self.assertEqual(len(simulador.procesos_terminados_exitosamente), simulador.num_procesos)
+                self.assertGreaterEqual(simulador.rondas_recuperacion, 0)
+
+    def test_costo_desconocido(self):
+        with self.assertRaises(ValueError):
+            SimuladorDeadlock(None, ConfiguracionSimulador(costo_victima="edad"),
+                              archivo_log=None, archivo_metricas=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
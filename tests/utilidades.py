@@ -0,0 +1,96 @@
+"""Comprobaciones de referencia compartidas por las pruebas."""
+import networkx as nx
+
+
+def es_secuencia_segura(asignacion, necesidad, disponibles, secuencia):
+    """Comprueba paso a paso que todos los procesos de `secuencia` pueden terminar en ese orden."""
+    if sorted(secuencia) != list(range(len(asignacion))):
+        return False
+    trabajo = list(disponibles)
+    for i in secuencia:
+        if any(n > t for n, t in zip(necesidad[i], trabajo)):
+            return False
+        trabajo = [t + a for t, a in zip(trabajo, asignacion[i])]
+    return True
+
+
+def componentes_networkx(sucesores, nodos):
+    grafo = nx.DiGraph()
+    grafo.add_nodes_from(nodos)
+    grafo.add_edges_from((p, q) for p, destinos in sucesores.items() for q in destinos)
+    return sorted(sorted(c) for c in nx.strongly_connected_components(grafo) if len(c) > 1)
+
+
+def tiene_ciclo(sucesores, nodos):
+    grafo = nx.DiGraph()
+    grafo.add_nodes_from(nodos)
+    grafo.add_edges_from((p, q) for p in nodos for q in sucesores.get(p, ()) if q in nodos)
+    return not nx.is_directed_acyclic_graph(grafo)
+
+
+class Escenario:
+    """
+    Recursos de una unidad y eventos al azar, como los produce el simulador:
+    pedir (asignar o esperar), liberar (y despertar al primero que espera)
+    y cancelar una espera. Cada evento se aplica a todos los detectores.
+    """
+    def __init__(self, rng, num_procesos, num_recursos, detectores):
+        self.rng = rng
+        self.procesos = [f"P{i}" for i in range(num_procesos)]
+        self.recursos = [f"R{j}" for j in range(num_recursos)]
+        self.dueno = {}
+        self.espera = {}
+        self.detectores = detectores
+
+    def paso(self):
+        rng = self.rng
+        evento = rng.random()
+        libres = [p for p in self.procesos if p not in self.espera]
+        if evento < 0.6 and libres:
+            pid, recurso = rng.choice(libres), rng.choice(self.recursos)
+            dueno = self.dueno.get(recurso)
+            if dueno is None:
+                self.dueno[recurso] = pid
+                for detector in self.detectores:
+                    detector.asignar(pid, recurso)
+            elif dueno != pid:
+                self.espera[pid] = recurso
+                for detector in self.detectores:
+                    detector.esperar(pid, recurso, dueno)
+        elif evento < 0.9 and self.dueno:
+            recurso = rng.choice(sorted(self.dueno))
+            pid = self.dueno.pop(recurso)
+            for detector in self.detectores:
+                detector.liberar(pid, recurso)
+            esperan = sorted(p for p, r in self.espera.items() if r == recurso)
+            if esperan:
+                siguiente = rng.choice(esperan)
+                del self.espera[siguiente]
+                self.dueno[recurso] = siguiente
+                for detector in self.detectores:
+                    detector.asignar(siguiente, recurso)
+        elif self.espera:
+            pid = rng.choice(sorted(self.espera))
+            del self.espera[pid]
+            for detector in self.detectores:
+                detector.cancelar_espera(pid)
+
+    def grafo_de_espera(self):
+        return {p: [self.dueno[r]] for p, r in self.espera.items()}
+
+    def procesos_sin_terminar(self):
+        """
+        Fuerza bruta: de los que retienen algo, se da por terminado a quien no
+        espera o espera a un dueño ya terminado, hasta que nadie más pueda.
+        """
+        pendientes = set(self.dueno.values())
+        dueno = self.dueno
+        cambio = True
+        while cambio:
+            cambio = False
+            for p in sorted(pendientes):
+                recurso = self.espera.get(p)
+                if recurso is None or dueno.get(recurso) not in pendientes:
+                    pendientes.discard(p)
+                    cambio = True
+        return sorted(pendientes)